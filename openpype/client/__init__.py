@@ -27,6 +27,9 @@ from .entities import (
     get_last_versions,
     get_last_version_by_subset_id,
     get_last_version_by_subset_name,
+    clear_last_versions_cache,
+    entities_cache,
+    clear_entities_cache,
     get_output_link_versions,
 
     version_is_latest,
@@ -83,6 +86,9 @@ __all__ = (
     "get_last_versions",
     "get_last_version_by_subset_id",
     "get_last_version_by_subset_name",
+    "clear_last_versions_cache",
+    "entities_cache",
+    "clear_entities_cache",
     "get_output_link_versions",
 
     "version_is_latest",
@@ -2,5 +2,9 @@ from openpype import AYON_SERVER_ENABLED
 
 if not AYON_SERVER_ENABLED:
     from .mongo.entities import *
+    from .mongo.entities_cache import (
+        entities_cache,
+        clear_entities_cache,
+    )
 else:
     from .server.entities import *
@@ -7,15 +7,29 @@ that has project name as a context (e.g. on 'ProjectEntity'?).
 """
 
 import re
+import time
 import collections
 
 import six
 from bson.objectid import ObjectId
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import PyMongoError
 
 from .mongo import get_project_database, get_project_connection
+from .entities_cache import get_active_entities_cache
 
 PatternType = type(re.compile(""))
 
+# Index used to find last version of subsets
+LAST_VERSIONS_INDEX_NAME = "type_parent_name_desc"
+# How long (in seconds) are cached last version ids valid
+LAST_VERSIONS_CACHE_TIMEOUT = 10
+
+_LAST_VERSIONS_INDEXED_PROJECTS = set()
+# Last versions by subset id by project name stored as
+#   (cache time, version id, version name)
+_LAST_VERSIONS_CACHE = collections.defaultdict(dict)
+
 
 def _prepare_fields(fields, required_fields=None):
     if not fields:
@@ -68,6 +82,15 @@ def convert_ids(in_ids):
     return list(_output)
 
 
+def _find_one(project_name, query_filter, fields):
+    cache = get_active_entities_cache()
+    if cache is not None:
+        return cache.find_one(project_name, query_filter, fields)
+
+    conn = get_project_connection(project_name)
+    return conn.find_one(query_filter, _prepare_fields(fields))
+
+
 def get_projects(active=True, inactive=False, fields=None):
     """Yield all project entity documents.
 
@@ -131,8 +154,7 @@ def get_project(project_name, active=True, inactive=True, fields=None):
             {"data.active": False},
         ]
 
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(project_name, query_filter, fields)
 
 
 def get_whole_project(project_name):
@@ -169,6 +191,10 @@ def get_asset_by_id(project_name, asset_id, fields=None):
     if not asset_id:
         return None
 
+    cache = get_active_entities_cache()
+    if cache is not None:
+        return cache.get_by_id(project_name, asset_id, ["asset"], fields)
+
     query_filter = {"type": "asset", "_id": asset_id}
     conn = get_project_connection(project_name)
     return conn.find_one(query_filter, _prepare_fields(fields))
@@ -193,8 +219,7 @@ def get_asset_by_name(project_name, asset_name, fields=None):
         return None
 
     query_filter = {"type": "asset", "name": asset_name}
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filter, _prepare_fields(fields))
+    return _find_one(project_name, query_filter, fields)
 
 
 # NOTE this could be just public function?
@@ -403,6 +428,10 @@ def get_subset_by_id(project_name, subset_id, fields=None):
     if not subset_id:
         return None
 
+    cache = get_active_entities_cache()
+    if cache is not None:
+        return cache.get_by_id(project_name, subset_id, ["subset"], fields)
+
     query_filters = {"type": "subset", "_id": subset_id}
     conn = get_project_connection(project_name)
     return conn.find_one(query_filters, _prepare_fields(fields))
@@ -435,8 +464,7 @@ def get_subset_by_name(project_name, subset_name, asset_id, fields=None):
         "name": subset_name,
         "parent": asset_id
     }
-    conn = get_project_connection(project_name)
-    return conn.find_one(query_filters, _prepare_fields(fields))
+    return _find_one(project_name, query_filters, fields)
 
 
 def get_subsets(
@@ -567,6 +595,12 @@ def get_version_by_id(project_name, version_id, fields=None):
     if not version_id:
         return None
 
+    cache = get_active_entities_cache()
+    if cache is not None:
+        return cache.get_by_id(
+            project_name, version_id, ["version", "hero_version"], fields
+        )
+
     query_filter = {
         "type": {"$in": ["version", "hero_version"]},
         "_id": version_id
@@ -855,54 +889,84 @@ def get_output_link_versions(project_name, version_id, fields=None):
     return conn.find(query_filter, _prepare_fields(fields))
 
 
-def get_last_versions(project_name, subset_ids, active=None, fields=None):
-    """Latest versions for entered subset_ids.
+def _ensure_last_versions_index(project_name, conn):
+    """Make sure project collection has index used for last versions.
 
-    Args:
-        project_name (str): Name of project where to look for queried entities.
-        subset_ids (Iterable[Union[str, ObjectId]]): List of subset ids.
-        active (Optional[bool]): If True only active versions are returned.
-        fields (Optional[Iterable[str]]): Fields that should be returned. All
-            fields are returned if 'None' is passed.
+    Index is created only once per project in process. Failed creation
+    (e.g. missing permissions) is not retried, queries work without the
+    index but are slower.
+    """
 
-    Returns:
-        dict[ObjectId, int]: Key is subset id and value is last version name.
+    if project_name in _LAST_VERSIONS_INDEXED_PROJECTS:
+        return
+    _LAST_VERSIONS_INDEXED_PROJECTS.add(project_name)
+    try:
+        conn.create_index(
+            [
+                ("type", ASCENDING),
+                ("parent", ASCENDING),
+                ("name", DESCENDING),
+            ],
+            name=LAST_VERSIONS_INDEX_NAME,
+            background=True
+        )
+    except PyMongoError:
+        pass
+
+
+def clear_last_versions_cache(project_name=None):
+    """Clear cached last versions.
+
+    Cache is cleared automatically when versions are changed using
+    operations session. Should be called when versions are created or
+    removed in other way.
+
+    Args:
+        project_name (Optional[str]): Clear cache only of passed project.
     """
 
-    subset_ids = convert_ids(subset_ids)
-    if not subset_ids:
+    if project_name is None:
+        _LAST_VERSIONS_CACHE.clear()
+    else:
+        _LAST_VERSIONS_CACHE.pop(project_name, None)
+
+
+def _get_cached_last_versions(project_name, subset_ids):
+    project_cache = _LAST_VERSIONS_CACHE.get(project_name)
+    if not project_cache:
         return {}
 
-    if fields is not None:
-        fields = list(fields)
-        if not fields:
-            return {}
+    output = {}
+    now = time.time()
+    for subset_id in subset_ids:
+        item = project_cache.get(subset_id)
+        if item is None:
+            continue
+        cache_time, version_id, version_name = item
+        if now - cache_time > LAST_VERSIONS_CACHE_TIMEOUT:
+            project_cache.pop(subset_id, None)
+            continue
+        output[subset_id] = {
+            "_id": version_id,
+            "parent": subset_id,
+            "name": version_name,
+        }
+    return output
 
-    # Avoid double query if only name and _id are requested
-    name_needed = False
-    limit_query = False
-    if fields:
-        fields_s = set(fields)
-        if "name" in fields_s:
-            name_needed = True
-            fields_s.remove("name")
-
-        for field in ("_id", "parent"):
-            if field in fields_s:
-                fields_s.remove(field)
-        limit_query = len(fields_s) == 0
-
-    group_item = {
-        "_id": "$parent",
-        "_version_id": {"$last": "$_id"}
-    }
-    # Add name if name is needed (only for limit query)
-    if name_needed:
-        group_item["name"] = {"$last": "$name"}
+
+def _query_last_versions(project_name, subset_ids, active, fields):
+    """Query last versions using index on type, parent and name.
+
+    Versions are sorted by parent and name in descending order which is
+    covered by index, so first version of each parent is the last one.
+
+    Returns:
+        dict[ObjectId, dict]: Last version documents by subset id.
+    """
 
     aggregate_filter = {
         "type": "version",
-        "parent": {"$in": subset_ids}
+        "parent": {"$in": list(subset_ids)}
     }
     if active is False:
         aggregate_filter["data.active"] = active
@@ -912,42 +976,87 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
             {"data.active": active},
         ]
 
+    conn = get_project_connection(project_name)
+    _ensure_last_versions_index(project_name, conn)
+
     aggregation_pipeline = [
-        # Find all versions of those subsets
         {"$match": aggregate_filter},
-        # Sorting versions all together
-        {"$sort": {"name": 1}},
-        # Group them by "parent", but only take the last
-        {"$group": group_item}
+        {"$sort": {"parent": 1, "name": -1}},
+        {"$group": {"_id": "$parent", "doc": {"$first": "$$ROOT"}}},
+        {"$replaceRoot": {"newRoot": "$doc"}},
     ]
+    projection = _prepare_fields(fields, ["parent"])
+    if projection:
+        aggregation_pipeline.append({"$project": projection})
 
-    conn = get_project_connection(project_name)
-    aggregate_result = conn.aggregate(aggregation_pipeline)
-    if limit_query:
-        output = {}
-        for item in aggregate_result:
-            subset_id = item["_id"]
-            item_data = {"_id": item["_version_id"], "parent": subset_id}
-            if name_needed:
-                item_data["name"] = item["name"]
-            output[subset_id] = item_data
-        return output
+    return {
+        version_doc["parent"]: version_doc
+        for version_doc in conn.aggregate(aggregation_pipeline)
+    }
 
-    version_ids = [
-        doc["_version_id"]
-        for doc in aggregate_result
-    ]
 
-    fields = _prepare_fields(fields, ["parent"])
+def get_last_versions(project_name, subset_ids, active=None, fields=None):
+    """Latest versions for entered subset_ids.
 
-    version_docs = get_versions(
-        project_name, version_ids=version_ids, fields=fields
-    )
+    Last version ids are cached for a short time per project. Cache is
+    cleared on changes made with operations session or explicitly with
+    'clear_last_versions_cache'.
 
-    return {
-        version_doc["parent"]: version_doc
-        for version_doc in version_docs
-    }
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        subset_ids (Iterable[Union[str, ObjectId]]): List of subset ids.
+        active (Optional[bool]): If True only active versions are returned.
+        fields (Optional[Iterable[str]]): Fields that should be returned. All
+            fields are returned if 'None' is passed.
+
+    Returns:
+        dict[ObjectId, int]: Key is subset id and value is last version name.
+    """
+
+    subset_ids = set(convert_ids(subset_ids))
+    if not subset_ids:
+        return {}
+
+    if fields is not None:
+        fields = set(fields)
+        if not fields:
+            return {}
+        fields |= {"_id", "parent", "name"}
+
+    # Cache can be used only for all versions
+    cached = {}
+    if active is None:
+        cached = _get_cached_last_versions(project_name, subset_ids)
+
+    output = {}
+    if cached:
+        if fields is not None and fields == {"_id", "parent", "name"}:
+            output.update(cached)
+        else:
+            version_ids = [doc["_id"] for doc in cached.values()]
+            for version_doc in get_versions(
+                project_name,
+                version_ids=version_ids,
+                fields=fields
+            ):
+                output[version_doc["parent"]] = version_doc
+
+    missing_subset_ids = subset_ids - set(output.keys())
+    if not missing_subset_ids:
+        return output
+
+    queried = _query_last_versions(
+        project_name, missing_subset_ids, active, fields
+    )
+    output.update(queried)
+    if active is None:
+        now = time.time()
+        project_cache = _LAST_VERSIONS_CACHE[project_name]
+        for subset_id, version_doc in queried.items():
+            project_cache[subset_id] = (
+                now, version_doc["_id"], version_doc["name"]
+            )
+    return output
 
 
 def get_last_version_by_subset_id(project_name, subset_id, fields=None):
@@ -1035,6 +1144,12 @@ def get_representation_by_id(project_name, representation_id, fields=None):
         return None
 
     repre_types = ["representation", "archived_representation"]
+    cache = get_active_entities_cache()
+    if cache is not None:
+        return cache.get_by_id(
+            project_name, convert_id(representation_id), repre_types, fields
+        )
+
     query_filter = {
         "type": {"$in": repre_types}
     }
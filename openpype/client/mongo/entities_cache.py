@@ -0,0 +1,223 @@
+"""Scoped cache of entity documents.
+
+Cache is opt-in and is active only inside 'entities_cache' context. Point
+lookups of entities (by id, by name or project document) made in the scope
+are deduplicated and ids registered with 'prefetch' are queried in single
+query with first lookup which is not in cache.
+
+Scope is local to thread which entered it, other threads don't use the cache.
+
+Returned documents are copies, so modifications of returned documents don't
+affect cache. Cache of project is cleared when operations session commits
+changes to the project. Code writing to Mongo directly should call
+'clear_entities_cache'.
+"""
+import copy
+import threading
+import contextlib
+import collections
+
+from .mongo import get_project_connection
+
+# Active cache is stored per thread
+_SCOPE = threading.local()
+
+
+def _project_document(doc, fields):
+    """Copy of document reduced to fields like Mongo projection would do."""
+
+    if doc is None:
+        return None
+
+    if not fields:
+        return copy.deepcopy(doc)
+
+    output = {"_id": doc["_id"]}
+    for field in fields:
+        keys = field.split(".")
+        src = doc
+        found = True
+        for key in keys:
+            if not isinstance(src, dict) or key not in src:
+                found = False
+                break
+            src = src[key]
+        if not found:
+            continue
+
+        dst = output
+        for key in keys[:-1]:
+            dst = dst.setdefault(key, {})
+        dst[keys[-1]] = copy.deepcopy(src)
+    return output
+
+
+class EntitiesCache:
+    """Cache of entity documents by project.
+
+    Full documents are always queried, so the same document can be used for
+    lookups with different fields.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # Documents (or None if not found) by project name and id
+        self._docs_by_id = collections.defaultdict(dict)
+        # Document ids (or None if not found) by project name and filter
+        self._ids_by_query = collections.defaultdict(dict)
+        # Ids which should be queried with next query of project
+        self._pending_ids = collections.defaultdict(set)
+        self.queries_count = 0
+
+    def clear(self, project_name=None):
+        """Clear cached documents.
+
+        Args:
+            project_name (Optional[str]): Clear only documents of project.
+        """
+
+        with self._lock:
+            if project_name is None:
+                self._docs_by_id.clear()
+                self._ids_by_query.clear()
+                self._pending_ids.clear()
+            else:
+                self._docs_by_id.pop(project_name, None)
+                self._ids_by_query.pop(project_name, None)
+                self._pending_ids.pop(project_name, None)
+
+    def prefetch(self, project_name, entity_ids):
+        """Register ids which will be queried with next missing lookup.
+
+        Args:
+            project_name (str): Project name.
+            entity_ids (Iterable[ObjectId]): Ids of entities.
+        """
+
+        with self._lock:
+            docs_by_id = self._docs_by_id[project_name]
+            self._pending_ids[project_name].update(
+                entity_id
+                for entity_id in entity_ids
+                if entity_id not in docs_by_id
+            )
+
+    def get_by_id(self, project_name, entity_id, entity_types, fields=None):
+        """Entity document by id.
+
+        Args:
+            project_name (str): Project name.
+            entity_id (ObjectId): Id of entity.
+            entity_types (Iterable[str]): Allowed types of document.
+            fields (Optional[Iterable[str]]): Fields that should be returned.
+
+        Returns:
+            Union[dict, None]: Document or None if was not found.
+        """
+
+        with self._lock:
+            docs_by_id = self._docs_by_id[project_name]
+            if entity_id not in docs_by_id:
+                pending_ids = self._pending_ids.pop(project_name, set())
+                pending_ids.add(entity_id)
+                self._query_ids(project_name, pending_ids)
+            doc = docs_by_id[entity_id]
+
+        if doc is None or doc.get("type") not in entity_types:
+            return None
+        return _project_document(doc, fields)
+
+    def find_one(self, project_name, query_filter, fields=None):
+        """Deduplicated 'find_one' query.
+
+        Args:
+            project_name (str): Project name.
+            query_filter (dict): Query filter.
+            fields (Optional[Iterable[str]]): Fields that should be returned.
+
+        Returns:
+            Union[dict, None]: Document or None if was not found.
+        """
+
+        key = repr(query_filter)
+        with self._lock:
+            ids_by_query = self._ids_by_query[project_name]
+            docs_by_id = self._docs_by_id[project_name]
+            if key in ids_by_query:
+                entity_id = ids_by_query[key]
+                doc = None
+                if entity_id is not None:
+                    doc = docs_by_id.get(entity_id)
+            else:
+                self.queries_count += 1
+                conn = get_project_connection(project_name)
+                doc = conn.find_one(query_filter)
+                entity_id = None
+                if doc is not None:
+                    entity_id = doc["_id"]
+                    docs_by_id[entity_id] = doc
+                ids_by_query[key] = entity_id
+        return _project_document(doc, fields)
+
+    def _query_ids(self, project_name, entity_ids):
+        self.queries_count += 1
+        docs_by_id = self._docs_by_id[project_name]
+        for entity_id in entity_ids:
+            docs_by_id[entity_id] = None
+
+        conn = get_project_connection(project_name)
+        for doc in conn.find({"_id": {"$in": list(entity_ids)}}):
+            docs_by_id[doc["_id"]] = doc
+
+
+def get_active_entities_cache():
+    """Entities cache of current scope.
+
+    Returns:
+        Union[EntitiesCache, None]: Cache if called in 'entities_cache'
+            scope.
+    """
+
+    return getattr(_SCOPE, "cache", None)
+
+
+def clear_entities_cache(project_name=None):
+    """Clear active entities cache if there is any.
+
+    Args:
+        project_name (Optional[str]): Clear only documents of project.
+    """
+
+    cache = get_active_entities_cache()
+    if cache is not None:
+        cache.clear(project_name)
+
+
+@contextlib.contextmanager
+def entities_cache():
+    """Cache entity point lookups in the scope.
+
+    Nested scopes use cache of the outermost scope. Scope is active only in
+    current thread.
+
+    Example:
+        >>> with entities_cache() as cache:
+        ...     cache.prefetch(project_name, version_ids)
+        ...     for version_id in version_ids:
+        ...         version_doc = get_version_by_id(project_name, version_id)
+
+    Yields:
+        EntitiesCache: Active cache.
+    """
+
+    cache = get_active_entities_cache()
+    if cache is not None:
+        yield cache
+        return
+
+    cache = EntitiesCache()
+    _SCOPE.cache = cache
+    try:
+        yield cache
+    finally:
+        _SCOPE.cache = None
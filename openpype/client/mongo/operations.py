@@ -14,7 +14,8 @@ from openpype.client.operations_base import (
     BaseOperationsSession
 )
 from .mongo import get_project_connection
-from .entities import get_project
+from .entities import get_project, clear_last_versions_cache
+from .entities_cache import clear_entities_cache
 
 
 PROJECT_NAME_ALLOWED_SYMBOLS = "a-zA-Z0-9_"
@@ -506,6 +507,13 @@ class MongoOperationsSession(BaseOperationsSession):
             if bulk_writes:
                 collection = get_project_connection(project_name)
                 collection.bulk_write(bulk_writes)
+                clear_entities_cache(project_name)
+
+            if any(
+                operation.entity_type == "version"
+                for operation in operations
+            ):
+                clear_last_versions_cache(project_name)
 
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'MongoCreateOperation'.
@@ -1,3 +1,4 @@
+import contextlib
 import collections
 
 from ayon_api import get_server_api_connection
@@ -385,6 +386,25 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
     }
 
 
+def clear_last_versions_cache(project_name=None):
+    """Last versions are not cached when server is used."""
+
+    pass
+
+
+@contextlib.contextmanager
+def entities_cache():
+    """Entities are not cached when server is used."""
+
+    yield None
+
+
+def clear_entities_cache(project_name=None):
+    """Entities are not cached when server is used."""
+
+    pass
+
+
 def get_last_version_by_subset_id(project_name, subset_id, fields=None):
     versions = _get_versions(
         project_name,
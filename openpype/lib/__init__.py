@@ -145,6 +145,7 @@ from .applications import (
 from .plugin_tools import (
     prepare_template_data,
     source_hash,
+    source_hash_from_stat,
 )
 
 from .path_tools import (
@@ -152,6 +153,9 @@ from .path_tools import (
     collect_frames,
     create_hard_link,
     create_symlink,
+    create_reflink,
+    duplicate_file,
+    get_files_stats,
     version_up,
     get_version_from_path,
     get_last_version_from_path,
@@ -267,11 +271,15 @@ __all__ = [
 
     "prepare_template_data",
     "source_hash",
+    "source_hash_from_stat",
 
     "format_file_size",
     "collect_frames",
     "create_hard_link",
     "create_symlink",
+    "create_reflink",
+    "duplicate_file",
+    "get_files_stats",
     "version_up",
     "get_version_from_path",
     "get_last_version_from_path",
@@ -2,6 +2,9 @@ import os
 import logging
 import sys
 import errno
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
 import six
 
 from openpype.lib import create_hard_link, create_symlink
@@ -47,6 +50,12 @@ class FileTransaction(object):
         permissions could be changed, other machines could be moving or writing
         files. A lot can happen.
 
+    Transfers can be processed in parallel by passing `max_workers` higher
+    than 1. Destination folders are created once before any file is
+    transferred and transfers are submitted to a thread pool in chunks so
+    only a bounded amount of them is in flight. Order of `transferred` is
+    always the order in which the files were added to the queue.
+
     Warning:
         Any folders created during the transfer will not be removed.
     """
@@ -55,12 +64,27 @@ class FileTransaction(object):
     MODE_HARDLINK = 1
     MODE_SYMLINK = 2
 
-    def __init__(self, log=None, allow_queue_replacements=False):
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=1,
+        chunk_size=None
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
         self.log = log
 
+        # Amount of threads used to process transfers ('1' means serial)
+        if not max_workers or max_workers < 1:
+            max_workers = 1
+        self._max_workers = max_workers
+        # Maximum amount of transfers submitted to pool at once
+        if not chunk_size or chunk_size < 1:
+            chunk_size = max_workers * 4
+        self._chunk_size = chunk_size
+
         # The transfer queue
         # todo: make this an actual FIFO queue?
         self._transfers = {}
@@ -111,45 +135,117 @@ class FileTransaction(object):
         self._transfers[dst] = (src, opts)
 
     def process(self):
+        """Backup existing files and transfer files in queue.
+
+        If any transfer fails the files that were transferred successfully
+        are still available in `transferred` so `rollback` can clean them up.
+        The first error that happened is re-raised.
+        """
+        items = list(self._transfers.items())
+
         # Backup any existing files
-        for dst, (src, _) in self._transfers.items():
-            self.log.debug("Checking file ... {} -> {}".format(src, dst))
-            path_same = self._same_paths(src, dst)
-            if path_same or not os.path.exists(dst):
-                continue
-
-            # Backup original file
-            # todo: add timestamp or uuid to ensure unique
-            backup = dst + ".bak"
-            self._backup_to_original[backup] = dst
-            self.log.debug(
-                "Backup existing file: {} -> {}".format(dst, backup))
-            os.rename(dst, backup)
+        for dst, backup in self._iter_results(self._backup_file, items):
+            if backup is not None:
+                self._backup_to_original[backup] = dst
 
-        # Copy the files to transfer
-        for dst, (src, opts) in self._transfers.items():
-            path_same = self._same_paths(src, dst)
-            if path_same:
-                self.log.debug(
-                    "Source and destination are same files {} -> {}".format(
-                        src, dst))
-                continue
+        # Create destination folders only once for all transfers
+        dirnames = collections.OrderedDict()
+        for dst, _ in items:
+            dirnames[os.path.dirname(dst)] = None
 
-            self._create_folder_for_file(dst)
+        for dirname in dirnames:
+            self._create_folder(dirname)
 
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
-                    src, dst))
-                create_hard_link(src, dst)
-            elif opts["mode"] == self.MODE_SYMLINK:
-                self.log.debug("Symlinking file ... {} -> {}".format(
+        # Copy the files to transfer
+        transfer_results = self._iter_results(self._transfer_file, items)
+        for dst, transferred in transfer_results:
+            if transferred:
+                self._transferred.append(dst)
+
+    def _backup_file(self, item):
+        dst, (src, _) = item
+        self.log.debug("Checking file ... {} -> {}".format(src, dst))
+        path_same = self._same_paths(src, dst)
+        if path_same or not os.path.exists(dst):
+            return dst, None
+
+        # Backup original file
+        # todo: add timestamp or uuid to ensure unique
+        backup = dst + ".bak"
+        self.log.debug(
+            "Backup existing file: {} -> {}".format(dst, backup))
+        os.rename(dst, backup)
+        return dst, backup
+
+    def _transfer_file(self, item):
+        dst, (src, opts) = item
+        path_same = self._same_paths(src, dst)
+        if path_same:
+            self.log.debug(
+                "Source and destination are same files {} -> {}".format(
                     src, dst))
-                create_symlink(src, dst)
+            return dst, False
+
+        if opts["mode"] == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            copyfile(src, dst)
+        elif opts["mode"] == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            create_hard_link(src, dst)
+        elif opts["mode"] == self.MODE_SYMLINK:
+            self.log.debug("Symlinking file ... {} -> {}".format(
+                src, dst))
+            create_symlink(src, dst)
+
+        return dst, True
+
+    def _iter_results(self, func, items):
+        """Call function for each item and yield results in items order.
+
+        When more than one worker is used the items are processed by
+        a thread pool in chunks. No new chunk is submitted after a failure,
+        results of all items that finished are yielded and the first error
+        is re-raised after that, so caller can still register them for
+        rollback.
+
+        Args:
+            func (Callable[[Any], Any]): Function called for each item.
+            items (list[Any]): Items to process.
+
+        Yields:
+            Any: Result of each successfully processed item.
+        """
 
-            self._transferred.append(dst)
+        if self._max_workers == 1 or len(items) < 2:
+            for item in items:
+                yield func(item)
+            return
+
+        error_info = None
+        max_workers = min(self._max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for idx in range(0, len(items), self._chunk_size):
+                futures = [
+                    executor.submit(func, item)
+                    for item in items[idx:idx + self._chunk_size]
+                ]
+                # Always wait for all futures of the chunk so all finished
+                #   transfers are known for rollback
+                for future in futures:
+                    try:
+                        result = future.result()
+                    except Exception:
+                        if error_info is None:
+                            error_info = sys.exc_info()
+                        continue
+                    yield result
+
+                if error_info is not None:
+                    break
+
+        if error_info is not None:
+            six.reraise(*error_info)
 
     def finalize(self):
         # Delete any backed up files
@@ -200,8 +296,7 @@ class FileTransaction(object):
         """Return the backup file paths"""
         return list(self._backup_to_original.keys())
 
-    def _create_folder_for_file(self, path):
-        dirname = os.path.dirname(path)
+    def _create_folder(self, dirname):
         try:
             os.makedirs(dirname)
         except OSError as e:
@@ -12,18 +12,26 @@ Best place for it is in ``repos/pype-config/environments/global.json``
 """
 
 
+import atexit
 import datetime
 import getpass
 import logging
 import os
 import platform
+import queue
 import socket
 import sys
+import tempfile
 import time
 import traceback
 import threading
+import uuid
 import copy
 
+from bson import json_util
+from bson.errors import InvalidDocument
+from pymongo.errors import PyMongoError
+
 from openpype import AYON_SERVER_ENABLED
 from openpype.client.mongo import (
     MongoEnvNotSet,
@@ -182,6 +190,244 @@ class MongoFormatter(logging.Formatter):
         return document
 
 
+class MongoQueueHandler(logging.Handler):
+    """Handler writing records to mongo collection on background thread.
+
+    Records are formatted on calling thread and put to bounded queue. Worker
+    thread writes them in batches using 'insert_many'. When queue is full
+    records are dropped or calling thread is blocked until there is space.
+
+    Records which can't be written because mongo is not reachable are
+    appended to spill file. Spilled records are written to mongo once it is
+    reachable again, also spill files of other processes are written.
+
+    Args:
+        collection (pymongo.collection.Collection): Collection for records.
+        queue_size (int): Maximum number of records waiting in queue.
+        batch_size (int): Maximum number of records written at once.
+        flush_interval (float): Maximum time in seconds for which record
+            waits for batch to be filled.
+        block (bool): Block calling thread when queue is full, records are
+            dropped otherwise.
+        spill_dir (Optional[str]): Directory for spill files.
+        retry_interval (float): Time in seconds for which records are
+            spilled without trying to write them after mongo failure.
+    """
+
+    spill_ext = ".jsonl"
+    # Time in seconds for which 'close' waits for worker thread
+    close_timeout = 10.0
+
+    def __init__(
+        self,
+        collection,
+        queue_size=10000,
+        batch_size=100,
+        flush_interval=1.0,
+        block=False,
+        spill_dir=None,
+        retry_interval=10.0
+    ):
+        super(MongoQueueHandler, self).__init__()
+        if spill_dir is None:
+            spill_dir = os.path.join(
+                tempfile.gettempdir(), "openpype_logs_spill"
+            )
+        self._collection = collection
+        self._queue = queue.Queue(queue_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._block = block
+        self._retry_interval = retry_interval
+        self._spill_dir = spill_dir
+        self._spill_path = os.path.join(
+            spill_dir, "{}{}".format(os.getpid(), self.spill_ext)
+        )
+        self._failed_time = None
+        self._has_spill = True
+        self._spill_lock = threading.Lock()
+        self._closed = False
+        self.dropped_count = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="MongoQueueHandler", daemon=True
+        )
+        self._thread.start()
+
+    def emit(self, record):
+        if self._closed:
+            return
+
+        try:
+            document = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        try:
+            self._queue.put(document, block=self._block)
+        except queue.Full:
+            self.dropped_count += 1
+
+    def flush(self):
+        """Wait until all queued records are written or spilled."""
+
+        if not self._closed and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self):
+        """Write queued records and stop worker thread."""
+
+        if not self._closed:
+            self._closed = True
+            if self._thread.is_alive():
+                # Use blocking put, sentinel must not be dropped
+                self._queue.put(None)
+                self._thread.join(self.close_timeout)
+
+            # Spill records which were not written in time
+            documents = []
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    documents.append(item)
+            if documents:
+                self._spill(documents)
+        super(MongoQueueHandler, self).close()
+
+    def _run(self):
+        stop = False
+        while not stop:
+            try:
+                item = self._queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                if not self._is_failing():
+                    self._write_spilled()
+                continue
+
+            documents = []
+            items_count = 1
+            deadline = time.time() + self._flush_interval
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                documents.append(item)
+                if len(documents) >= self._batch_size:
+                    break
+                timeout = deadline - time.time()
+                try:
+                    if timeout > 0:
+                        item = self._queue.get(timeout=timeout)
+                    else:
+                        item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                items_count += 1
+
+            if documents:
+                try:
+                    self._write(documents)
+                except Exception:
+                    # Worker must not die, records are lost
+                    pass
+            for _ in range(items_count):
+                self._queue.task_done()
+
+    def _is_failing(self):
+        if self._failed_time is None:
+            return False
+        if time.time() - self._failed_time > self._retry_interval:
+            self._failed_time = None
+            return False
+        return True
+
+    def _insert(self, documents):
+        try:
+            self._collection.insert_many(documents, ordered=False)
+        except InvalidDocument:
+            # Skip documents which can't be encoded
+            for document in documents:
+                try:
+                    self._collection.insert_one(document)
+                except InvalidDocument:
+                    pass
+
+    def _write(self, documents):
+        if not self._is_failing():
+            try:
+                self._insert(documents)
+            except PyMongoError:
+                self._failed_time = time.time()
+            else:
+                self._write_spilled()
+                return
+        self._spill(documents)
+
+    def _spill(self, documents):
+        lines = []
+        for document in documents:
+            document.pop("_id", None)
+            try:
+                lines.append(json_util.dumps(document))
+            except (TypeError, ValueError):
+                continue
+        try:
+            if not os.path.exists(self._spill_dir):
+                os.makedirs(self._spill_dir)
+            with self._spill_lock:
+                with open(self._spill_path, "a") as stream:
+                    for line in lines:
+                        stream.write(line + "\n")
+        except (IOError, OSError):
+            return
+        self._has_spill = True
+
+    def _write_spilled(self):
+        """Write records from spill files to mongo."""
+
+        if not self._has_spill:
+            return
+        if not os.path.isdir(self._spill_dir):
+            self._has_spill = False
+            return
+
+        for filename in os.listdir(self._spill_dir):
+            if not filename.endswith(self.spill_ext):
+                continue
+            path = os.path.join(self._spill_dir, filename)
+            # Claim file so other processes don't write the same records
+            claimed_path = "{}.{}.writing".format(path, os.getpid())
+            try:
+                os.replace(path, claimed_path)
+                with open(claimed_path, "r") as stream:
+                    documents = [
+                        json_util.loads(line)
+                        for line in stream
+                        if line.strip()
+                    ]
+            except (IOError, OSError, ValueError):
+                continue
+
+            try:
+                for idx in range(0, len(documents), self._batch_size):
+                    self._insert(documents[idx:idx + self._batch_size])
+            except PyMongoError:
+                self._failed_time = time.time()
+                # Keep records to be written later, records of the batch
+                #   which were already written may be written again
+                os.replace(claimed_path, os.path.join(
+                    self._spill_dir,
+                    "{}{}".format(uuid.uuid4().hex, self.spill_ext)
+                ))
+                return
+            os.remove(claimed_path)
+        self._has_spill = False
+
+
 class Logger:
     DFT = "%(levelname)s >>> { %(name)s }: [ %(message)s ] "
     DBG = "  - { %(name)s }: [ %(message)s ] "
@@ -220,6 +466,15 @@ class Logger:
     # Logging level - OPENPYPE_LOG_LEVEL
     log_level = None
 
+    # Handler shared by all loggers writing records to mongo
+    _mongo_handler = None
+    # Options of mongo handler
+    mongo_queue_size = 10000
+    mongo_batch_size = 100
+    mongo_flush_interval = 1.0
+    # Block logging thread when queue is full instead of dropping records
+    mongo_queue_block = False
+
     # Data same for all record documents
     process_data = None
     # Cached process name or ability to set different process name
@@ -238,7 +493,7 @@ class Logger:
         add_console_handler = True
 
         for handler in logger.handlers:
-            if isinstance(handler, MongoHandler):
+            if isinstance(handler, (MongoHandler, MongoQueueHandler)):
                 add_mongo_handler = False
             elif isinstance(handler, LogStreamHandler):
                 add_console_handler = False
@@ -285,22 +540,23 @@ class Logger:
         if not cls.use_mongo_logging:
             return
 
-        components = get_default_components()
-        kwargs = {
-            "host": components["host"],
-            "database_name": cls.log_database_name,
-            "collection": cls.log_collection_name,
-            "username": components["username"],
-            "password": components["password"],
-            "capped": True,
-            "formatter": MongoFormatter()
-        }
-        if components["port"] is not None:
-            kwargs["port"] = int(components["port"])
-        if components["auth_db"]:
-            kwargs["authentication_db"] = components["auth_db"]
-
-        return MongoHandler(**kwargs)
+        if cls._mongo_handler is None:
+            client = cls.get_log_mongo_connection()
+            collection = client[cls.log_database_name][
+                cls.log_collection_name
+            ]
+            handler = MongoQueueHandler(
+                collection,
+                queue_size=cls.mongo_queue_size,
+                batch_size=cls.mongo_batch_size,
+                flush_interval=cls.mongo_flush_interval,
+                block=cls.mongo_queue_block
+            )
+            handler.setFormatter(MongoFormatter())
+            # Write queued records on exit
+            atexit.register(handler.close)
+            cls._mongo_handler = handler
+        return cls._mongo_handler
 
     @classmethod
     def _get_console_handler(cls):
@@ -10,6 +10,11 @@ KEY_PATTERN = re.compile(r"(\{.*?[^{0]*\})")
 KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
+# Maximum number of compiled templates kept in process-wide cache
+TEMPLATE_CACHE_SIZE = 4096
+# Compiled templates by template string
+# - plain dictionary is used as 'functools.lru_cache' is not in Python 2
+_COMPILED_TEMPLATES = {}
 
 
 def merge_dict(main_dict, enhance_dict):
@@ -89,37 +94,7 @@ class StringTemplate(object):
             ))
 
         self._template = template
-        parts = []
-        last_end_idx = 0
-        for item in KEY_PATTERN.finditer(template):
-            start, end = item.span()
-            if start > last_end_idx:
-                parts.append(template[last_end_idx:start])
-            parts.append(FormattingPart(template[start:end]))
-            last_end_idx = end
-
-        if last_end_idx < len(template):
-            parts.append(template[last_end_idx:len(template)])
-
-        new_parts = []
-        for part in parts:
-            if not isinstance(part, six.string_types):
-                new_parts.append(part)
-                continue
-
-            substr = ""
-            for char in part:
-                if char not in ("<", ">"):
-                    substr += char
-                else:
-                    if substr:
-                        new_parts.append(substr)
-                    new_parts.append(char)
-                    substr = ""
-            if substr:
-                new_parts.append(substr)
-
-        self._parts = self.find_optional_parts(new_parts)
+        self._parts = _compile_template(template)
 
     def __str__(self):
         return self.template
@@ -182,6 +157,102 @@ class StringTemplate(object):
         result.validate()
         return result
 
+    def format_string(self, data, strict=True):
+        """Fill template and return only the output string.
+
+        Faster variant of 'format' which does not collect used values,
+        missing keys and invalid types. Should be used when only filled
+        string is needed.
+
+        Args:
+            data (dict): Containing keys to be filled into template.
+            strict (bool): Raise 'TemplateUnsolved' if template is not
+                solved. Unsolved keys are kept in output otherwise.
+
+        Returns:
+            str: Filled or partially filled template.
+        """
+
+        output = ""
+        solved = True
+        for part in self._parts:
+            if isinstance(part, six.string_types):
+                output += part
+                continue
+
+            value = part.format_string(data)
+            if value is None:
+                solved = False
+                value = part.template
+            output += value
+
+        if not solved and strict:
+            # Use full formatting to raise error with all information
+            return str(self.format_strict(data))
+        return output
+
+    def format_sequence(self, data, indexes, key="frame"):
+        """Fill template for each index of a sequence.
+
+        Template is solved only once for all keys except the sequence key
+        and filled paths are then created by concatenation of solved
+        parts with formatted index.
+
+        Args:
+            data (dict): Containing keys to be filled into template. Value of
+                sequence key in data is ignored.
+            indexes (Iterable[int]): Sequence indexes e.g. frames.
+            key (str): Key in template which is filled with sequence index.
+
+        Returns:
+            list[str]: Filled template for each index.
+
+        Raises:
+            TemplateUnsolved: When template can't be solved.
+        """
+
+        indexes = list(indexes)
+        if not indexes:
+            return []
+
+        segments = _solve_parts_except_key(self._parts, data, key)
+        if segments is None:
+            fill_data = dict(data)
+            fill_data[key] = indexes[0]
+            # Use full formatting to raise error with all information
+            self.format_strict(fill_data)
+            # Template is solvable with index value of different type
+            return [
+                self.format_string(dict(data, **{key: index}))
+                for index in indexes
+            ]
+
+        # Merge following strings to reduce concatenations per index
+        merged_segments = []
+        for segment in segments:
+            if (
+                merged_segments
+                and isinstance(segment, six.string_types)
+                and isinstance(merged_segments[-1], six.string_types)
+            ):
+                merged_segments[-1] += segment
+            else:
+                merged_segments.append(segment)
+
+        if len(merged_segments) == 1:
+            return [merged_segments[0] for _ in indexes]
+
+        output = []
+        for index in indexes:
+            parts = []
+            for segment in merged_segments:
+                if isinstance(segment, six.string_types):
+                    parts.append(segment)
+                else:
+                    parts.append(segment.format_index(index))
+            output.append("".join(parts))
+        return output
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -192,6 +263,54 @@ class StringTemplate(object):
         objected_template = cls(template)
         return objected_template.format_strict(data)
 
+    @staticmethod
+    def clear_cache():
+        """Clear process-wide cache of compiled templates."""
+        _COMPILED_TEMPLATES.clear()
+
+    @staticmethod
+    def split_template_parts(template):
+        """Split template string to strings, formatting and optional parts.
+
+        Args:
+            template (str): Template string.
+
+        Returns:
+            list[Union[str, FormattingPart, OptionalPart]]: Template parts.
+        """
+
+        parts = []
+        last_end_idx = 0
+        for item in KEY_PATTERN.finditer(template):
+            start, end = item.span()
+            if start > last_end_idx:
+                parts.append(template[last_end_idx:start])
+            parts.append(FormattingPart(template[start:end]))
+            last_end_idx = end
+
+        if last_end_idx < len(template):
+            parts.append(template[last_end_idx:len(template)])
+
+        new_parts = []
+        for part in parts:
+            if not isinstance(part, six.string_types):
+                new_parts.append(part)
+                continue
+
+            substr = ""
+            for char in part:
+                if char not in ("<", ">"):
+                    substr += char
+                else:
+                    if substr:
+                        new_parts.append(substr)
+                    new_parts.append(char)
+                    substr = ""
+            if substr:
+                new_parts.append(substr)
+
+        return StringTemplate.find_optional_parts(new_parts)
+
     @staticmethod
     def find_optional_parts(parts):
         new_parts = []
@@ -241,6 +360,68 @@ class StringTemplate(object):
         return new_parts
 
 
+def _solve_parts_except_key(parts, data, key):
+    """Solve template parts except formatting parts of passed key.
+
+    Optional parts which contain the key are expanded if they are solved
+    with other keys or skipped otherwise.
+
+    Args:
+        parts (Iterable[Union[str, FormattingPart, OptionalPart]]): Template
+            parts.
+        data (dict): Data used for formatting.
+        key (str): Key which is kept unsolved.
+
+    Returns:
+        Union[list[Union[str, FormattingPart]], None]: Solved strings and
+            formatting parts of the key. None if any part is unsolved.
+    """
+
+    output = []
+    for part in parts:
+        if isinstance(part, six.string_types):
+            output.append(part)
+
+        elif isinstance(part, OptionalPart):
+            value = _solve_parts_except_key(part.parts, data, key)
+            if value is not None:
+                output.extend(value)
+
+        elif part.is_index_key(key):
+            output.append(part)
+
+        else:
+            value = part.format_string(data)
+            if value is None:
+                return None
+            output.append(value)
+    return output
+
+
+def _compile_template(template):
+    """Compile template string to parts which are shared between objects.
+
+    Parts are immutable during formatting so the same compiled parts can be
+    used by all 'StringTemplate' objects with the same template.
+
+    Cache is cleared when it reaches 'TEMPLATE_CACHE_SIZE' templates.
+
+    Args:
+        template (str): Template string.
+
+    Returns:
+        tuple[Union[str, FormattingPart, OptionalPart]]: Compiled parts.
+    """
+
+    parts = _COMPILED_TEMPLATES.get(template)
+    if parts is None:
+        if len(_COMPILED_TEMPLATES) >= TEMPLATE_CACHE_SIZE:
+            _COMPILED_TEMPLATES.clear()
+        parts = tuple(StringTemplate.split_template_parts(template))
+        _COMPILED_TEMPLATES[template] = parts
+    return parts
+
+
 class TemplatesDict(object):
     def __init__(self, templates=None):
         self._raw_templates = None
@@ -704,6 +885,16 @@ class FormattingPart:
     def __init__(self, template):
         self._template = template
 
+        # Prepare keys used for formatting only once
+        key = template[1:-1]
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+
     @property
     def template(self):
         return self._template
@@ -732,17 +923,14 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
         # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -784,17 +972,7 @@ class FormattingPart:
             return result
 
         if self.validate_value_type(value):
-            fill_data = {}
-            first_value = True
-            for used_key in reversed(used_keys):
-                if first_value:
-                    first_value = False
-                    fill_data[used_key] = value
-                else:
-                    _fill_data = {used_key: fill_data}
-                    fill_data = _fill_data
-
-            formatted_value = self.template.format(**fill_data)
+            formatted_value = self._format_value(used_keys, value)
             result.add_realy_used_value(key, formatted_value)
             result.add_used_value(existence_check, formatted_value)
             result.add_output(formatted_value)
@@ -805,6 +983,61 @@ class FormattingPart:
 
         return result
 
+    def format_string(self, data):
+        """Format the formatting string without storing any metadata.
+
+        Args:
+            data(dict): Data that should be used for formatting.
+
+        Returns:
+            Union[str, None]: Formatted value or None if key is missing
+                or has invalid type.
+        """
+
+        value = data
+        for sub_key in self._key_subdict:
+            if (
+                value is None
+                or not hasattr(value, "items")
+                or sub_key not in value
+            ):
+                return None
+            value = value.get(sub_key)
+
+        if not self.validate_value_type(value):
+            return None
+        return self._format_value(self._key_subdict, value)
+
+    def is_index_key(self, key):
+        """Key of this part is the passed key without any sub-keys.
+
+        Args:
+            key (str): Key name e.g. 'frame'.
+
+        Returns:
+            bool: Part is formatting the key.
+        """
+
+        return self._key_subdict == (key, )
+
+    def format_index(self, index):
+        """Format the formatting string with index of a sequence.
+
+        Args:
+            index (int): Value used for the key of this part.
+
+        Returns:
+            str: Formatted value.
+        """
+
+        return self._format_value(self._key_subdict, index)
+
+    def _format_value(self, used_keys, value):
+        fill_data = value
+        for used_key in reversed(used_keys):
+            fill_data = {used_key: fill_data}
+        return self.template.format(**fill_data)
+
 
 class OptionalPart:
     """Template part which contains optional formatting strings.
@@ -840,3 +1073,25 @@ class OptionalPart:
         if new_result.solved:
             result.add_output(new_result)
         return result
+
+    def format_string(self, data):
+        """Format optional part without storing any metadata.
+
+        Args:
+            data(dict): Data that should be used for formatting.
+
+        Returns:
+            str: Formatted value or empty string if any key is not solved.
+        """
+
+        output = ""
+        for part in self._parts:
+            if isinstance(part, six.string_types):
+                output += part
+                continue
+
+            value = part.format_string(data)
+            if value is None:
+                return ""
+            output += value
+        return output
@@ -1,12 +1,24 @@
 import os
 import re
+import sys
 import logging
 import platform
+import collections
+from concurrent.futures import ThreadPoolExecutor
 
 import clique
 
+# this is needed until speedcopy for linux is fixed
+if sys.platform == "win32":
+    from speedcopy import copyfile
+else:
+    from shutil import copyfile
+
 log = logging.getLogger(__name__)
 
+# Linux ioctl request to clone file content (copy-on-write)
+FICLONE = 0x40049409
+
 
 def format_file_size(file_size, suffix=None):
     """Returns formatted string with size in appropriate unit.
@@ -100,6 +112,175 @@ def create_symlink(src_path, dst_path):
     )
 
 
+def create_reflink(src_path, dst_path):
+    """Create reflink (copy-on-write clone) of file.
+
+    Clone shares data blocks with source until one of them is modified.
+    Supported on Linux filesystems with 'FICLONE' ioctl (e.g. Btrfs, XFS)
+    and on macOS APFS.
+
+    Args:
+        src_path(str): Full path to a file which is used as source for
+            reflink.
+        dst_path(str): Full path to a file where a clone of source will be
+            added.
+
+    Raises:
+        OSError: Filesystem does not support reflinks.
+        NotImplementedError: Reflinks are not implemented for platform.
+    """
+    platform_name = platform.system().lower()
+    if platform_name == "linux":
+        import fcntl
+
+        with open(src_path, "rb") as src_stream:
+            dst_fd = os.open(
+                dst_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666
+            )
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_stream.fileno())
+            except OSError:
+                os.close(dst_fd)
+                os.remove(dst_path)
+                raise
+            os.close(dst_fd)
+        return
+
+    if platform_name == "darwin":
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        clonefile = libc.clonefile
+        clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+        clonefile.restype = ctypes.c_int
+        if clonefile(os.fsencode(src_path), os.fsencode(dst_path), 0) != 0:
+            errno_value = ctypes.get_errno()
+            raise OSError(errno_value, os.strerror(errno_value), dst_path)
+        return
+
+    raise NotImplementedError(
+        "Implementation of reflink for current environment is missing."
+    )
+
+
+def duplicate_file(src_path, dst_path):
+    """Make file available on destination path in the cheapest way.
+
+    Hardlink is tried first, then reflink and symlink. File is copied only
+    if none of them is supported by filesystem. Content of destination
+    must not be modified as it may share data with source. Existing
+    destination file is replaced.
+
+    Args:
+        src_path(str): Full path to source file.
+        dst_path(str): Full path to a file where source should be available.
+
+    Returns:
+        str: Used method 'hardlink', 'reflink', 'symlink' or 'copy'.
+    """
+    if os.path.lexists(dst_path):
+        if os.path.normcase(os.path.abspath(src_path)) == os.path.normcase(
+            os.path.abspath(dst_path)
+        ):
+            raise ValueError(
+                "Source and destination are the same path \"{}\"".format(
+                    src_path)
+            )
+        os.remove(dst_path)
+
+    for method, func in (
+        ("hardlink", create_hard_link),
+        ("reflink", create_reflink),
+        ("symlink", create_symlink),
+    ):
+        try:
+            func(src_path, dst_path)
+            return method
+        except (OSError, NotImplementedError) as exc:
+            log.debug("Failed to create {} \"{}\": {}".format(
+                method, dst_path, exc))
+
+    copyfile(src_path, dst_path)
+    return "copy"
+
+
+def _get_dir_files_stats(dirname, paths):
+    """Stat files of a single directory.
+
+    Directory is read with 'os.scandir' when there is more than one file
+    so stat information is taken from directory entries (on Windows the
+    information is available from the directory read without additional
+    calls). Files which were not found in directory entries are stat'ed
+    directly.
+
+    Args:
+        dirname (str): Directory of the files.
+        paths (list[str]): File paths in the directory.
+
+    Returns:
+        list[tuple[str, os.stat_result]]: Path and its stat result.
+    """
+
+    entries_by_name = {}
+    if len(paths) > 1:
+        try:
+            with os.scandir(dirname or ".") as scan_iter:
+                for entry in scan_iter:
+                    entries_by_name[entry.name] = entry
+        except OSError:
+            entries_by_name = {}
+
+    output = []
+    for path in paths:
+        entry = entries_by_name.get(os.path.basename(path))
+        if entry is not None:
+            output.append((path, entry.stat()))
+        else:
+            output.append((path, os.stat(path)))
+    return output
+
+
+def get_files_stats(paths, max_workers=None):
+    """Stat multiple files using one directory read per directory.
+
+    Files are grouped by their directory. Directories are processed in
+    a thread pool if there is more than one of them.
+
+    Args:
+        paths (Iterable[str]): File paths.
+        max_workers (Optional[int]): Maximum number of threads used
+            for multiple directories. Uses default of 'ThreadPoolExecutor'
+            if not passed.
+
+    Returns:
+        dict[str, os.stat_result]: Stat result by passed path.
+
+    Raises:
+        OSError: When any file does not exist.
+    """
+
+    paths_by_dir = collections.OrderedDict()
+    for path in paths:
+        dirname = os.path.dirname(path)
+        paths_by_dir.setdefault(dirname, []).append(path)
+
+    output = {}
+    if len(paths_by_dir) < 2 or max_workers == 1:
+        for dirname, dir_paths in paths_by_dir.items():
+            output.update(_get_dir_files_stats(dirname, dir_paths))
+        return output
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_get_dir_files_stats, dirname, dir_paths)
+            for dirname, dir_paths in paths_by_dir.items()
+        ]
+        for future in futures:
+            output.update(future.result())
+    return output
+
+
 def collect_frames(files):
     """Returns dict of source path and its frame, if from sequence
 
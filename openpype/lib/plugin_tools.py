@@ -65,8 +65,25 @@ def source_hash(filepath, *args):
     You can specify additional arguments in the function
     to allow for specific 'processing' values to be included.
     """
+    return source_hash_from_stat(filepath, os.stat(filepath), *args)
+
+
+def source_hash_from_stat(filepath, stat_result, *args):
+    """Generate the same identifier as 'source_hash' from known stat result.
+
+    Can be used to avoid additional filesystem calls when file was already
+    stat'ed.
+
+    Args:
+        filepath (str): The source file path.
+        stat_result (os.stat_result): Result of 'os.stat' of the file.
+        *args (str): Additional 'processing' values to include.
+
+    Returns:
+        str: Source hash.
+    """
     # We replace dots with comma because . cannot be a key in a pymongo dict.
     file_name = os.path.basename(filepath)
-    time = str(os.path.getmtime(filepath))
-    size = str(os.path.getsize(filepath))
+    time = str(stat_result.st_mtime)
+    size = str(stat_result.st_size)
     return "|".join([file_name, time, size] + list(args)).replace(".", ",")
@@ -1,15 +1,18 @@
 import os
 import re
+import uuid
+import hashlib
 import logging
 import json
 import collections
 import tempfile
+import threading
 import subprocess
 import platform
 
 import xml.etree.ElementTree
 
-from multiprocessing.pool import ThreadPool
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from .execute import run_subprocess
 from .vendor_bin_utils import (
     get_ffmpeg_tool_args,
@@ -44,6 +47,13 @@ XML_CHAR_REF_REGEX_HEX = re.compile(r"&#x?[0-9a-fA-F]+;")
 # Regex to parse array attributes
 ARRAY_TYPE_REGEX = re.compile(r"^(int|float|string)\[\d+\]$")
 
+# Frame range of sequence in oiiotool format e.g. 'file.1001-1010#.exr'
+OIIO_FRAME_RANGE_REGEX = re.compile(r"\.(\d+)-(\d+)#\.")
+# Maximum of frames converted by single oiiotool process
+DEFAULT_FRAMES_PER_PROCESS = 10
+# Maximum of probe outputs kept in memory
+DEFAULT_PROBE_CACHE_SIZE = 512
+
 IMAGE_EXTENSIONS = {
     ".ani", ".anim", ".apng", ".art", ".bmp", ".bpg", ".bsave", ".cal",
     ".cin", ".cpc", ".cpt", ".dds", ".dpx", ".ecw", ".exr", ".fits",
@@ -79,23 +89,184 @@ def get_transcode_temp_directory():
     )
 
 
+class ProbeCache:
+    """Cache of probe tools output (oiiotool info, ffprobe) of files.
+
+    Output is stored by tool, path, modification time and size of file and
+    probe options, so changed file is probed again. Most recently used
+    outputs are kept in memory, so all publish plugins running in the same
+    process share them. Outputs are also stored as json files to
+    'cache_dir' if passed, which allows to share them between processes.
+
+    Args:
+        max_items (int): Maximum of outputs kept in memory.
+        cache_dir (Optional[str]): Directory where outputs are persisted.
+    """
+
+    def __init__(self, max_items=DEFAULT_PROBE_CACHE_SIZE, cache_dir=None):
+        self._max_items = max_items
+        self._cache_dir = cache_dir
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    def get_key(self, tool, path, options=None):
+        """Key of probe output for current state of file.
+
+        Args:
+            tool (str): Probe tool name.
+            path (str): Path to probed file.
+            options (Optional[Iterable[Any]]): Options affecting output.
+
+        Returns:
+            Union[tuple, None]: Key or None if file can't be accessed.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (
+            tool,
+            os.path.normpath(os.path.abspath(path)),
+            stat.st_mtime_ns,
+            stat.st_size,
+            tuple(options or ())
+        )
+
+    def get(self, key):
+        """Cached output or None."""
+        with self._lock:
+            output = self._items.get(key)
+            if output is not None:
+                self._items.move_to_end(key)
+                return output
+
+        output = self._read_file(key)
+        if output is not None:
+            self._set_item(key, output)
+        return output
+
+    def set(self, key, output):
+        """Store output of probe tool."""
+        self._set_item(key, output)
+        self._write_file(key, output)
+
+    def clear(self):
+        """Clear outputs kept in memory."""
+        with self._lock:
+            self._items.clear()
+
+    def _set_item(self, key, output):
+        with self._lock:
+            self._items[key] = output
+            self._items.move_to_end(key)
+            while len(self._items) > self._max_items:
+                self._items.popitem(last=False)
+
+    def _get_filepath(self, key):
+        key_hash = hashlib.sha1(
+            json.dumps(key).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(self._cache_dir, "{}.json".format(key_hash))
+
+    def _read_file(self, key):
+        if not self._cache_dir:
+            return None
+        try:
+            with open(self._get_filepath(key), "r") as stream:
+                data = json.load(stream)
+        except (OSError, ValueError):
+            return None
+        # Make sure it's not hash collision
+        if data.get("key") != json.loads(json.dumps(key)):
+            return None
+        return data.get("output")
+
+    def _write_file(self, key, output):
+        if not self._cache_dir:
+            return
+        filepath = self._get_filepath(key)
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            # Write to temporary file first so other processes don't read
+            #   incomplete file
+            tmp_path = "{}.{}.tmp".format(filepath, uuid.uuid4().hex)
+            with open(tmp_path, "w") as stream:
+                json.dump({"key": key, "output": output}, stream)
+            os.replace(tmp_path, filepath)
+        except OSError:
+            logging.getLogger(__name__).debug(
+                "Failed to store probe output to \"{}\"".format(filepath),
+                exc_info=True
+            )
+
+
+_probe_cache = None
+
+
+def get_probe_cache():
+    """Probe cache shared in current process.
+
+    Outputs are persisted to directory from 'OPENPYPE_PROBE_CACHE_DIR'
+    environment variable if is set.
+
+    Returns:
+        ProbeCache: Cache of probe outputs.
+    """
+    global _probe_cache
+    if _probe_cache is None:
+        _probe_cache = ProbeCache(
+            cache_dir=os.environ.get("OPENPYPE_PROBE_CACHE_DIR") or None
+        )
+    return _probe_cache
+
+
+def set_probe_cache(cache):
+    """Replace probe cache of current process.
+
+    Args:
+        cache (Union[ProbeCache, None]): New cache, default cache is created
+            on next use if 'None' is passed.
+    """
+    global _probe_cache
+    _probe_cache = cache
+
+
+def clear_probe_cache():
+    """Clear in memory outputs of probe cache of current process."""
+    if _probe_cache is not None:
+        _probe_cache.clear()
+
+
 def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     """Call oiiotool to get information about input and return stdout.
 
-    Stdout should contain xml format string.
+    Stdout should contain xml format string. Output is cached with
+    'get_probe_cache' until the file changes.
     """
-    args = get_oiio_tool_args(
-        "oiiotool",
-        "--info",
-        "-v"
-    )
-    if subimages:
-        args.append("-a")
+    cache = get_probe_cache()
+    cache_key = cache.get_key("oiiotool", filepath, ("info", subimages))
+    output = None
+    if cache_key is not None:
+        output = cache.get(cache_key)
+
+    from_cache = output is not None
+    if not from_cache:
+        args = get_oiio_tool_args(
+            "oiiotool",
+            "--info",
+            "-v"
+        )
+        if subimages:
+            args.append("-a")
 
-    args.extend(["-i:infoformat=xml", filepath])
+        args.extend(["-i:infoformat=xml", filepath])
 
-    output = run_subprocess(args, logger=logger)
-    output = output.replace("\r\n", "\n")
+        output = run_subprocess(args, logger=logger)
+        output = output.replace("\r\n", "\n")
 
     xml_started = False
     subimages_lines = []
@@ -119,6 +290,9 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
             )
         )
 
+    if not from_cache and cache_key is not None:
+        cache.set(cache_key, output)
+
     output = []
     for subimage_lines in subimages_lines:
         xml_text = "\n".join(subimage_lines)
@@ -678,45 +852,21 @@ def convert_for_ffmpeg(
     run_subprocess(oiio_cmd, logger=logger)
 
 
-def convert_input_paths_for_ffmpeg(
-    input_paths,
-    output_dir,
-    logger=None
-):
-    """Convert source file to format supported in ffmpeg.
-
-    Currently can convert only exrs. The input filepaths should be files
-    with same type. Information about input is loaded only from first found
-    file.
-
-    Filenames of input files are kept so make sure that output directory
-    is not the same directory as input files have.
-    - This way it can handle gaps and can keep input filenames without handling
-        frame template
+def _get_ffmpeg_conversion_args(input_info, logger):
+    """Arguments of oiiotool conversion shared by all files of sequence.
 
     Args:
-        input_paths (str): Paths that should be converted. It is expected that
-            contains single file or image sequence of samy type.
-        output_dir (str): Path to directory where output will be rendered.
-            Must not be same as input's directory.
+        input_info (dict): Information about input from
+            'get_oiio_info_for_input'.
         logger (logging.Logger): Logger used for logging.
 
+    Returns:
+        tuple[list[str], str, list[str]]: Arguments before input path,
+            input argument and arguments after input path.
+
     Raises:
-        ValueError: If input filepath has extension not supported by function.
-            Currently is supported only ".exr" extension.
+        ValueError: When channels for conversion were not found.
     """
-    if logger is None:
-        logger = logging.getLogger(__name__)
-
-    first_input_path = input_paths[0]
-    ext = os.path.splitext(first_input_path)[1].lower()
-    if ext != ".exr":
-        raise ValueError((
-            "Function 'convert_for_ffmpeg' currently support only"
-            " \".exr\" extension. Got \"{}\"."
-        ).format(ext))
-
-    input_info = get_oiio_info_for_input(first_input_path, logger=logger)
 
     # Change compression only if source compression is "dwaa" or "dwab"
     #   - they're not supported in ffmpeg
@@ -750,77 +900,236 @@ def convert_input_paths_for_ffmpeg(
         # - this option is crashing if used on multipart exrs
         input_arg += ":ch={}".format(input_channels_str)
 
-    for input_path in input_paths:
-        # Prepare subprocess arguments
-        oiio_cmd = get_oiio_tool_args(
-            "oiiotool",
-            # Don't add any additional attributes
-            "--nosoftwareattrib",
-        )
-        # Add input compression if available
-        if compression:
-            oiio_cmd.extend(["--compression", compression])
+    # Prepare subprocess arguments
+    pre_input_args = get_oiio_tool_args(
+        "oiiotool",
+        # Don't add any additional attributes
+        "--nosoftwareattrib",
+    )
+    # Add input compression if available
+    if compression:
+        pre_input_args.extend(["--compression", compression])
 
-        oiio_cmd.extend([
-            input_arg, input_path,
-            # Tell oiiotool which channels should be put to top stack
-            #   (and output)
-            "--ch", channels_arg,
-            # Use first subimage
-            "--subimage", "0"
-        ])
+    post_input_args = [
+        # Tell oiiotool which channels should be put to top stack
+        #   (and output)
+        "--ch", channels_arg,
+        # Use first subimage
+        "--subimage", "0"
+    ]
 
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing unallowed symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            post_input_args.extend(["--eraseattrib", attr_name])
+
+    return pre_input_args, input_arg, post_input_args
 
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing unallowed symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
 
+def get_conversion_workers_count(max_workers=None):
+    """Amount of parallel processes used for conversion of sequences.
+
+    Args:
+        max_workers (Optional[int]): Requested amount of workers. Value
+            from 'OPENPYPE_CONVERSION_WORKERS' environment variable or
+            count of CPUs is used if not passed.
+
+    Returns:
+        int: Amount of workers, at least 1.
+    """
+
+    if not max_workers:
+        max_workers = os.environ.get("OPENPYPE_CONVERSION_WORKERS")
+    try:
+        max_workers = int(max_workers or 0)
+    except ValueError:
+        max_workers = 0
+
+    if max_workers < 1:
+        max_workers = os.cpu_count() or 1
+    return max_workers
+
+
+def run_parallel_conversions(
+    func, items, max_workers=None, logger=None, progress_callback=None
+):
+    """Call conversion function for each item in parallel.
+
+    Conversion functions are expected to launch subprocess (e.g. oiiotool
+    or ffmpeg) which does the work, so threads are used only to wait
+    for them.
+    Remaining items are not processed after first failure and the error is
+    re-raised.
+
+    Args:
+        func (Callable[[Any], None]): Function converting single item.
+        items (list[Any]): Items to convert.
+        max_workers (Optional[int]): Maximum of parallel conversions.
+            Uses 'get_conversion_workers_count' when not passed.
+        logger (Optional[logging.Logger]): Logger used for logging.
+        progress_callback (Optional[Callable[[int, int], None]]): Called
+            with count of converted items and count of all items after
+            each conversion.
+    """
+
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    total = len(items)
+    if not total:
+        return
+
+    # Log progress roughly after each 10% of items
+    log_step = max(1, total // 10)
+    done_count = 0
+
+    def _on_converted():
+        if done_count % log_step == 0 or done_count == total:
+            logger.debug("Converted {}/{}.".format(done_count, total))
+        if progress_callback is not None:
+            progress_callback(done_count, total)
+
+    max_workers = min(get_conversion_workers_count(max_workers), total)
+    if max_workers == 1:
+        for item in items:
+            func(item)
+            done_count += 1
+            _on_converted()
+        return
+
+    logger.debug("Running {} conversions with {} processes.".format(
+        total, max_workers))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        try:
+            for future in as_completed(futures):
+                future.result()
+                done_count += 1
+                _on_converted()
+        except BaseException:
+            # Don't start remaining conversions
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def convert_input_paths_for_ffmpeg(
+    input_paths,
+    output_dir,
+    logger=None,
+    max_workers=None,
+    progress_callback=None
+):
+    """Convert source file to format supported in ffmpeg.
+
+    Currently can convert only exrs. The input filepaths should be files
+    with same type. Information about input is loaded only from first found
+    file.
+
+    Filenames of input files are kept so make sure that output directory
+    is not the same directory as input files have.
+    - This way it can handle gaps and can keep input filenames without handling
+        frame template
+
+    Each file is converted by separate oiiotool process, up to 'max_workers'
+    processes are running at the same time. Remaining files are not
+    converted after first failed conversion.
+
+    Args:
+        input_paths (str): Paths that should be converted. It is expected that
+            contains single file or image sequence of samy type.
+        output_dir (str): Path to directory where output will be rendered.
+            Must not be same as input's directory.
+        logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum of parallel oiiotool processes.
+            Uses 'get_conversion_workers_count' when not passed.
+        progress_callback (Optional[Callable[[int, int], None]]): Called
+            with count of converted files and count of all files after
+            each converted file.
+
+    Raises:
+        ValueError: If input filepath has extension not supported by function.
+            Currently is supported only ".exr" extension.
+        RuntimeError: Conversion of a file failed.
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    first_input_path = input_paths[0]
+    ext = os.path.splitext(first_input_path)[1].lower()
+    if ext != ".exr":
+        raise ValueError((
+            "Function 'convert_for_ffmpeg' currently support only"
+            " \".exr\" extension. Got \"{}\"."
+        ).format(ext))
+
+    input_info = get_oiio_info_for_input(first_input_path, logger=logger)
+    pre_input_args, input_arg, post_input_args = (
+        _get_ffmpeg_conversion_args(input_info, logger)
+    )
+
+    def _convert(input_path):
         # Add last argument - path to output
         base_filename = os.path.basename(input_path)
         output_path = os.path.join(output_dir, base_filename)
-        oiio_cmd.extend([
-            "-o", output_path
-        ])
+        oiio_cmd = list(pre_input_args)
+        oiio_cmd.extend([input_arg, input_path])
+        oiio_cmd.extend(post_input_args)
+        oiio_cmd.extend(["-o", output_path])
 
         logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
         run_subprocess(oiio_cmd, logger=logger)
 
+    run_parallel_conversions(
+        _convert, input_paths, max_workers, logger, progress_callback
+    )
+
 
 # FFMPEG functions
 def get_ffprobe_data(path_to_file, logger=None):
     """Load data about entered filepath via ffprobe.
 
+    Output is cached with 'get_probe_cache' until the file changes.
+
     Args:
         path_to_file (str): absolute path
         logger (logging.Logger): injected logger, if empty new is created
     """
     if not logger:
         logger = logging.getLogger(__name__)
+
+    cache = get_probe_cache()
+    cache_key = cache.get_key("ffprobe", path_to_file)
+    if cache_key is not None:
+        output = cache.get(cache_key)
+        if output is not None:
+            return json.loads(output)
+
     logger.debug(
         "Getting information about input \"{}\".".format(path_to_file)
     )
@@ -865,7 +1174,11 @@ def get_ffprobe_data(path_to_file, logger=None):
             popen_stderr.decode("utf-8")
         ))
 
-    return json.loads(popen_stdout)
+    output = popen_stdout.decode("utf-8")
+    data = json.loads(output)
+    if cache_key is not None and popen.returncode == 0:
+        cache.set(cache_key, output)
+    return data
 
 
 def get_ffprobe_streams(path_to_file, logger=None):
@@ -1226,21 +1539,217 @@ def convert_colorspace(
         input_args (list): input arguments for oiiotool
     Raises:
         ValueError: if misconfigured
+        RuntimeError: if conversion failed
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    scheduler = ColorspaceTranscodeScheduler(logger=logger)
+    scheduler.add(
+        input_path,
+        output_path,
+        config_path,
+        source_colorspace,
+        target_colorspace=target_colorspace,
+        view=view,
+        display=display,
+        additional_command_args=additional_command_args,
+        input_args=input_args
+    )
+    scheduler.process()
+
+
+def get_colorspace_conversion_args(
+    source_colorspace,
+    target_colorspace=None,
+    view=None,
+    display=None
+):
+    """Oiiotool arguments converting image on top of stack.
+
+    Args:
+        source_colorspace (str): ocio valid color space of source files
+        target_colorspace (str): ocio valid target color space
+                    if filled, 'view' and 'display' must be empty
+        view (str): name for viewer space (ocio valid)
+        display (str): name for display-referred reference space (ocio valid)
+
+    Returns:
+        list[str]: Oiiotool arguments.
+
+    Raises:
+        ValueError: if misconfigured
+    """
+    if all([target_colorspace, view, display]):
+        raise ValueError("Colorspace and both screen and display"
+                         " cannot be set together."
+                         " Choose colorspace or screen and display")
+    if not target_colorspace and not all([view, display]):
+        raise ValueError("Both screen and display must be set.")
+
+    args = []
+    if target_colorspace:
+        args.extend(["--colorconvert",
+                     source_colorspace,
+                     target_colorspace])
+    if view and display:
+        args.extend(["--iscolorspace", source_colorspace])
+        args.extend(["--ociodisplay", display, view])
+    return args
+
+
+def _get_oiio_frame_range(path):
+    """Frame range of path in oiiotool format 'file.1001-1010#.exr'.
+
+    Returns:
+        Union[tuple[int, int], None]: Frame start and end or None if path
+            is not a sequence.
     """
-    def chunk_list(frame_start, frame_end, chunk_size):
-        """Chunk the frame numbers into groups."""
-        numbers = list(range(frame_start, frame_end + 1))
-        chunked_list = [numbers[i:i + chunk_size] for i in range(0, len(numbers), chunk_size)]
-        return chunked_list
-
-    def process_frame_group(frame_group, input_path, output_path):
-        """Process a group of frames."""
-        if '-' in input_path:
-            frame_group = f'.{frame_group[0]}-{frame_group[-1]}#.'
-            frame_regex = r'\.\d+-\d+#\.'
-            input_path = re.sub(frame_regex, frame_group, input_path)
-            output_path = re.sub(frame_regex, frame_group, output_path)
+    match = OIIO_FRAME_RANGE_REGEX.search(os.path.basename(path))
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
 
+
+def _replace_oiio_frame_range(path, frame_start, frame_end):
+    dirname, basename = os.path.split(path)
+    basename = OIIO_FRAME_RANGE_REGEX.sub(
+        ".{}-{}#.".format(frame_start, frame_end), basename, count=1
+    )
+    return os.path.join(dirname, basename)
+
+
+class ColorspaceTranscodeScheduler:
+    """Convert colorspace of multiple files to multiple outputs in parallel.
+
+    Outputs of the same input file (and same oiiotool arguments) are written
+    by single oiiotool process, so each input frame is read only once.
+    Image sequences in oiiotool frame range format
+    (e.g. 'file.1001-1100#.exr') are split to chunks of frames converted
+    by separate processes.
+
+    Files are converted on 'process'. Remaining conversions are not started
+    after first failure.
+
+    Args:
+        max_workers (Optional[int]): Maximum of parallel oiiotool processes.
+            Uses 'get_conversion_workers_count' when not passed.
+        frames_per_process (Optional[int]): Maximum of frames converted
+            by single oiiotool process.
+        logger (Optional[logging.Logger]): Logger used for logging.
+    """
+
+    def __init__(self, max_workers=None, frames_per_process=None, logger=None):
+        if logger is None:
+            logger = logging.getLogger(__name__)
+        self._log = logger
+        self._max_workers = get_conversion_workers_count(max_workers)
+        self._frames_per_process = (
+            frames_per_process or DEFAULT_FRAMES_PER_PROCESS
+        )
+        self._outputs_by_input = collections.OrderedDict()
+
+    def add(
+        self,
+        input_path,
+        output_path,
+        config_path,
+        source_colorspace,
+        target_colorspace=None,
+        view=None,
+        display=None,
+        additional_command_args=None,
+        input_args=None
+    ):
+        """Add conversion of input to output.
+
+        Arguments are the same as for 'convert_colorspace'.
+
+        Raises:
+            ValueError: if misconfigured
+        """
+        conversion_args = get_colorspace_conversion_args(
+            source_colorspace, target_colorspace, view, display
+        )
+        if _get_oiio_frame_range(input_path) != (
+            _get_oiio_frame_range(output_path)
+        ):
+            raise ValueError((
+                "Output path \"{}\" must have the same frame range as input"
+                " path \"{}\"."
+            ).format(output_path, input_path))
+
+        # Outputs can share single read of input only with the same
+        #   additional arguments, they may contain options affecting all
+        #   following outputs (e.g. '-d uint10')
+        key = (
+            input_path,
+            config_path,
+            tuple(input_args or []),
+            tuple(additional_command_args or [])
+        )
+        self._outputs_by_input.setdefault(key, []).append(
+            (output_path, conversion_args)
+        )
+
+    def process(self, progress_callback=None):
+        """Convert all added inputs.
+
+        Args:
+            progress_callback (Optional[Callable[[int, int], None]]): Called
+                with count of finished oiiotool processes and count of all
+                processes.
+
+        Raises:
+            RuntimeError: if conversion failed
+        """
+        tasks = []
+        for key, outputs in self._outputs_by_input.items():
+            tasks.extend(self._split_to_tasks(key, outputs))
+        self._outputs_by_input = collections.OrderedDict()
+
+        run_parallel_conversions(
+            self._convert,
+            tasks,
+            self._max_workers,
+            self._log,
+            progress_callback
+        )
+
+    def _split_to_tasks(self, key, outputs):
+        input_path = key[0]
+        frame_range = _get_oiio_frame_range(input_path)
+        if frame_range is None:
+            return [(key, input_path, outputs)]
+
+        frame_start, frame_end = frame_range
+        frames_count = frame_end - frame_start + 1
+        # Use smaller chunks if there is not enough frames for all workers
+        chunk_size = max(1, min(
+            self._frames_per_process,
+            -(-frames_count // self._max_workers)
+        ))
+        tasks = []
+        for chunk_start in range(frame_start, frame_end + 1, chunk_size):
+            chunk_end = min(chunk_start + chunk_size - 1, frame_end)
+            tasks.append((
+                key,
+                _replace_oiio_frame_range(input_path, chunk_start, chunk_end),
+                [
+                    (
+                        _replace_oiio_frame_range(
+                            output_path, chunk_start, chunk_end
+                        ),
+                        conversion_args
+                    )
+                    for output_path, conversion_args in outputs
+                ]
+            ))
+        return tasks
+
+    def _convert(self, task):
+        key, input_path, outputs = task
+        _, config_path, input_args, additional_command_args = key
         oiio_cmd = get_oiio_tool_args(
             "oiiotool",
             *input_args,
@@ -1249,45 +1758,21 @@ def convert_colorspace(
             "--nosoftwareattrib",
             "--colorconfig", config_path
         )
+        oiio_cmd.extend(additional_command_args)
 
-        if all([target_colorspace, view, display]):
-            raise ValueError("Colorspace and both screen and display"
-                             " cannot be set together."
-                             " Choose colorspace or screen and display")
-        if not target_colorspace and not all([view, display]):
-            raise ValueError("Both screen and display must be set.")
-
-        if additional_command_args:
-            oiio_cmd.extend(additional_command_args)
+        last_idx = len(outputs) - 1
+        for idx, (output_path, conversion_args) in enumerate(outputs):
+            # Keep input on top of stack for next outputs
+            if idx != last_idx:
+                oiio_cmd.append("--dup")
+            oiio_cmd.extend(conversion_args)
+            oiio_cmd.extend(["-o", output_path])
+            if idx != last_idx:
+                oiio_cmd.append("--pop")
 
-        if target_colorspace:
-            oiio_cmd.extend(["--colorconvert",
-                             source_colorspace,
-                             target_colorspace])
-        if view and display:
-            oiio_cmd.extend(["--iscolorspace", source_colorspace])
-            oiio_cmd.extend(["--ociodisplay", display, view])
-
-        oiio_cmd.extend(["-o", output_path])
+        self._log.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
+        run_subprocess(oiio_cmd, logger=self._log)
 
-        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-        run_subprocess(oiio_cmd, logger=logger)
-
-    if logger is None:
-        logger = logging.getLogger(__name__)
-
-    frame_data = input_path.split('.')[-2]
-    if '-' in frame_data:
-        frame_start, frame_end = frame_data[:-1].split('-')
-    else:
-        frame_start = frame_end = frame_data
-
-    frame_groups = chunk_list(int(frame_start), int(frame_end), 10)
-    pool = ThreadPool()
-    for frame_group in frame_groups:
-        pool.apply_async(process_frame_group, (frame_group, input_path, output_path))
-    pool.close()
-    pool.join()
 
 def split_cmd_args(in_args):
     """Makes sure all entered arguments are separated in individual items.
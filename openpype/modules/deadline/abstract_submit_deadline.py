@@ -6,15 +6,20 @@ It provides Deadline JobInfo data class.
 """
 import json.decoder
 import os
+import time
+import threading
 from abc import abstractmethod
 import platform
 import getpass
 from functools import partial
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import six
 import attr
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError, ConnectTimeoutError
 
 import pyblish.api
 from openpype.pipeline.publish import (
@@ -29,6 +34,56 @@ from openpype import AYON_SERVER_ENABLED
 
 JSONDecodeError = getattr(json.decoder, "JSONDecodeError", ValueError)
 
+# Number of connections to Deadline Webservice kept alive
+DEADLINE_SESSION_POOL_SIZE = 16
+# Responses of Webservice which are worth to retry
+# - 504 is not retried, Webservice could create the job after gateway timeout
+RETRY_STATUS_CODES = {502, 503}
+
+_deadline_session = None
+_deadline_session_lock = threading.Lock()
+
+
+def get_deadline_session():
+    """Shared session used for all requests to Deadline Webservice.
+
+    Connections are kept alive and reused by following requests, also
+    from multiple threads.
+
+    Returns:
+        requests.Session: Shared session.
+    """
+    global _deadline_session
+
+    with _deadline_session_lock:
+        if _deadline_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=DEADLINE_SESSION_POOL_SIZE,
+                pool_maxsize=DEADLINE_SESSION_POOL_SIZE
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _deadline_session = session
+    return _deadline_session
+
+
+def _is_request_not_sent(exc):
+    """Connection to Webservice failed before request was sent.
+
+    Args:
+        exc (requests.exceptions.ConnectionError): Raised exception.
+
+    Returns:
+        bool: Request did not reach Webservice and can be sent again.
+    """
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    reason = exc.args[0] if exc.args else None
+    # 'MaxRetryError' of urllib3 holds reason of failed connection
+    reason = getattr(reason, "reason", reason)
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
 
 def requests_post(*args, **kwargs):
     """Wrap request post method.
@@ -48,7 +103,7 @@ def requests_post(*args, **kwargs):
                                               True) else True  # noqa
     # add 10sec timeout before bailing out
     kwargs['timeout'] = 10
-    return requests.post(*args, **kwargs)
+    return get_deadline_session().post(*args, **kwargs)
 
 
 def requests_get(*args, **kwargs):
@@ -69,7 +124,7 @@ def requests_get(*args, **kwargs):
                                               True) else True  # noqa
     # add 10sec timeout before bailing out
     kwargs['timeout'] = 10
-    return requests.get(*args, **kwargs)
+    return get_deadline_session().get(*args, **kwargs)
 
 
 class DeadlineKeyValueVar(dict):
@@ -420,6 +475,11 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
     use_published = True
     asset_dependencies = False
     default_priority = 50
+    # Maximum number of concurrent submissions of independent jobs
+    submit_workers = 8
+    # Retries of submission when Webservice is not reachable
+    submit_retries = 3
+    submit_retry_delay = 1.0
 
     def __init__(self, *args, **kwargs):
         super(AbstractSubmitDeadline, self).__init__(*args, **kwargs)
@@ -591,8 +651,87 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             KnownPublishError: if submission fails.
 
         """
+        result = self._submit_payload(payload)
+
+        # for submit publish job
+        self._instance.data["deadlineSubmissionJob"] = result
+
+        return result["_id"]
+
+    def submit_payloads(self, payloads):
+        """Submit independent payloads to Deadline concurrently.
+
+        Number of concurrent submissions is limited by 'submit_workers'.
+        Result of last payload is stored to instance as result of
+        'submit' would be.
+
+        Args:
+            payloads (Iterable[dict]): Payloads which don't depend on
+                each other.
+
+        Returns:
+            list[str]: Deadline job ids in order of payloads.
+
+        Throws:
+            KnownPublishError: if any submission fails.
+
+        """
+        payloads = list(payloads)
+        if not payloads:
+            return []
+
+        workers = max(1, min(self.submit_workers, len(payloads)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._submit_payload, payload)
+                for payload in payloads
+            ]
+            try:
+                results = [future.result() for future in futures]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        self._instance.data["deadlineSubmissionJob"] = results[-1]
+        return [result["_id"] for result in results]
+
+    def _post_payload(self, url, payload):
+        """Post payload and retry if Webservice is not reachable.
+
+        Only connections which failed before request was sent and responses
+        of unavailable Webservice are retried, a job could be created
+        already if connection was lost or request timed out.
+        """
+        attempt = 0
+        while True:
+            try:
+                response = requests_post(url, json=payload)
+            except requests.exceptions.ConnectionError as exc:
+                if (
+                    attempt >= self.submit_retries
+                    or not _is_request_not_sent(exc)
+                ):
+                    raise
+                self.log.warning(
+                    "Connection to Deadline failed, retrying.", exc_info=True
+                )
+            else:
+                if (
+                    response.status_code not in RETRY_STATUS_CODES
+                    or attempt >= self.submit_retries
+                ):
+                    return response
+                self.log.warning(
+                    "Deadline responded with {}, retrying.".format(
+                        response.status_code)
+                )
+            time.sleep(self.submit_retry_delay * (2 ** attempt))
+            attempt += 1
+
+    def _submit_payload(self, payload):
         url = "{}/api/jobs".format(self._deadline_url)
-        response = requests_post(url, json=payload)
+        response = self._post_payload(url, payload)
         if not response.ok:
             self.log.error("Submission failed!")
             self.log.error(response.status_code)
@@ -601,14 +740,9 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             raise KnownPublishError(response.text)
 
         try:
-            result = response.json()
+            return response.json()
         except JSONDecodeError:
             msg = "Broken response {}. ".format(response)
             msg += "Try restarting the Deadline Webservice."
             self.log.warning(msg, exc_info=True)
             raise KnownPublishError("Broken response from DL")
-
-        # for submit publish job
-        self._instance.data["deadlineSubmissionJob"] = result
-
-        return result["_id"]
@@ -2,10 +2,12 @@ import os
 import re
 import json
 import getpass
-import requests
 import pyblish.api
 
 from openpype.modules.deadline.utils import set_custom_deadline_name, DeadlineDefaultJobAttrs
+from openpype_modules.deadline.abstract_submit_deadline import (
+    get_deadline_session
+)
 
 class CelactionSubmitDeadline(pyblish.api.InstancePlugin, DeadlineDefaultJobAttrs):
     """Submit CelAction2D scene to Deadline
@@ -199,7 +201,8 @@ class CelactionSubmitDeadline(pyblish.api.InstancePlugin, DeadlineDefaultJobAttr
         self.log.debug("__ expectedFiles: `{}`".format(
             instance.data["expectedFiles"]))
 
-        response = requests.post(self.deadline_url, json=payload)
+        response = get_deadline_session().post(
+            self.deadline_url, json=payload)
 
         if not response.ok:
             self.log.error(
@@ -4,7 +4,6 @@ import os
 import json
 import re
 from copy import deepcopy
-import requests
 import clique
 
 import pyblish.api
@@ -26,6 +25,9 @@ from openpype.pipeline.farm.pyblish_functions import (
     prepare_representations,
     create_metadata_path
 )
+from openpype_modules.deadline.abstract_submit_deadline import (
+    get_deadline_session
+)
 
 
 def get_resource_files(resources, frame_range=None):
@@ -312,7 +314,7 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin,
         self.log.debug("Submitting Deadline publish job ...")
 
         url = "{}/api/jobs".format(self.url)
-        response = requests.post(url, json=payload, timeout=10)
+        response = get_deadline_session().post(url, json=payload, timeout=10)
         if not response.ok:
             raise Exception(response.text)
 
@@ -1,8 +1,11 @@
 import requests
 import six
 import sys
+import datetime
 from pathlib import Path
 
+import click
+
 from openpype.lib import requests_get, Logger
 from openpype.modules import OpenPypeModule, IPluginPaths
 
@@ -38,6 +41,9 @@ class DeadlineModule(OpenPypeModule, IPluginPaths):
                               "not specified. Disabling module."))
             return
 
+    def cli(self, click_group):
+        click_group.add_command(cli_main)
+
     def get_plugin_folders(self, regenerate_cache=False):
         if self._plugin_folders and not regenerate_cache:
             return self._plugin_folders
@@ -176,3 +182,74 @@ class DeadlineModule(OpenPypeModule, IPluginPaths):
             return []
 
         return response.json()
+
+
+@click.group(DeadlineModule.name, help="Deadline module commands.")
+def cli_main():
+    pass
+
+
+@cli_main.group(
+    "env_cache",
+    help="Cache of environments extracted for farm tasks on this machine."
+)
+def cli_env_cache():
+    pass
+
+
+@cli_env_cache.command("list", help="List cached environments.")
+@click.option(
+    "--cache-dir",
+    help=(
+        "Cache directory. Default is OPENPYPE_DEADLINE_ENV_CACHE_DIR of this"
+        " process (not of a job) or directory in temp."
+    ),
+    default=None
+)
+@click.option(
+    "--verbose", is_flag=True, help="Print cached environment values."
+)
+def cli_env_cache_list(cache_dir, verbose):
+    from .environment_cache import (
+        get_environment_cache_dir,
+        get_cache_entries,
+    )
+
+    if cache_dir is None:
+        cache_dir = get_environment_cache_dir()
+    entries = get_cache_entries(cache_dir)
+    print("Cache directory: {}".format(cache_dir))
+    for entry in entries:
+        created = datetime.datetime.fromtimestamp(entry.get("created", 0))
+        key = entry.get("key") or {}
+        print("{}{} {} ({} variables)".format(
+            created.strftime("%Y-%m-%d %H:%M:%S"),
+            " [expired]" if entry["expired"] else "",
+            " ".join(
+                "{}={}".format(k, v) for k, v in sorted(key.items())
+            ),
+            len(entry["environment"])
+        ))
+        if verbose:
+            for env_key, env_value in sorted(entry["environment"].items()):
+                print("    {}={}".format(env_key, env_value))
+    print("{} cached environments".format(len(entries)))
+
+
+@cli_env_cache.command("clear", help="Remove cached environments.")
+@click.option(
+    "--cache-dir",
+    help=(
+        "Cache directory. Default is OPENPYPE_DEADLINE_ENV_CACHE_DIR of this"
+        " process (not of a job) or directory in temp."
+    ),
+    default=None
+)
+@click.option(
+    "--expired-only", is_flag=True, help="Remove only expired entries."
+)
+def cli_env_cache_clear(cache_dir, expired_only):
+    from .environment_cache import clear_environment_cache
+
+    removed = clear_environment_cache(cache_dir, expired_only=expired_only)
+    print("Removed {} cached environments".format(removed))
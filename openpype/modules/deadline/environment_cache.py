@@ -0,0 +1,273 @@
+"""Cache of environments extracted for Deadline farm tasks.
+
+'GlobalJobPreLoad' script of Deadline repository runs headless OpenPype
+process extracting environment for each task of a job. Extracted
+environment is stored to cache directory on worker, so next tasks of the
+same job don't have to start the process again.
+
+Cache entries are json files named by hash of cache key. Key contains job
+id, context of job (project, asset, task, application and environment
+group) and OpenPype executable, so each job extracts environment at least
+once and settings changes are used by new jobs.
+
+Cache directory is defined by 'OPENPYPE_DEADLINE_ENV_CACHE_DIR' and can be
+shared by workers, otherwise directory in temp is used for each user.
+'GlobalJobPreLoad' reads the variable from job environment first and from
+environment of the worker process, functions of this module (and the
+'env_cache' CLI commands) use only environment of current process.
+
+Entries contain secrets (e.g. credentials in environment). Default
+directory in temp is accessible only by its owner and entries in it are
+readable only by owner. Permissions of directory defined by environment
+variable are not changed, they must be managed where the directory is
+configured. Expired entries are removed when they're found.
+
+Module does not import OpenPype, the same logic is implemented in
+'GlobalJobPreLoad' which runs in Deadline's python. Keep them in sync.
+"""
+import os
+import time
+import json
+import uuid
+import getpass
+import hashlib
+import tempfile
+
+# Environment variables on workers to configure the cache
+CACHE_DIR_ENV_KEY = "OPENPYPE_DEADLINE_ENV_CACHE_DIR"
+CACHE_TTL_ENV_KEY = "OPENPYPE_DEADLINE_ENV_CACHE_TTL"
+# Entries older than one day are not used
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+CACHE_ENTRY_EXT = ".json"
+# Permissions of default cache directory and its entry files
+CACHE_DIR_MODE = 0o700
+CACHE_ENTRY_MODE = 0o600
+
+
+def _get_default_cache_dir():
+    return os.path.join(
+        tempfile.gettempdir(),
+        "openpype_deadline_env_cache_{}".format(getpass.getuser())
+    )
+
+
+def get_environment_cache_dir():
+    """Directory where extracted environments are stored.
+
+    Directory from environment variable of current process can be shared
+    network path or local path on worker. Default directory in temp is
+    created for each user.
+
+    Returns:
+        str: Path to cache directory.
+    """
+
+    cache_dir = os.environ.get(CACHE_DIR_ENV_KEY)
+    if not cache_dir:
+        cache_dir = _get_default_cache_dir()
+    return cache_dir
+
+
+def get_environment_cache_ttl():
+    """Time in seconds for which are cached environments valid.
+
+    Returns:
+        int: Time to live of cache entries, cache is disabled if is 0.
+    """
+
+    value = os.environ.get(CACHE_TTL_ENV_KEY)
+    if not value:
+        return DEFAULT_CACHE_TTL
+    try:
+        return max(0, int(value))
+    except ValueError:
+        return DEFAULT_CACHE_TTL
+
+
+def get_cache_entry_path(key_data, cache_dir=None):
+    """Path to cache entry file for cache key.
+
+    Args:
+        key_data (dict[str, str]): Data identifying extracted environment.
+        cache_dir (Optional[str]): Cache directory.
+
+    Returns:
+        str: Path to json file of cache entry.
+    """
+
+    if cache_dir is None:
+        cache_dir = get_environment_cache_dir()
+    key = json.dumps(key_data, sort_keys=True)
+    filename = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, filename + CACHE_ENTRY_EXT)
+
+
+def _read_entry(path):
+    try:
+        with open(path, "r") as stream:
+            entry = json.load(stream)
+    except (IOError, OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or "environment" not in entry:
+        return None
+    return entry
+
+
+def _is_expired(entry, ttl, now=None):
+    if now is None:
+        now = time.time()
+    return now - entry.get("created", 0) > ttl
+
+
+def _remove_entry(path):
+    try:
+        os.remove(path)
+    except OSError:
+        return False
+    return True
+
+
+def _is_default_cache_dir(dirpath):
+    return (
+        os.path.normcase(os.path.abspath(dirpath))
+        == os.path.normcase(os.path.abspath(_get_default_cache_dir()))
+    )
+
+
+def _ensure_cache_dir(dirpath, restricted):
+    if os.path.exists(dirpath):
+        return
+    try:
+        if restricted:
+            os.makedirs(dirpath, CACHE_DIR_MODE)
+        else:
+            os.makedirs(dirpath)
+    except OSError:
+        # Directory could be created by other task
+        if not os.path.isdir(dirpath):
+            raise
+        return
+    if restricted:
+        # Mode passed to 'makedirs' is affected by umask
+        os.chmod(dirpath, CACHE_DIR_MODE)
+
+
+def load_cached_environment(key_data, cache_dir=None, ttl=None):
+    """Load cached environment for cache key.
+
+    Args:
+        key_data (dict[str, str]): Data identifying extracted environment.
+        cache_dir (Optional[str]): Cache directory.
+        ttl (Optional[int]): Time to live of entries in seconds.
+
+    Returns:
+        Union[dict[str, str], None]: Environment or None if is not cached
+            or cached entry expired. Expired entry is removed.
+    """
+
+    if ttl is None:
+        ttl = get_environment_cache_ttl()
+    if not ttl:
+        return None
+
+    path = get_cache_entry_path(key_data, cache_dir)
+    entry = _read_entry(path)
+    if entry is None or entry.get("key") != key_data:
+        return None
+    if _is_expired(entry, ttl):
+        _remove_entry(path)
+        return None
+    return entry["environment"]
+
+
+def store_environment(key_data, environment, cache_dir=None):
+    """Store extracted environment to cache.
+
+    Entry is written to temporary file first and renamed, so other tasks
+    never read partially written file. Directory and file are accessible
+    only by owner if default cache directory is used.
+
+    Args:
+        key_data (dict[str, str]): Data identifying extracted environment.
+        environment (dict[str, str]): Extracted environment.
+        cache_dir (Optional[str]): Cache directory.
+
+    Returns:
+        str: Path to stored cache entry.
+    """
+
+    path = get_cache_entry_path(key_data, cache_dir)
+    dirpath = os.path.dirname(path)
+    restricted = _is_default_cache_dir(dirpath)
+    _ensure_cache_dir(dirpath, restricted)
+
+    tmp_path = "{}.{}.tmp".format(path, uuid.uuid4().hex)
+    entry = {
+        "key": key_data,
+        "created": time.time(),
+        "environment": environment,
+    }
+    # Permissions of shared directory are managed outside of the cache
+    file_mode = CACHE_ENTRY_MODE if restricted else 0o666
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, file_mode)
+    with os.fdopen(fd, "w") as stream:
+        json.dump(entry, stream)
+    os.replace(tmp_path, path)
+    return path
+
+
+def get_cache_entries(cache_dir=None, ttl=None):
+    """Entries stored in cache directory.
+
+    Args:
+        cache_dir (Optional[str]): Cache directory.
+        ttl (Optional[int]): Time to live of entries in seconds.
+
+    Returns:
+        list[dict[str, Any]]: Entries with 'path', 'key', 'created',
+            'expired' and 'environment' keys sorted by creation time.
+    """
+
+    if cache_dir is None:
+        cache_dir = get_environment_cache_dir()
+    if ttl is None:
+        ttl = get_environment_cache_ttl()
+
+    if not os.path.isdir(cache_dir):
+        return []
+
+    now = time.time()
+    output = []
+    for filename in os.listdir(cache_dir):
+        if not filename.endswith(CACHE_ENTRY_EXT):
+            continue
+        path = os.path.join(cache_dir, filename)
+        entry = _read_entry(path)
+        if entry is None:
+            continue
+        entry["path"] = path
+        entry["expired"] = _is_expired(entry, ttl, now)
+        output.append(entry)
+    output.sort(key=lambda item: item.get("created", 0))
+    return output
+
+
+def clear_environment_cache(cache_dir=None, expired_only=False, ttl=None):
+    """Remove cache entries.
+
+    Args:
+        cache_dir (Optional[str]): Cache directory.
+        expired_only (bool): Remove only expired entries.
+        ttl (Optional[int]): Time to live of entries in seconds.
+
+    Returns:
+        int: Number of removed entries.
+    """
+
+    removed = 0
+    for entry in get_cache_entries(cache_dir, ttl):
+        if expired_only and not entry["expired"]:
+            continue
+        if _remove_entry(entry["path"]):
+            removed += 1
+    return removed
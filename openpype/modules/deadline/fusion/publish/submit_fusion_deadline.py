@@ -2,7 +2,6 @@ import os
 import json
 import getpass
 
-import requests
 
 import pyblish.api
 
@@ -15,6 +14,9 @@ from openpype.lib import (
     NumberDef
 )
 from openpype.modules.deadline.utils import set_custom_deadline_name, DeadlineDefaultJobAttrs
+from openpype_modules.deadline.abstract_submit_deadline import (
+    get_deadline_session
+)
 
 
 class FusionSubmitDeadline(
@@ -249,7 +251,7 @@ class FusionSubmitDeadline(
 
         # E.g. http://192.168.0.1:8082/api/jobs
         url = "{}/api/jobs".format(deadline_url)
-        response = requests.post(url, json=payload)
+        response = get_deadline_session().post(url, json=payload)
         if not response.ok:
             raise Exception(response.text)
 
@@ -3,7 +3,6 @@ import json
 import getpass
 from datetime import datetime
 
-import requests
 
 import pyblish.api
 
@@ -12,6 +11,9 @@ from openpype.pipeline import legacy_io
 from openpype.tests.lib import is_in_tests
 from openpype.lib import is_running_from_build
 from openpype.modules.deadline.utils import DeadlineDefaultJobAttrs, get_deadline_job_profile
+from openpype_modules.deadline.abstract_submit_deadline import (
+    get_deadline_session
+)
 try:
     import hou
 except ImportError:
@@ -179,6 +181,6 @@ class HoudiniSubmitPublishDeadline(pyblish.api.ContextPlugin, DeadlineDefaultJob
 
         # E.g. http://192.168.0.1:8082/api/jobs
         url = "{}/api/jobs".format(deadline)
-        response = requests.post(url, json=payload)
+        response = get_deadline_session().post(url, json=payload)
         if not response.ok:
             raise Exception(response.text)
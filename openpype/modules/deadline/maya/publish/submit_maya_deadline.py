@@ -454,10 +454,11 @@ class MayaSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
             "Submitting tile job(s) [{}] ...".format(len(frame_payloads)))
 
         # Submit frame tile jobs
-        frame_tile_job_id = {}
-        for frame, tile_job_payload in frame_payloads.items():
-            job_id = self.submit(tile_job_payload)
-            frame_tile_job_id[frame] = job_id
+        frames = list(frame_payloads.keys())
+        job_ids = self.submit_payloads(
+            frame_payloads[frame] for frame in frames
+        )
+        frame_tile_job_id = dict(zip(frames, job_ids))
 
         # Define assembly payloads
         assembly_job_info = copy.deepcopy(job_info)
@@ -555,15 +556,11 @@ class MayaSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
             )
 
         # Submit assembly jobs
-        assembly_job_ids = []
-        num_assemblies = len(assembly_payloads)
-        for i, payload in enumerate(assembly_payloads):
-            self.log.debug(
-                "submitting assembly job {} of {}".format(i + 1,
-                                                          num_assemblies)
-            )
-            assembly_job_id = self.submit(payload)
-            assembly_job_ids.append(assembly_job_id)
+        self.log.debug(
+            "Submitting assembly job(s) [{}] ...".format(
+                len(assembly_payloads))
+        )
+        assembly_job_ids = self.submit_payloads(assembly_payloads)
 
         instance.data["assemblySubmissionJobs"] = assembly_job_ids
 
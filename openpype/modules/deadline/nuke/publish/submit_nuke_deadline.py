@@ -5,7 +5,6 @@ import getpass
 import platform
 from datetime import datetime
 
-import requests
 import pyblish.api
 
 from openpype import AYON_SERVER_ENABLED
@@ -30,6 +29,9 @@ from openpype.lib import (
 from openpype_modules.deadline import (
     get_deadline_limits_plugin
 )
+from openpype_modules.deadline.abstract_submit_deadline import (
+    get_deadline_session
+)
 
 try:
     import nuke
@@ -468,7 +470,8 @@ class NukeSubmitDeadline(pyblish.api.InstancePlugin,
 
         self.log.debug("__ expectedFiles: `{}`".format(
             self.get_attr_value(self, instance, "expectedFiles")))
-        response = requests.post(self.deadline_url, json=payload, timeout=10)
+        response = get_deadline_session().post(
+            self.deadline_url, json=payload, timeout=10)
 
         if not response.ok:
             raise Exception(response.text)
@@ -1,6 +1,8 @@
 # /usr/bin/env python3
 # -*- coding: utf-8 -*-
 import os
+import time
+import hashlib
 import tempfile
 from datetime import datetime
 import subprocess
@@ -8,6 +10,7 @@ import json
 import platform
 import uuid
 import re
+import getpass
 from Deadline.Scripting import (
     RepositoryUtils,
     FileUtils,
@@ -23,6 +26,16 @@ VERSION_REGEX = re.compile(
     r"(?:\+(?P<buildmetadata>[a-zA-Z\d\-.]*))?"
 )
 
+# Cache of extracted environments
+# - keep in sync with 'openpype/modules/deadline/environment_cache.py'
+ENV_CACHE_DIR_ENV_KEY = "OPENPYPE_DEADLINE_ENV_CACHE_DIR"
+ENV_CACHE_TTL_ENV_KEY = "OPENPYPE_DEADLINE_ENV_CACHE_TTL"
+DEFAULT_ENV_CACHE_TTL = 24 * 60 * 60
+# Entries contain secrets, only owner can access default cache directory
+# - permissions of directory from environment are managed outside of cache
+ENV_CACHE_DIR_MODE = 0o700
+ENV_CACHE_ENTRY_MODE = 0o600
+
 
 class OpenPypeVersion:
     """Fake semver version class for OpenPype version purposes.
@@ -286,6 +299,163 @@ def get_requested_openpype_executable(
     return FileUtils.SearchFileList(";".join(exe_list))
 
 
+def get_default_env_cache_dir():
+    return os.path.join(
+        tempfile.gettempdir(),
+        "openpype_deadline_env_cache_{}".format(getpass.getuser())
+    )
+
+
+def get_env_cache_dir(job):
+    """Cache directory from job environment, worker environment or default.
+
+    OpenPype 'env_cache' CLI commands use only environment of the process.
+    """
+    cache_dir = (
+        job.GetJobEnvironmentKeyValue(ENV_CACHE_DIR_ENV_KEY)
+        or os.environ.get(ENV_CACHE_DIR_ENV_KEY)
+    )
+    if not cache_dir:
+        cache_dir = get_default_env_cache_dir()
+    return cache_dir
+
+
+def get_env_cache_ttl():
+    try:
+        return max(0, int(os.environ[ENV_CACHE_TTL_ENV_KEY]))
+    except (KeyError, ValueError):
+        return DEFAULT_ENV_CACHE_TTL
+
+
+def get_env_cache_path(cache_dir, key_data):
+    key = json.dumps(key_data, sort_keys=True)
+    filename = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, filename + ".json")
+
+
+def load_cached_environment(cache_dir, key_data):
+    """Environment extracted by previous task of the job or None."""
+    ttl = get_env_cache_ttl()
+    if not ttl:
+        return None
+
+    path = get_env_cache_path(cache_dir, key_data)
+    try:
+        with open(path, "r") as stream:
+            entry = json.load(stream)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict) or entry.get("key") != key_data:
+        return None
+
+    if time.time() - entry.get("created", 0) > ttl:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+    print(">>> Using cached environment {}".format(path))
+    return entry.get("environment")
+
+
+def store_environment(cache_dir, key_data, environment):
+    """Store extracted environment for next tasks of the job."""
+    if not get_env_cache_ttl():
+        return
+
+    path = get_env_cache_path(cache_dir, key_data)
+    tmp_path = "{}.{}.tmp".format(path, uuid.uuid4().hex)
+    restricted = (
+        os.path.normcase(os.path.abspath(cache_dir))
+        == os.path.normcase(os.path.abspath(get_default_env_cache_dir()))
+    )
+    try:
+        if not os.path.isdir(cache_dir):
+            if restricted:
+                os.makedirs(cache_dir, ENV_CACHE_DIR_MODE)
+                # Mode passed to 'makedirs' is affected by umask
+                os.chmod(cache_dir, ENV_CACHE_DIR_MODE)
+            else:
+                os.makedirs(cache_dir)
+        fd = os.open(
+            tmp_path,
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+            ENV_CACHE_ENTRY_MODE if restricted else 0o666
+        )
+        with os.fdopen(fd, "w") as stream:
+            json.dump({
+                "key": key_data,
+                "created": time.time(),
+                "environment": environment,
+            }, stream)
+        os.replace(tmp_path, path)
+        print(">>> Environment stored to cache {}".format(path))
+    except (IOError, OSError) as exc:
+        # Cache is optional, failure should not fail the task
+        print(">>> Failed to store environment to cache: {}".format(exc))
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def extract_openpype_environment(deadlinePlugin, job, exe, add_kwargs):
+    """Run headless OpenPype process to extract environment of job context.
+
+    Returns:
+        dict[str, str]: Extracted environment.
+    """
+    # tempfile.TemporaryFile cannot be used because of locking
+    temp_file_name = "{}_{}.json".format(
+        datetime.utcnow().strftime('%Y%m%d%H%M%S%f'),
+        str(uuid.uuid1())
+    )
+    export_url = os.path.join(tempfile.gettempdir(), temp_file_name)
+    print(">>> Temporary path: {}".format(export_url))
+
+    args = [
+        "--headless",
+        "extractenvironments",
+        export_url
+    ]
+
+    if job.GetJobEnvironmentKeyValue('IS_TEST'):
+        args.append("--automatic-tests")
+
+    for key, value in add_kwargs.items():
+        args.extend(["--{}".format(key), value])
+
+    openpype_mongo = job.GetJobEnvironmentKeyValue("OPENPYPE_MONGO")
+    if openpype_mongo:
+        # inject env var for OP extractenvironments
+        # SetEnvironmentVariable is important, not SetProcessEnv...
+        deadlinePlugin.SetEnvironmentVariable("OPENPYPE_MONGO",
+                                              openpype_mongo)
+
+    if not os.environ.get("OPENPYPE_MONGO"):
+        print(">>> Missing OPENPYPE_MONGO env var, process won't work")
+
+    os.environ["AVALON_TIMEOUT"] = "5000"
+
+    args_str = subprocess.list2cmdline(args)
+    print(">>> Executing: {} {}".format(exe, args_str))
+    process_exitcode = deadlinePlugin.RunProcess(
+        exe, args_str, os.path.dirname(exe), -1
+    )
+
+    if process_exitcode != 0:
+        raise RuntimeError(
+            "Failed to run OpenPype process to extract environments."
+        )
+
+    print(">>> Loading file ...")
+    with open(export_url) as fp:
+        contents = json.load(fp)
+
+    print(">>> Removing temporary file")
+    os.remove(export_url)
+    return contents
+
+
 def inject_openpype_environment(deadlinePlugin):
     """ Pull env vars from OpenPype and push them to rendering process.
 
@@ -321,20 +491,6 @@ def inject_openpype_environment(deadlinePlugin):
 
         print("--- OpenPype executable: {}".format(exe))
 
-        # tempfile.TemporaryFile cannot be used because of locking
-        temp_file_name = "{}_{}.json".format(
-            datetime.utcnow().strftime('%Y%m%d%H%M%S%f'),
-            str(uuid.uuid1())
-        )
-        export_url = os.path.join(tempfile.gettempdir(), temp_file_name)
-        print(">>> Temporary path: {}".format(export_url))
-
-        args = [
-            "--headless",
-            "extractenvironments",
-            export_url
-        ]
-
         add_kwargs = {
             "project": job.GetJobEnvironmentKeyValue("AVALON_PROJECT"),
             "asset": job.GetJobEnvironmentKeyValue("AVALON_ASSET"),
@@ -343,44 +499,26 @@ def inject_openpype_environment(deadlinePlugin):
             "envgroup": "farm"
         }
 
-        if job.GetJobEnvironmentKeyValue('IS_TEST'):
-            args.append("--automatic-tests")
-
-        if all(add_kwargs.values()):
-            for key, value in add_kwargs.items():
-                args.extend(["--{}".format(key), value])
-        else:
+        if not all(add_kwargs.values()):
             raise RuntimeError((
                 "Missing required env vars: AVALON_PROJECT, AVALON_ASSET,"
                 " AVALON_TASK, AVALON_APP_NAME"
             ))
 
-        openpype_mongo = job.GetJobEnvironmentKeyValue("OPENPYPE_MONGO")
-        if openpype_mongo:
-            # inject env var for OP extractenvironments
-            # SetEnvironmentVariable is important, not SetProcessEnv...
-            deadlinePlugin.SetEnvironmentVariable("OPENPYPE_MONGO",
-                                                  openpype_mongo)
-
-        if not os.environ.get("OPENPYPE_MONGO"):
-            print(">>> Missing OPENPYPE_MONGO env var, process won't work")
-
-        os.environ["AVALON_TIMEOUT"] = "5000"
-
-        args_str = subprocess.list2cmdline(args)
-        print(">>> Executing: {} {}".format(exe, args_str))
-        process_exitcode = deadlinePlugin.RunProcess(
-            exe, args_str, os.path.dirname(exe), -1
-        )
-
-        if process_exitcode != 0:
-            raise RuntimeError(
-                "Failed to run OpenPype process to extract environments."
+        # Environment is extracted only by first task of the job on worker
+        cache_dir = get_env_cache_dir(job)
+        cache_key_data = dict(add_kwargs)
+        cache_key_data.update({
+            "job_id": job.JobId,
+            "executable": exe,
+            "is_test": job.GetJobEnvironmentKeyValue("IS_TEST") or "",
+        })
+        contents = load_cached_environment(cache_dir, cache_key_data)
+        if contents is None:
+            contents = extract_openpype_environment(
+                deadlinePlugin, job, exe, add_kwargs
             )
-
-        print(">>> Loading file ...")
-        with open(export_url) as fp:
-            contents = json.load(fp)
+            store_environment(cache_dir, cache_key_data, contents)
 
         for key, value in contents.items():
             deadlinePlugin.SetProcessEnvironmentVariable(key, value)
@@ -391,9 +529,6 @@ def inject_openpype_environment(deadlinePlugin):
             print(">>> Setting script path {}".format(script_url))
             job.SetJobPluginInfoKeyValue("ScriptFilename", script_url)
 
-        print(">>> Removing temporary file")
-        os.remove(export_url)
-
         print(">> Injection end.")
     except Exception as e:
         if hasattr(e, "output"):
@@ -41,6 +41,8 @@ class SyncToAvalonServer(ServerAction):
     description = "Send data from Ftrack to Avalon"
     role_list = {"Pypeclub", "Administrator", "Project Manager"}
     settings_key = "sync_to_avalon"
+    # Synchronize only entities changed since last synchronization
+    incremental = False
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -134,7 +136,9 @@ class SyncToAvalonServer(ServerAction):
         self.show_message(event, "Synchronization - Preparing data", True)
 
         try:
-            output = self.entities_factory.launch_setup(project_name)
+            output = self.entities_factory.launch_setup(
+                project_name, self.incremental
+            )
             if output is not None:
                 return output
 
@@ -221,6 +225,21 @@ class SyncToAvalonServer(ServerAction):
                 pass
 
 
+class SyncToAvalonIncrementalServer(SyncToAvalonServer):
+    """Synchronize only entities changed since last synchronization.
+
+    Changes are collected from events stored by event server. Whole project
+    is synchronized if stored events don't cover time since last
+    synchronization.
+    """
+
+    identifier = "sync.to.avalon.server.incremental"
+    variant = "- Sync To Avalon Incremental (Server)"
+    description = "Send changed data from Ftrack to Avalon"
+    incremental = True
+
+
 def register(session):
     '''Register plugin. Called when used as an plugin.'''
     SyncToAvalonServer(session).register()
+    SyncToAvalonIncrementalServer(session).register()
@@ -4,7 +4,6 @@ import logging
 import getpass
 import atexit
 import threading
-import datetime
 import time
 import queue
 import collections
@@ -25,6 +24,11 @@ try:
 except ImportError:
     from ftrack_api._weakref import WeakMethod
 from openpype_modules.ftrack.lib import get_ftrack_event_mongo_info
+from openpype_modules.ftrack.ftrack_server.processor_events import (
+    ensure_processed_events_ttl_index,
+    EventAcknowledger,
+    UnprocessedEventsReader,
+)
 
 from openpype.client import OpenPypeMongoConnection
 from openpype.lib import Logger
@@ -117,9 +121,17 @@ class ProcessEventHub(SocketBaseEventHub):
     is_collection_created = False
     pypelog = Logger.get_logger("Session Processor")
 
+    # Maximum number of events loaded at once
+    events_page_size = 100
+    # Handled events are marked as processed in batches
+    ack_batch_size = 50
+    ack_flush_interval = 1.0
+
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
+        self.events_reader = None
+        self.acknowledger = None
 
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
@@ -147,59 +159,64 @@ class ProcessEventHub(SocketBaseEventHub):
 
     def wait(self, duration=None):
         """Overridden wait
-        Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        Event are loaded from Mongo DB when queue is empty. Handled events are
+        set as processed in Mongo DB in batches.
         """
         started = time.time()
         self.prepare_dbcon()
+        ensure_processed_events_ttl_index(self.dbcon, self.pypelog)
+        self.events_reader = UnprocessedEventsReader(
+            self.dbcon, self.events_page_size, log=self.pypelog
+        )
+        self.acknowledger = EventAcknowledger(
+            self.dbcon, self.ack_batch_size, self.ack_flush_interval
+        )
+        try:
+            self._process_events(started, duration)
+        finally:
+            self.events_reader.close()
+
+    def _process_events(self, started, duration):
         while True:
             try:
                 event = self._event_queue.get(timeout=0.1)
             except queue.Empty:
-                if not self.load_events():
-                    time.sleep(0.5)
+                try:
+                    self.acknowledger.flush()
+                    # Blocks until new events are stored
+                    self.load_events()
+                except pymongo.errors.AutoReconnect:
+                    self._exit_not_responding()
             else:
                 try:
                     self._handle(event)
 
                     mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
-                        continue
-
-                    self.dbcon.update_one(
-                        {"_id": mongo_id},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
+                    if mongo_id is not None:
+                        self.acknowledger.add(mongo_id)
 
                 except pymongo.errors.AutoReconnect:
-                    self.pypelog.error((
-                        "Mongo server \"{}\" is not responding, exiting."
-                    ).format(os.environ["OPENPYPE_MONGO"]))
-                    sys.exit(0)
+                    self._exit_not_responding()
                 # Additional special processing of events.
                 if event['topic'] == 'ftrack.meta.disconnected':
+                    self.acknowledger.flush()
                     break
 
             if duration is not None:
                 if (time.time() - started) > duration:
+                    self.acknowledger.flush()
                     break
 
+    def _exit_not_responding(self):
+        self.pypelog.error((
+            "Mongo server \"{}\" is not responding, exiting."
+        ).format(os.environ["OPENPYPE_MONGO"]))
+        sys.exit(0)
+
     def load_events(self):
         """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
-        self.dbcon.delete_many({
-            "pype_data.stored": {"$lte": ago_date},
-            "pype_data.is_processed": True
-        })
-
-        not_processed_events = self.dbcon.find(
-            {"pype_data.is_processed": False}
-        ).sort(
-            [("pype_data.stored", pymongo.ASCENDING)]
-        ).limit(100)
-
         found = False
-        for event_data in not_processed_events:
+        for event_data in self.events_reader.read_events():
             new_event_data = {
                 k: v for k, v in event_data.items()
                 if k not in ["_id", "pype_data"]
@@ -0,0 +1,282 @@
+"""Reading of stored ftrack events for event processor.
+
+Events are stored to Mongo collection by event storer and processor handles
+not processed events in order in which they were stored.
+
+Processor does not poll the collection when there is nothing to process.
+Backlog of not processed events is read in pages, using last read event as
+start of next page, and new events are received from Mongo change stream
+which blocks until an event is stored. Change streams are available only on
+replica sets, polling of new events is used if they are not available.
+
+Handled events are marked as processed in batches and processed events are
+removed by TTL index.
+"""
+import time
+import datetime
+import collections
+
+import pymongo
+from pymongo.errors import PyMongoError
+
+from openpype.lib import Logger
+
+# Processed events are removed after 3 days
+PROCESSED_EVENTS_TTL = 3 * 24 * 60 * 60
+TTL_INDEX_NAME = "pype_data_processed_at_ttl"
+
+
+def ensure_processed_events_ttl_index(collection, log=None):
+    """Create TTL index removing processed events.
+
+    Processed events stored before TTL index existed don't have processed
+    date, these are removed once.
+
+    Args:
+        collection (pymongo.collection.Collection): Events collection.
+        log (Optional[logging.Logger]): Logger object.
+    """
+
+    try:
+        collection.create_index(
+            "pype_data.processed_at",
+            name=TTL_INDEX_NAME,
+            expireAfterSeconds=PROCESSED_EVENTS_TTL
+        )
+        ago_date = datetime.datetime.utcnow() - datetime.timedelta(
+            seconds=PROCESSED_EVENTS_TTL)
+        collection.delete_many({
+            "pype_data.stored": {"$lte": ago_date},
+            "pype_data.is_processed": True,
+            "pype_data.processed_at": {"$exists": False}
+        })
+    except PyMongoError:
+        if log is not None:
+            log.warning(
+                "Failed to create TTL index of processed events.",
+                exc_info=True
+            )
+
+
+class EventAcknowledger:
+    """Mark handled events as processed in batches.
+
+    Args:
+        collection (pymongo.collection.Collection): Events collection.
+        batch_size (int): Flush when this count of events is waiting.
+        flush_interval (float): Flush when this time in seconds passed
+            since first waiting event.
+    """
+
+    def __init__(self, collection, batch_size=50, flush_interval=1.0):
+        self._collection = collection
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._ids = []
+        self._first_added = None
+
+    @property
+    def pending_count(self):
+        return len(self._ids)
+
+    def add(self, event_id):
+        """Add handled event and flush if batch is full or due.
+
+        Args:
+            event_id (ObjectId): Mongo id of handled event.
+        """
+
+        if not self._ids:
+            self._first_added = time.time()
+        self._ids.append(event_id)
+        if (
+            len(self._ids) >= self._batch_size
+            or time.time() - self._first_added >= self._flush_interval
+        ):
+            self.flush()
+
+    def flush(self):
+        """Mark waiting events as processed.
+
+        Returns:
+            int: Number of acknowledged events.
+        """
+
+        if not self._ids:
+            return 0
+
+        event_ids, self._ids = self._ids, []
+        processed_at = datetime.datetime.utcnow()
+        self._collection.bulk_write(
+            [
+                pymongo.UpdateOne(
+                    {"_id": event_id},
+                    {"$set": {
+                        "pype_data.is_processed": True,
+                        "pype_data.processed_at": processed_at,
+                    }}
+                )
+                for event_id in event_ids
+            ],
+            ordered=False
+        )
+        return len(event_ids)
+
+
+class UnprocessedEventsReader:
+    """Read not processed events in order in which they were stored.
+
+    Change stream is opened before backlog is read, so events stored while
+    backlog is read are not missed. Events received from both are
+    deduplicated.
+
+    Args:
+        collection (pymongo.collection.Collection): Events collection.
+        page_size (int): Maximum number of events returned at once.
+        wait_timeout (float): How long in seconds should 'read_events'
+            wait for new events.
+        log (Optional[logging.Logger]): Logger object.
+    """
+
+    # Number of remembered ids of read events used for deduplication
+    max_remembered_ids = 10000
+
+    def __init__(self, collection, page_size=100, wait_timeout=0.5, log=None):
+        if log is None:
+            log = Logger.get_logger(self.__class__.__name__)
+        self.log = log
+        self._collection = collection
+        self._page_size = page_size
+        self._wait_timeout = wait_timeout
+        self._stream = None
+        self._stream_supported = True
+        self._backlog_done = False
+        self._last_position = None
+        self._read_ids = set()
+        self._read_ids_order = collections.deque()
+
+    @property
+    def stream_supported(self):
+        """Change stream is used to receive new events."""
+
+        return self._stream_supported
+
+    def read_events(self):
+        """Read next page of not processed events.
+
+        Backlog is returned in pages first. Then call blocks until new events
+        are stored or until 'wait_timeout' passed.
+
+        Returns:
+            list[dict]: Event documents.
+        """
+
+        if self._stream is None and self._stream_supported:
+            self._open_stream()
+
+        if not self._backlog_done:
+            events = self._read_backlog_page()
+            if len(events) < self._page_size and self._stream_supported:
+                self._backlog_done = True
+            if events:
+                return events
+
+        if not self._stream_supported:
+            events = self._read_backlog_page()
+            if not events:
+                time.sleep(self._wait_timeout)
+            return events
+
+        try:
+            return self._read_stream()
+        except PyMongoError:
+            self.log.warning(
+                "Change stream of events failed, reading backlog.",
+                exc_info=True
+            )
+            self.close()
+            self._backlog_done = False
+        return []
+
+    def close(self):
+        """Close change stream."""
+
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except PyMongoError:
+                pass
+        self._stream = None
+
+    def _remember(self, event_doc):
+        """Remember id of read event.
+
+        Returns:
+            bool: Event was not read yet.
+        """
+
+        event_id = event_doc["_id"]
+        if event_id in self._read_ids:
+            return False
+        self._read_ids.add(event_id)
+        self._read_ids_order.append(event_id)
+        while len(self._read_ids_order) > self.max_remembered_ids:
+            self._read_ids.discard(self._read_ids_order.popleft())
+        return True
+
+    def _read_backlog_page(self):
+        query_filter = {"pype_data.is_processed": False}
+        if self._last_position is not None:
+            stored, event_id = self._last_position
+            query_filter["$or"] = [
+                {"pype_data.stored": {"$gt": stored}},
+                {"pype_data.stored": stored, "_id": {"$gt": event_id}},
+            ]
+
+        cursor = self._collection.find(query_filter).sort([
+            ("pype_data.stored", pymongo.ASCENDING),
+            ("_id", pymongo.ASCENDING),
+        ]).limit(self._page_size)
+
+        events = []
+        for event_doc in cursor:
+            self._last_position = (
+                event_doc["pype_data"]["stored"], event_doc["_id"]
+            )
+            if self._remember(event_doc):
+                events.append(event_doc)
+        return events
+
+    def _open_stream(self):
+        self.close()
+        try:
+            self._stream = self._collection.watch(
+                [{"$match": {
+                    "operationType": {"$in": ["insert", "replace"]},
+                    "fullDocument.pype_data.is_processed": False
+                }}],
+                max_await_time_ms=int(self._wait_timeout * 1000)
+            )
+        except PyMongoError:
+            self.log.info((
+                "Change streams are not available, new events"
+                " will be polled."
+            ), exc_info=True)
+            self._stream_supported = False
+            self._stream = None
+
+    def _read_stream(self):
+        events = []
+        while self._stream.alive and len(events) < self._page_size:
+            change = self._stream.try_next()
+            if change is None:
+                break
+            event_doc = change.get("fullDocument")
+            if event_doc and self._remember(event_doc):
+                events.append(event_doc)
+
+        if not self._stream.alive:
+            # Stream was invalidated, read backlog and open new stream
+            self.close()
+            self._backlog_done = False
+        return events
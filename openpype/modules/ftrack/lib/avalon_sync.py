@@ -3,10 +3,12 @@ import json
 import collections
 import copy
 import numbers
+import datetime
 
 import six
 
 from openpype.client import (
+    OpenPypeMongoConnection,
     get_project,
     get_assets,
     get_archived_assets,
@@ -25,14 +27,25 @@ from openpype.pipeline import AvalonMongoDB, schema
 
 from .constants import CUST_ATTR_ID_KEY, FPS_KEYS
 from .custom_attributes import get_openpype_attr, query_custom_attributes
+from .settings import get_ftrack_event_mongo_info
+from .storer_runs import are_events_stored_since
 
 from bson.objectid import ObjectId
 from bson.errors import InvalidId
-from pymongo import UpdateOne, ReplaceOne
+from pymongo import (
+    InsertOne,
+    UpdateOne,
+    UpdateMany,
+    ReplaceOne,
+    DeleteMany,
+)
 import ftrack_api
 
 log = Logger.get_logger(__name__)
 
+# Collection in ftrack events database with dates of last synchronization
+SYNC_STATE_COLLECTION_NAME = "ftrack_sync_state"
+
 
 class InvalidFpsValue(Exception):
     pass
@@ -381,6 +394,106 @@ def get_hierarchical_attributes_values(
     return hier_values
 
 
+def _get_sync_state_collection():
+    database_name, _ = get_ftrack_event_mongo_info()
+    mongo_client = OpenPypeMongoConnection.get_mongo_client()
+    return mongo_client[database_name][SYNC_STATE_COLLECTION_NAME]
+
+
+def get_last_sync_date(project_name):
+    """Date of last successful synchronization of project to avalon.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        Union[datetime.datetime, None]: Date (UTC) when last successful
+            synchronization started or None if project was not synchronized.
+    """
+
+    doc = _get_sync_state_collection().find_one({"project": project_name})
+    if doc:
+        return doc.get("last_sync")
+    return None
+
+
+def set_last_sync_date(project_name, sync_date):
+    """Store date of successful synchronization of project to avalon.
+
+    Args:
+        project_name (str): Name of project.
+        sync_date (datetime.datetime): Date (UTC) when synchronization
+            started.
+    """
+
+    _get_sync_state_collection().update_one(
+        {"project": project_name},
+        {"$set": {"last_sync": sync_date}},
+        upsert=True
+    )
+
+
+def _get_events_collection():
+    database_name, collection_name = get_ftrack_event_mongo_info()
+    mongo_client = OpenPypeMongoConnection.get_mongo_client()
+    return mongo_client[database_name][collection_name]
+
+
+def get_changed_ftrack_ids(ft_project_id, since):
+    """Ids of ftrack entities changed since passed date.
+
+    Changes are collected from 'ftrack.update' events stored by event server.
+
+    Args:
+        ft_project_id (str): Id of ftrack project.
+        since (datetime.datetime): Date (UTC) from which are changes
+            collected.
+
+    Returns:
+        Union[set[str], None]: Ids of changed entities, None when stored
+            events don't cover the whole time since passed date.
+    """
+
+    # Events are missing if event storer was not running whole time
+    if not are_events_stored_since(since):
+        return None
+
+    dbcon = _get_events_collection()
+    # Older events may be already removed
+    oldest_event = dbcon.find_one(
+        {},
+        {"pype_data.stored": True},
+        sort=[("pype_data.stored", 1)]
+    )
+    if not oldest_event or oldest_event["pype_data"]["stored"] > since:
+        return None
+
+    changed_ids = set()
+    event_docs = dbcon.find(
+        {
+            "topic": "ftrack.update",
+            "pype_data.stored": {"$gt": since},
+            "data.entities.parents.entityId": ft_project_id
+        },
+        {
+            "data.entities.entityId": True,
+            "data.entities.entityType": True,
+            "data.entities.parents.entityId": True
+        }
+    )
+    for event_doc in event_docs:
+        for ent_info in event_doc["data"]["entities"]:
+            if ent_info.get("entityType") not in ("show", "task"):
+                continue
+            parent_ids = {
+                parent.get("entityId")
+                for parent in ent_info.get("parents") or []
+            }
+            if ft_project_id in parent_ids:
+                changed_ids.add(ent_info["entityId"])
+    return changed_ids
+
+
 class SyncEntitiesFactory:
     dbcon = AvalonMongoDB()
 
@@ -414,7 +527,16 @@ class SyncEntitiesFactory:
         self._api_key = session.api_key
         self._api_user = session.api_user
 
-    def launch_setup(self, project_full_name):
+    def launch_setup(self, project_full_name, incremental=False):
+        """Prepare ftrack entities for synchronization.
+
+        Args:
+            project_full_name (str): Name of synchronized project.
+            incremental (bool): Synchronize only entities changed since last
+                successful synchronization with their children. Whole
+                project is synchronized if changes can't be collected.
+        """
+
         try:
             self.session.close()
         except Exception:
@@ -440,6 +562,10 @@ class SyncEntitiesFactory:
         self.project_created = False
         self.unarchive_list = []
         self.updates = collections.defaultdict(dict)
+        self.mongo_operations = []
+
+        self.sync_started = datetime.datetime.utcnow()
+        self.changed_ftrack_ids = None
 
         self.avalon_project = None
         self.avalon_entities = None
@@ -534,10 +660,30 @@ class SyncEntitiesFactory:
             "tasks": {}
         })
 
-        # Find all entities in project
-        all_project_entities = self.session.query(
-            self.entities_query.format(ft_project_id)
-        ).all()
+        changed_ids = None
+        if incremental:
+            changed_ids = self._get_incremental_ids(
+                ft_project_id, project_full_name
+            )
+            if changed_ids is not None and not changed_ids:
+                msg = (
+                    "Project \"{}\" did not change since last synchronization"
+                ).format(project_full_name)
+                self.log.info(msg)
+                set_last_sync_date(project_full_name, self.sync_started)
+                return {"success": True, "message": msg}
+
+        if changed_ids is None:
+            # Find all entities in project
+            all_project_entities = self.session.query(
+                self.entities_query.format(ft_project_id)
+            ).all()
+        else:
+            all_project_entities = self._query_changed_entities(
+                ft_project_id, project_full_name, changed_ids
+            )
+        self.changed_ftrack_ids = changed_ids
+
         task_types = self.session.query("select id, name from Type").all()
         task_type_names_by_id = {
             task_type["id"]: task_type["name"]
@@ -579,6 +725,124 @@ class SyncEntitiesFactory:
         self.ft_project_id = ft_project_id
         self.entities_dict = entities_dict
 
+    def _get_incremental_ids(self, ft_project_id, project_name):
+        last_sync_date = get_last_sync_date(project_name)
+        if last_sync_date is None:
+            self.log.info((
+                "Project \"{}\" was not synchronized yet."
+                " Synchronizing whole project."
+            ).format(project_name))
+            return None
+
+        changed_ids = get_changed_ftrack_ids(ft_project_id, last_sync_date)
+        if changed_ids is None:
+            self.log.info((
+                "Stored events don't cover changes since last synchronization"
+                " of \"{}\". Synchronizing whole project."
+            ).format(project_name))
+
+        elif ft_project_id in changed_ids:
+            # Project attributes are propagated to all entities
+            self.log.info((
+                "Project \"{}\" entity changed."
+                " Synchronizing whole project."
+            ).format(project_name))
+            return None
+        return changed_ids
+
+    def _query_changed_entities(
+        self, ft_project_id, project_name, changed_ids
+    ):
+        """Query changed entities with their children and parents.
+
+        Parents are queried to be able to resolve hierarchy and inherited
+        attributes. Parents of changed entities in avalon are queried too,
+        as entity could be moved or removed in ftrack. All tasks of queried
+        entities are queried, as tasks are stored on parent asset document.
+        """
+
+        self.log.debug((
+            "Synchronizing {} changed entities of project \"{}\""
+        ).format(len(changed_ids), project_name))
+
+        seed_ids = set(changed_ids)
+        asset_docs = get_assets(
+            project_name, fields=["_id", "data.ftrackId", "data.visualParent"]
+        )
+        ftrack_id_by_mongo_id = {}
+        parent_ids_by_ftrack_id = {}
+        for asset_doc in asset_docs:
+            data = asset_doc.get("data") or {}
+            ftrack_id = data.get("ftrackId")
+            ftrack_id_by_mongo_id[asset_doc["_id"]] = ftrack_id
+            parent_ids_by_ftrack_id[ftrack_id] = data.get("visualParent")
+
+        for ftrack_id in changed_ids:
+            parent_id = parent_ids_by_ftrack_id.get(ftrack_id)
+            parent_ftrack_id = ftrack_id_by_mongo_id.get(parent_id)
+            if parent_ftrack_id:
+                seed_ids.add(parent_ftrack_id)
+
+        # Changed entities and their parents
+        context_ids = set()
+        for chunk in create_chunks(seed_ids):
+            entities = self.session.query((
+                "select id, link from TypedContext"
+                " where project_id is \"{}\" and id in ({})"
+            ).format(ft_project_id, join_query_keys(chunk))).all()
+            for entity in entities:
+                for link in entity["link"]:
+                    context_ids.add(link["id"])
+        context_ids.discard(ft_project_id)
+
+        entities_query = self.entities_query.format(ft_project_id)
+        entities_by_id = {}
+        for chunk in create_chunks(context_ids):
+            for entity in self.session.query((
+                "{} and id in ({})"
+            ).format(entities_query, join_query_keys(chunk))).all():
+                entities_by_id[entity["id"]] = entity
+
+        # Children of changed entities
+        for chunk in create_chunks(changed_ids):
+            for entity in self.session.query((
+                "{} and ancestors any (id in ({}))"
+            ).format(entities_query, join_query_keys(chunk))).all():
+                entities_by_id[entity["id"]] = entity
+
+        parent_ids = {
+            entity_id
+            for entity_id, entity in entities_by_id.items()
+            if entity.entity_type.lower() != "task"
+        }
+        for chunk in create_chunks(parent_ids):
+            for entity in self.session.query((
+                "select id, name, type_id, parent_id"
+                " from Task where parent_id in ({})"
+            ).format(join_query_keys(chunk))).all():
+                entities_by_id[entity["id"]] = entity
+
+        return list(entities_by_id.values())
+
+    def _is_in_changed_hierarchy(self, mongo_id):
+        """Avalon entity is changed entity or is under changed entity."""
+
+        if self.changed_ftrack_ids is None:
+            return True
+
+        visited_ids = set()
+        while mongo_id is not None and mongo_id not in visited_ids:
+            visited_ids.add(mongo_id)
+            av_ent = self.avalon_ents_by_id.get(mongo_id)
+            if not av_ent:
+                break
+            data = av_ent.get("data") or {}
+            if data.get("ftrackId") in self.changed_ftrack_ids:
+                return True
+            parent_id = data.get("visualParent")
+            mongo_id = str(parent_id) if parent_id is not None else None
+        return False
+
     @property
     def project_name(self):
         return self.entities_dict[self.ft_project_id]["name"]
@@ -1553,6 +1817,9 @@ class SyncEntitiesFactory:
         for mongo_id in self.avalon_ents_by_id:
             if mongo_id in avalon_ftrack_mapper:
                 continue
+            # Entities out of changed hierarchy were not queried from ftrack
+            if not self._is_in_changed_hierarchy(mongo_id):
+                continue
             deleted_entities.append(mongo_id)
 
             av_ent = self.avalon_ents_by_id[mongo_id]
@@ -1990,10 +2257,9 @@ class SyncEntitiesFactory:
 
         self.set_input_links()
 
-        unarchive_writes = []
         for item in self.unarchive_list:
             mongo_id = item["_id"]
-            unarchive_writes.append(ReplaceOne(
+            self.mongo_operations.append(ReplaceOne(
                 {"_id": mongo_id},
                 item
             ))
@@ -2005,19 +2271,33 @@ class SyncEntitiesFactory:
             )
             self.remove_from_archived(mongo_id)
 
-        if unarchive_writes:
-            self.dbcon.bulk_write(unarchive_writes)
-
-        if len(self.create_list) > 0:
-            self.dbcon.insert_many(self.create_list)
+        for item in self.create_list:
+            self.mongo_operations.append(InsertOne(item))
 
+        # Avalon documents must exist before their ids are committed to
+        #   ftrack custom attributes
+        self.write_mongo_operations()
         self.session.commit()
 
         self.log.debug("* Processing entities for update")
         self.prepare_changes()
         self.update_entities()
+        self.write_mongo_operations()
         self.session.commit()
 
+        set_last_sync_date(self.project_name, self.sync_started)
+
+    def write_mongo_operations(self):
+        """Write collected changes of avalon documents in one bulk write."""
+
+        if not self.mongo_operations:
+            return
+        operations, self.mongo_operations = self.mongo_operations, []
+        self.log.debug(
+            "Writing {} changes to avalon database".format(len(operations))
+        )
+        self.dbcon.bulk_write(operations)
+
     def create_avalon_entity(self, ftrack_id):
         if ftrack_id == self.ft_project_id:
             self.create_avalon_project()
@@ -2291,7 +2571,9 @@ class SyncEntitiesFactory:
         to_delete.extend(repre_ids)
 
         if to_delete:
-            self.dbcon.delete_many({"_id": {"$in": to_delete}})
+            self.mongo_operations.append(
+                DeleteMany({"_id": {"$in": to_delete}})
+            )
 
     # Probably deprecated
     def _check_changeability(self, parent_id=None):
@@ -2314,20 +2596,15 @@ class SyncEntitiesFactory:
 
     def update_entities(self):
         """
-            Runs changes converted to "$set" queries in bulk.
+            Adds changes converted to "$set" queries to bulk operations.
         """
-        mongo_changes_bulk = []
         for mongo_id, changes in self.updates.items():
             mongo_id = ObjectId(mongo_id)
             is_project = mongo_id == self.avalon_project_id
             change_data = from_dict_to_set(changes, is_project)
 
             filter = {"_id": mongo_id}
-            mongo_changes_bulk.append(UpdateOne(filter, change_data))
-        if not mongo_changes_bulk:
-            # TODO LOG
-            return
-        self.dbcon.bulk_write(mongo_changes_bulk)
+            self.mongo_operations.append(UpdateOne(filter, change_data))
 
     def reload_parents(self, hierarchy_changing_ids):
         parents_queue = collections.deque()
@@ -2597,8 +2874,11 @@ class SyncEntitiesFactory:
                 deleted_entity, ftrack_parent_id
             )
 
-        filter = {"_id": {"$in": delete_ids}, "type": "asset"}
-        self.dbcon.update_many(filter, {"$set": {"type": "archived_asset"}})
+        if delete_ids:
+            filter = {"_id": {"$in": delete_ids}, "type": "asset"}
+            self.mongo_operations.append(
+                UpdateMany(filter, {"$set": {"type": "archived_asset"}})
+            )
 
     def create_ftrack_ent_from_avalon_ent(self, av_entity, parent_id):
         new_entity = None
@@ -0,0 +1,130 @@
+"""Time windows in which event storer of event server stored ftrack events.
+
+Each connection of event storer to ftrack event hub is stored as a run with
+date when it connected and date when it was last alive. Events which
+happened while no storer was connected are not stored, so changes
+collected from stored events are complete only if runs continuously cover
+the requested time.
+"""
+import datetime
+
+from bson.objectid import ObjectId
+
+from openpype.client import OpenPypeMongoConnection
+
+from .settings import get_ftrack_event_mongo_info
+
+STORER_RUNS_COLLECTION_NAME = "ftrack_storer_runs"
+# Last alive date of run is updated at most once per this interval (seconds)
+STORER_ALIVE_INTERVAL = 60
+# Run is considered connected if was alive in this time (seconds)
+STORER_ALIVE_TIMEOUT = 3 * STORER_ALIVE_INTERVAL
+
+
+def get_storer_runs_collection():
+    database_name, _ = get_ftrack_event_mongo_info()
+    mongo_client = OpenPypeMongoConnection.get_mongo_client()
+    return mongo_client[database_name][STORER_RUNS_COLLECTION_NAME]
+
+
+class StorerRun:
+    """Run of event storer connected to ftrack event hub.
+
+    Args:
+        collection (Optional[pymongo.collection.Collection]): Collection
+            where runs are stored.
+    """
+
+    def __init__(self, collection=None):
+        if collection is None:
+            collection = get_storer_runs_collection()
+        self._collection = collection
+        self._run_id = None
+        self._last_alive = None
+
+    def start(self):
+        """Start new run, previous run is stopped."""
+
+        self.stop()
+        now = datetime.datetime.utcnow()
+        self._run_id = ObjectId()
+        self._last_alive = now
+        self._collection.insert_one({
+            "_id": self._run_id,
+            "started": now,
+            "last_alive": now
+        })
+
+    def alive(self):
+        """Mark run as alive, should be called periodically."""
+
+        if self._run_id is None:
+            return
+        now = datetime.datetime.utcnow()
+        if (now - self._last_alive).total_seconds() < STORER_ALIVE_INTERVAL:
+            return
+        self._last_alive = now
+        self._collection.update_one(
+            {"_id": self._run_id},
+            {"$set": {"last_alive": now}}
+        )
+
+    def stop(self):
+        """Stop current run.
+
+        Last alive date is not changed as connection could be lost before.
+        """
+
+        if self._run_id is None:
+            return
+        self._collection.update_one(
+            {"_id": self._run_id},
+            {"$set": {"stopped": datetime.datetime.utcnow()}}
+        )
+        self._run_id = None
+
+
+def are_events_stored_since(since, collection=None, now=None):
+    """Events were stored continuously since passed date until now.
+
+    Args:
+        since (datetime.datetime): Date (UTC) from which events are needed.
+        collection (Optional[pymongo.collection.Collection]): Collection
+            where runs are stored.
+        now (Optional[datetime.datetime]): Current date (UTC).
+
+    Returns:
+        bool: Runs of event storer cover whole time without gaps and a run
+            is connected now.
+    """
+
+    if collection is None:
+        collection = get_storer_runs_collection()
+    if now is None:
+        now = datetime.datetime.utcnow()
+
+    covered_until = None
+    connected = False
+    run_docs = collection.find(
+        {"last_alive": {"$gte": since}},
+        sort=[("started", 1)]
+    )
+    for run_doc in run_docs:
+        if (
+            "stopped" not in run_doc
+            and (now - run_doc["last_alive"]).total_seconds()
+            <= STORER_ALIVE_TIMEOUT
+        ):
+            connected = True
+
+        if covered_until is None:
+            if run_doc["started"] > since:
+                return False
+            covered_until = run_doc["last_alive"]
+            continue
+
+        if run_doc["started"] > covered_until:
+            return False
+        covered_until = max(covered_until, run_doc["last_alive"])
+
+    return connected
@@ -16,6 +16,7 @@ from openpype_modules.ftrack.ftrack_server.lib import (
     TOPIC_STATUS_SERVER_RESULT
 )
 from openpype_modules.ftrack.lib import get_ftrack_event_mongo_info
+from openpype_modules.ftrack.lib.storer_runs import StorerRun
 from openpype.lib import (
     Logger,
     get_openpype_version,
@@ -28,6 +29,8 @@ subprocess_started = datetime.datetime.now()
 
 class SessionFactory:
     session = None
+    # Time window in which are events stored
+    storer_run = None
 
 
 database_name, collection_name = get_ftrack_event_mongo_info()
@@ -79,6 +82,28 @@ def launch(event):
         )
 
 
+def start_storer_run(event):
+    session = SessionFactory.session
+    source_id = event.get("source", {}).get("id")
+    if not source_id or source_id != session.event_hub.id:
+        return
+
+    # Each connection to event hub starts new run, events were not stored
+    #   while the hub was disconnected
+    if SessionFactory.storer_run is None:
+        SessionFactory.storer_run = StorerRun()
+    SessionFactory.storer_run.start()
+
+
+def storer_run_alive():
+    if SessionFactory.storer_run is None:
+        return
+    try:
+        SessionFactory.storer_run.alive()
+    except pymongo.errors.PyMongoError:
+        log.warning("Failed to update storer run.", exc_info=True)
+
+
 def trigger_sync(event):
     session = SessionFactory.session
     source_id = event.get("source", {}).get("id")
@@ -99,7 +124,10 @@ def trigger_sync(event):
         "data.actionIdentifier": "sync.to.avalon.server"
     }
     set_dict = {
-        "$set": {"pype_data.is_processed": True}
+        "$set": {
+            "pype_data.is_processed": True,
+            "pype_data.processed_at": datetime.datetime.utcnow()
+        }
     }
     dbcon.update_many(query, set_dict)
 
@@ -177,7 +205,11 @@ def register(session):
     '''Registers the event, subscribing the discover and launch topics.'''
     install_db()
     session.event_hub.subscribe("topic=*", launch)
+    session.event_hub.subscribe(
+        "topic=openpype.storer.started", start_storer_run
+    )
     session.event_hub.subscribe("topic=openpype.storer.started", trigger_sync)
+    session.event_hub.heartbeat_callbacks.append(storer_run_alive)
     session.event_hub.subscribe(
         "topic={}".format(TOPIC_STATUS_SERVER), send_status
     )
@@ -214,6 +246,8 @@ def main(args):
         sock.sendall(b"MongoError")
 
     finally:
+        if SessionFactory.storer_run is not None:
+            SessionFactory.storer_run.stop()
         log.debug("First closing socket")
         sock.close()
         return 1
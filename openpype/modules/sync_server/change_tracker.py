@@ -0,0 +1,208 @@
+"""Tracking of changed representations for incremental sync loops.
+
+Python 3 only implementation.
+"""
+from pymongo.errors import PyMongoError
+
+from openpype.lib import Logger
+
+
+class RepresentationChangeTracker:
+    """Collects ids of representations that should be re-evaluated.
+
+    Full query of representations to sync is expensive on big projects, so
+    only representations that changed since last loop, or were returned
+    by the last query (might not be processed yet because of limits), are
+    queried again.
+
+    Changes are received from Mongo change stream of project collection and
+    the resume token of the stream is used as watermark. Change streams are
+    available only on replica sets, full scan is used on each loop if they
+    are not available.
+
+    Full scan is done on first loop, when scan key (e.g. combination of
+    sites) changes, when change stream fails or when requested with
+    'request_full_scan'.
+
+    Args:
+        collection (pymongo.collection.Collection): Project collection.
+        log (Optional[logging.Logger]): Logger object.
+    """
+
+    # Fields of representation which may affect sync status
+    watched_field_prefix = "files"
+
+    def __init__(self, collection, log=None):
+        if log is None:
+            log = Logger.get_logger(self.__class__.__name__)
+        self.log = log
+        self._collection = collection
+        self._stream = None
+        self._resume_token = None
+        self._supported = True
+        self._full_scan_requested = True
+        self._scan_key = None
+        self._pending_ids = set()
+
+    @property
+    def supported(self):
+        """Change stream is available for the collection.
+
+        Returns:
+            bool: Incremental changes can be tracked.
+        """
+
+        return self._supported
+
+    def request_full_scan(self):
+        """Next call of 'get_changed_ids' will require full scan."""
+
+        self._full_scan_requested = True
+
+    def set_pending_ids(self, representation_ids):
+        """Set ids of representations returned by last sync query.
+
+        These are queried again on next loop even if they didn't change.
+
+        Args:
+            representation_ids (Iterable[ObjectId]): Representation ids.
+        """
+
+        self._pending_ids = set(representation_ids)
+
+    def get_changed_ids(self, scan_key=None):
+        """Ids of representations which should be queried in this loop.
+
+        Args:
+            scan_key (Optional[Hashable]): Values which affect query of
+                representations (e.g. sites). Full scan is required when
+                changed.
+
+        Returns:
+            Union[set[ObjectId], None]: Ids of representations to query or
+                None if full scan is required.
+        """
+
+        if scan_key != self._scan_key:
+            self._scan_key = scan_key
+            self._full_scan_requested = True
+
+        if not self._supported:
+            return None
+
+        if self._full_scan_requested or self._stream is None:
+            # Stream must be opened before full scan query to not miss
+            #   changes made during the query
+            self._full_scan_requested = False
+            self._open_stream(resume=False)
+            return None
+
+        try:
+            changed_ids = self._collect_changes()
+        except PyMongoError:
+            self.log.warning(
+                "Change stream failed, resuming from last watermark.",
+                exc_info=True
+            )
+            changed_ids = self._resume_changes()
+
+        if changed_ids is None:
+            self._open_stream(resume=False)
+            return None
+
+        changed_ids |= self._pending_ids
+        return changed_ids
+
+    def close(self):
+        """Close change stream."""
+
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except PyMongoError:
+                pass
+        self._stream = None
+
+    def _resume_changes(self):
+        """Reopen stream from last resume token and collect changes.
+
+        Returns:
+            Union[set[ObjectId], None]: Changed representation ids or None
+                if stream could not be resumed.
+        """
+
+        if self._resume_token is None:
+            return None
+
+        self._open_stream(resume=True)
+        if self._stream is None:
+            # Resume failed, but change streams may still be available
+            self._supported = True
+            return None
+
+        try:
+            return self._collect_changes()
+        except PyMongoError:
+            self.log.warning(
+                "Resume of change stream failed, full scan will be used.",
+                exc_info=True
+            )
+        return None
+
+    def _open_stream(self, resume):
+        self.close()
+        kwargs = {}
+        if resume and self._resume_token is not None:
+            kwargs["resume_after"] = self._resume_token
+        try:
+            self._stream = self._collection.watch(
+                [{"$match": {
+                    "operationType": {"$in": ["insert", "replace", "update"]}
+                }}],
+                **kwargs
+            )
+        except PyMongoError:
+            self.log.info((
+                "Change streams are not available, all representations"
+                " will be queried on each loop."
+            ), exc_info=True)
+            self._supported = False
+            self._stream = None
+
+    def _collect_changes(self):
+        """Drain available events from change stream without waiting.
+
+        Returns:
+            Union[set[ObjectId], None]: Changed representation ids or None
+                if stream was invalidated.
+        """
+
+        changed_ids = set()
+        while self._stream.alive:
+            event = self._stream.try_next()
+            self._resume_token = self._stream.resume_token
+            if event is None:
+                break
+
+            if event["operationType"] == "invalidate":
+                return None
+
+            if self._is_relevant_event(event):
+                changed_ids.add(event["documentKey"]["_id"])
+
+        if not self._stream.alive:
+            return None
+        return changed_ids
+
+    def _is_relevant_event(self, event):
+        if event["operationType"] != "update":
+            full_doc = event.get("fullDocument") or {}
+            return full_doc.get("type") == "representation"
+
+        update_description = event.get("updateDescription") or {}
+        changed_fields = list(update_description.get("updatedFields") or [])
+        changed_fields.extend(update_description.get("removedFields") or [])
+        for field in changed_fields:
+            if field.split(".")[0] == self.watched_field_prefix:
+                return True
+        return False
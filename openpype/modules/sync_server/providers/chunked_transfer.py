@@ -0,0 +1,182 @@
+"""Chunked file transfers which can be resumed and are verified by checksum.
+
+Data are written to temporary '.part' file next to target which is renamed
+to target path when whole file was transferred. Interrupted transfer
+continues from last completed chunk of '.part' file on next try.
+
+Checksum of file content is computed while data are streamed, so no extra
+read of the file is needed to verify it.
+"""
+import time
+import hashlib
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+CHECKSUM_ALGORITHM = "sha256"
+PART_EXTENSION = ".part"
+
+
+class ChecksumMismatchError(ValueError):
+    """Checksum of transferred file doesn't match expected checksum."""
+    pass
+
+
+def get_part_path(target_path):
+    """Path of temporary file used during transfer of 'target_path'."""
+    return target_path + PART_EXTENSION
+
+
+def get_resume_offset(part_size, source_size, chunk_size):
+    """Offset from which interrupted transfer can continue.
+
+    Only complete chunks are kept, last chunk could be written partially.
+
+    Args:
+        part_size (int): Size of already transferred '.part' file.
+        source_size (int): Size of source file.
+        chunk_size (int): Size of transferred chunks.
+
+    Returns:
+        int: Number of bytes which don't have to be transferred again.
+    """
+    if not part_size or part_size > source_size:
+        return 0
+    if part_size == source_size:
+        return part_size
+    return part_size - (part_size % chunk_size)
+
+
+def format_checksum(hasher):
+    """Checksum string stored to file record, e.g. 'sha256:ab01...'."""
+    return "{}:{}".format(hasher.name, hasher.hexdigest())
+
+
+def _hash_stream(stream, hasher, length, chunk_size):
+    remaining = length
+    while remaining > 0:
+        data = stream.read(min(chunk_size, remaining))
+        if not data:
+            raise EOFError("Stream ended before {} bytes were read".format(
+                length))
+        hasher.update(data)
+        remaining -= len(data)
+
+
+def transfer_file(
+    open_source,
+    open_part,
+    open_transferred,
+    size,
+    part_size=0,
+    chunk_size=None,
+    expected_checksum=None,
+    progress_callback=None
+):
+    """Transfer file content in chunks to '.part' file.
+
+    Data already in '.part' file are hashed from 'open_transferred' stream
+    which should be the side of transfer which is cheaper to read (local
+    disk) and transfer continues from the offset.
+
+    Args:
+        open_source (Callable[[], IO]): Open source file for binary reading.
+        open_part (Callable[[str], IO]): Open '.part' file with passed mode
+            ('wb' or 'r+b').
+        open_transferred (Callable[[], IO]): Open stream with data which
+            were already transferred. Used only when transfer is resumed.
+        size (int): Size of source file.
+        part_size (int): Size of existing '.part' file.
+        chunk_size (Optional[int]): Size of chunk in bytes.
+        expected_checksum (Optional[str]): Known checksum of file.
+        progress_callback (Optional[Callable[[int, int], None]]): Called
+            with transferred bytes and size after each chunk.
+
+    Returns:
+        str: Checksum of transferred file.
+
+    Raises:
+        ChecksumMismatchError: Checksum of transferred data doesn't match
+            'expected_checksum'. The '.part' file should be removed.
+    """
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    offset = get_resume_offset(part_size, size, chunk_size)
+    hasher = hashlib.new(CHECKSUM_ALGORITHM)
+    if offset:
+        with open_transferred() as stream:
+            _hash_stream(stream, hasher, offset, chunk_size)
+
+    transferred = offset
+    mode = "r+b" if offset else "wb"
+    with open_source() as source_stream, open_part(mode) as part_stream:
+        if offset:
+            source_stream.seek(offset)
+            part_stream.seek(offset)
+            part_stream.truncate(offset)
+
+        while transferred < size:
+            data = source_stream.read(min(chunk_size, size - transferred))
+            if not data:
+                raise EOFError(
+                    "Source ended after {} of {} bytes".format(
+                        transferred, size))
+            part_stream.write(data)
+            # Written chunk must be persisted to be able to resume from it
+            part_stream.flush()
+            hasher.update(data)
+            transferred += len(data)
+            if progress_callback is not None:
+                progress_callback(transferred, size)
+
+    checksum = format_checksum(hasher)
+    if expected_checksum and expected_checksum != checksum:
+        raise ChecksumMismatchError(
+            "Checksum {} of transferred file doesn't match {}".format(
+                checksum, expected_checksum))
+    return checksum
+
+
+class TransferProgress:
+    """Store progress of transfer to DB at most once per 'LOG_PROGRESS_SEC'.
+
+    Args:
+        server (SyncServerModule): Module storing progress.
+        project_name (str): Project name.
+        file (dict): File record from representation.
+        representation (dict): Representation of file.
+        site (str): Site name.
+        direction (str): 'Upload' or 'Download' used for logging.
+        log (logging.Logger): Logger object.
+    """
+
+    def __init__(self, server, project_name, file, representation, site,
+                 direction, log):
+        self._server = server
+        self._project_name = project_name
+        self._file = file
+        self._representation = representation
+        self._site = site
+        self._direction = direction
+        self._log = log
+        self._last_tick = None
+
+    def __call__(self, transferred, size):
+        if transferred >= size:
+            # Final state is stored by sync server
+            return
+
+        now = time.time()
+        if (
+            self._last_tick is not None
+            and now - self._last_tick < self._server.LOG_PROGRESS_SEC
+        ):
+            return
+        self._last_tick = now
+        status_val = transferred / size
+        self._log.debug(
+            self._direction + "ed %d%%." % int(status_val * 100))
+        self._server.update_db(project_name=self._project_name,
+                               new_file_id=None,
+                               file=self._file,
+                               representation=self._representation,
+                               site=self._site,
+                               progress=status_val
+                               )
@@ -1,13 +1,17 @@
 from __future__ import print_function
 import os.path
 import shutil
-import threading
-import time
 
 from openpype.lib import Logger
 from openpype.lib.local_settings import get_local_site_id
 from openpype.pipeline import Anatomy
 from .abstract_provider import AbstractProvider
+from .chunked_transfer import (
+    ChecksumMismatchError,
+    TransferProgress,
+    get_part_path,
+    transfer_file,
+)
 
 log = Logger.get_logger("SyncServer")
 
@@ -87,17 +91,24 @@ class LocalDriveHandler(AbstractProvider):
                     overwrite=False, direction="Upload"):
         """
             Copies file from 'source_path' to 'target_path'
+
+            File is copied in chunks, interrupted copy continues from last
+            copied chunk. Checksum of copied file is stored in 'file' to be
+            saved to DB with the success state.
         """
         if not os.path.isfile(source_path):
             raise FileNotFoundError("Source file {} doesn't exist."
                                     .format(source_path))
 
         if overwrite:
-            thread = threading.Thread(target=self._copy,
-                                      args=(source_path, target_path))
-            thread.start()
-            self._mark_progress(project_name, file, representation, server,
-                                site, source_path, target_path, direction)
+            progress = TransferProgress(server, project_name, file,
+                                        representation, site, direction, log)
+            checksum = self._copy(source_path, target_path,
+                                  server.get_transfer_chunk_size(project_name),
+                                  file.get("checksum"),
+                                  progress)
+            if checksum:
+                file["checksum"] = checksum
         else:
             if os.path.exists(target_path):
                 raise ValueError("File {} exists, set overwrite".
@@ -183,41 +194,47 @@ class LocalDriveHandler(AbstractProvider):
         """
         pass
 
-    def _copy(self, source_path, target_path):
-        print("copying {}->{}".format(source_path, target_path))
+    def _copy(self, source_path, target_path, chunk_size=None,
+              expected_checksum=None, progress_callback=None):
+        """
+            Copies file in chunks through temporary '.part' file.
+
+            Returns:
+                (string) - checksum of copied file, None if source and
+                    target are the same file
+        """
+        log.debug("copying {}->{}".format(source_path, target_path))
+        if (
+            os.path.exists(target_path)
+            and os.path.samefile(source_path, target_path)
+        ):
+            log.debug("same files, skipping")
+            return None
+
+        part_path = get_part_path(target_path)
+        part_size = 0
+        if os.path.isfile(part_path):
+            part_size = os.path.getsize(part_path)
+            log.debug("resuming copy of {}".format(target_path))
+
         try:
-            shutil.copy(source_path, target_path)
-        except shutil.SameFileError:
-            print("same files, skipping")
-
-    def _mark_progress(self, project_name, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
-
-            Compares file sizes of source and target.
-        """
-        source_file_size = os.path.getsize(source_path)
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(project_name=project_name,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
+            checksum = transfer_file(
+                lambda: open(source_path, "rb"),
+                lambda mode: open(part_path, mode),
+                lambda: open(part_path, "rb"),
+                os.path.getsize(source_path),
+                part_size,
+                chunk_size,
+                expected_checksum,
+                progress_callback
+            )
+        except ChecksumMismatchError:
+            os.remove(part_path)
+            raise
+
+        shutil.copymode(source_path, part_path)
+        os.replace(part_path, target_path)
+        return checksum
 
     def _normalize_site_name(self, site_name):
         """Transform user id to 'local' for Local settings"""
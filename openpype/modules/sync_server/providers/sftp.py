@@ -1,12 +1,16 @@
 import os
 import os.path
-import time
-import threading
 import platform
 
 from openpype.lib import Logger
 from openpype.settings import get_system_settings, MODULES_SETTINGS_KEY
 from .abstract_provider import AbstractProvider
+from .chunked_transfer import (
+    ChecksumMismatchError,
+    TransferProgress,
+    get_part_path,
+    transfer_file,
+)
 log = Logger.get_logger("SyncServer-SFTPHandler")
 
 pysftp = None
@@ -252,18 +256,62 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._upload,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(project_name, file, representation, server,
-                            site, source_path, target_path, "upload")
+        progress = TransferProgress(server, project_name, file,
+                                    representation, site, "Upload", self.log)
+        file["checksum"] = self._upload(
+            source_path, target_path,
+            server.get_transfer_chunk_size(project_name),
+            file.get("checksum"),
+            progress
+        )
 
         return os.path.basename(target_path)
 
-    def _upload(self, source_path, target_path):
-        print("copying {}->{}".format(source_path, target_path))
+    def _upload(self, source_path, target_path, chunk_size=None,
+                expected_checksum=None, progress_callback=None):
+        """
+            Uploads file in chunks to temporary '.part' file on server.
+
+            Interrupted upload continues from last uploaded chunk, already
+            uploaded part is hashed from local source.
+
+        Returns:
+            (string) checksum of uploaded file
+        """
+        self.log.debug("copying {}->{}".format(source_path, target_path))
         conn = self._get_conn()
-        conn.put(source_path, target_path)
+        part_path = get_part_path(target_path)
+        part_size = 0
+        if conn.isfile(part_path):
+            part_size = conn.stat(part_path).st_size
+            self.log.debug("resuming upload of {}".format(target_path))
+
+        def open_part(mode):
+            stream = conn.open(part_path, mode)
+            # don't wait for server response after each write
+            stream.set_pipelined(True)
+            return stream
+
+        try:
+            checksum = transfer_file(
+                lambda: open(source_path, "rb"),
+                open_part,
+                lambda: open(source_path, "rb"),
+                os.path.getsize(source_path),
+                part_size,
+                chunk_size,
+                expected_checksum,
+                progress_callback
+            )
+        except ChecksumMismatchError:
+            conn.remove(part_path)
+            raise
+
+        # 'rename' fails on some servers if target exists
+        if conn.isfile(target_path):
+            conn.remove(target_path)
+        conn.rename(part_path, target_path)
+        return checksum
 
     def download_file(self, source_path, target_path,
                       server, project_name, file, representation, site,
@@ -298,18 +346,63 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._download,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(project_name, file, representation, server,
-                            site, source_path, target_path, "download")
+        progress = TransferProgress(server, project_name, file,
+                                    representation, site, "Download",
+                                    self.log)
+        file["checksum"] = self._download(
+            source_path, target_path,
+            server.get_transfer_chunk_size(project_name),
+            file.get("checksum"),
+            progress
+        )
 
         return os.path.basename(target_path)
 
-    def _download(self, source_path, target_path):
-        print("downloading {}->{}".format(source_path, target_path))
+    def _download(self, source_path, target_path, chunk_size=None,
+                  expected_checksum=None, progress_callback=None):
+        """
+            Downloads file in chunks to temporary local '.part' file.
+
+            Interrupted download continues from last downloaded chunk.
+
+        Returns:
+            (string) checksum of downloaded file
+        """
+        self.log.debug("downloading {}->{}".format(source_path, target_path))
         conn = self._get_conn()
-        conn.get(source_path, target_path)
+        part_path = get_part_path(target_path)
+        part_size = 0
+        if os.path.isfile(part_path):
+            part_size = os.path.getsize(part_path)
+            self.log.debug("resuming download of {}".format(target_path))
+
+        source_size = conn.stat(source_path).st_size
+
+        def open_source():
+            stream = conn.open(source_path, "rb")
+            if not part_size:
+                # read ahead whole file, not useful when resuming as
+                #   prefetch always starts at the beginning of file
+                stream.prefetch(source_size)
+            return stream
+
+        try:
+            checksum = transfer_file(
+                open_source,
+                lambda mode: open(part_path, mode),
+                lambda: open(part_path, "rb"),
+                source_size,
+                part_size,
+                chunk_size,
+                expected_checksum,
+                progress_callback
+            )
+        except ChecksumMismatchError:
+            os.remove(part_path)
+            raise
+
+        os.replace(part_path, target_path)
+        return checksum
 
     def delete_file(self, path):
         """
@@ -423,40 +516,3 @@ class SFTPHandler(AbstractProvider):
         except (paramiko.ssh_exception.SSHException,
                 pysftp.exceptions.ConnectionException):
             self.log.warning("Couldn't connect", exc_info=True)
-
-    def _mark_progress(self, project_name, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
-
-            Compares file sizes of source and target.
-        """
-        pass
-        if direction == "upload":
-            source_file_size = os.path.getsize(source_path)
-        else:
-            source_file_size = self.conn.stat(source_path).st_size
-
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                self.log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(project_name=project_name,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                if direction == "upload":
-                    target_file_size = self.conn.stat(target_path).st_size
-                else:
-                    target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
@@ -0,0 +1,256 @@
+"""Scheduling of file transfers in sync server loop.
+
+Python 3 only implementation.
+"""
+import time
+import heapq
+import asyncio
+import itertools
+
+from openpype.lib import Logger
+
+
+class TransferJob:
+    """Single file transfer (upload or download) waiting in queue.
+
+    Args:
+        key (Hashable): Unique identifier of transfer, transfer with the same
+            key is not added to queue while queued or running.
+        priority (int): Higher priority jobs are started first.
+        create_coroutine (Callable[[], Coroutine]): Creates coroutine doing
+            the transfer. Result of coroutine is passed to 'on_done'.
+        size (int): Size of transferred file in bytes.
+        data (Any): Custom data passed to 'on_done' callback.
+    """
+
+    def __init__(self, key, priority, create_coroutine, size=0, data=None):
+        self.key = key
+        self.priority = priority
+        self.create_coroutine = create_coroutine
+        self.size = size or 0
+        self.data = data
+
+
+class SiteTransferQueue:
+    """Work queue of transfers for single site with bounded concurrency.
+
+    New job is started as soon as any running job finishes, so one slow
+    transfer does not block others. Jobs are started by priority, then by
+    order in which they were added.
+
+    Args:
+        site_name (str): Name of site.
+        concurrency (int): Maximum number of running transfers.
+        on_done (Optional[Callable]): Called with job, its result and
+            exception (or None) when job finishes.
+        log (Optional[logging.Logger]): Logger object.
+    """
+
+    def __init__(self, site_name, concurrency, on_done=None, log=None):
+        if log is None:
+            log = Logger.get_logger(self.__class__.__name__)
+        self.log = log
+        self.site_name = site_name
+        self.concurrency = max(1, int(concurrency))
+        self._on_done = on_done
+        self._heap = []
+        self._counter = itertools.count()
+        self._keys = set()
+        self._running = {}
+        self._idle_event = asyncio.Event()
+        self._idle_event.set()
+
+        self._transferred_bytes = 0
+        self._transferred_files = 0
+        self._busy_time = 0.0
+        self._busy_since = None
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    @property
+    def queued_count(self):
+        """Number of jobs waiting to be started."""
+        return len(self._heap)
+
+    @property
+    def running_count(self):
+        """Number of running jobs."""
+        return len(self._running)
+
+    @property
+    def pending_count(self):
+        """Number of queued and running jobs."""
+        return len(self._keys)
+
+    @property
+    def bytes_per_second(self):
+        """Throughput of site during time when any transfer was running.
+
+        Returns:
+            float: Transferred bytes per second.
+        """
+        busy_time = self._busy_time
+        if self._busy_since is not None:
+            busy_time += time.time() - self._busy_since
+        if busy_time <= 0:
+            return 0.0
+        return self._transferred_bytes / busy_time
+
+    @property
+    def transferred_bytes(self):
+        return self._transferred_bytes
+
+    @property
+    def transferred_files(self):
+        return self._transferred_files
+
+    def add(self, job):
+        """Add job to queue and start it if there is free slot.
+
+        Args:
+            job (TransferJob): Job to add.
+
+        Returns:
+            bool: Job was added, False when job with the same key is
+                already queued or running.
+        """
+        if job.key in self._keys:
+            return False
+
+        self._keys.add(job.key)
+        heapq.heappush(
+            self._heap, (-job.priority, next(self._counter), job)
+        )
+        self._idle_event.clear()
+        self._start_jobs()
+        return True
+
+    async def wait_idle(self):
+        """Wait until all queued and running jobs are finished."""
+        await self._idle_event.wait()
+
+    def cancel(self):
+        """Remove queued jobs and cancel running ones."""
+        self._heap = []
+        for task in list(self._running):
+            task.cancel()
+
+    def _start_jobs(self):
+        while self._heap and len(self._running) < self.concurrency:
+            _, _, job = heapq.heappop(self._heap)
+            if self._busy_since is None:
+                self._busy_since = time.time()
+            task = asyncio.ensure_future(job.create_coroutine())
+            self._running[task] = job
+            task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task):
+        job = self._running.pop(task)
+        self._keys.discard(job.key)
+
+        result = error = None
+        if task.cancelled():
+            error = asyncio.CancelledError()
+        elif task.exception() is not None:
+            error = task.exception()
+        else:
+            result = task.result()
+            self._transferred_bytes += job.size
+            self._transferred_files += 1
+
+        if not self._running and self._busy_since is not None:
+            self._busy_time += time.time() - self._busy_since
+            self._busy_since = None
+
+        if self._on_done is not None:
+            try:
+                self._on_done(job, result, error)
+            except Exception:
+                self.log.warning(
+                    "Failed to process finished transfer", exc_info=True
+                )
+
+        self._start_jobs()
+        if not self._keys:
+            self._idle_event.set()
+
+
+class TransferScheduler:
+    """Holds transfer queues of sites.
+
+    Args:
+        on_done (Optional[Callable]): Called with job, its result and
+            exception (or None) when any job finishes.
+        log (Optional[logging.Logger]): Logger object.
+    """
+
+    def __init__(self, on_done=None, log=None):
+        if log is None:
+            log = Logger.get_logger(self.__class__.__name__)
+        self.log = log
+        self._on_done = on_done
+        self._queues = {}
+
+    def get_queue(self, site_name, concurrency):
+        """Get transfer queue of site, concurrency is updated if changed.
+
+        Args:
+            site_name (str): Name of site.
+            concurrency (int): Maximum number of running transfers.
+
+        Returns:
+            SiteTransferQueue: Queue of site.
+        """
+        queue = self._queues.get(site_name)
+        if queue is None:
+            queue = SiteTransferQueue(
+                site_name, concurrency, self._on_done, self.log
+            )
+            self._queues[site_name] = queue
+        else:
+            queue.concurrency = max(1, int(concurrency))
+        return queue
+
+    @property
+    def concurrency(self):
+        """Maximum number of running transfers of all sites."""
+        return sum(queue.concurrency for queue in self._queues.values())
+
+    @property
+    def pending_count(self):
+        """Number of queued and running jobs of all sites."""
+        return sum(queue.pending_count for queue in self._queues.values())
+
+    def is_pending(self, key):
+        """Job with key is queued or running in any queue."""
+        for queue in self._queues.values():
+            if key in queue:
+                return True
+        return False
+
+    def log_throughput(self):
+        """Log throughput of all sites with transferred files."""
+        for site_name, queue in self._queues.items():
+            if not queue.transferred_files:
+                continue
+            self.log.debug((
+                "Site {}: {} files transferred, {:.2f} MB/s,"
+                " {} running, {} queued"
+            ).format(
+                site_name,
+                queue.transferred_files,
+                queue.bytes_per_second / (1024 * 1024),
+                queue.running_count,
+                queue.queued_count
+            ))
+
+    async def wait_idle(self):
+        """Wait until all queues are idle."""
+        for queue in list(self._queues.values()):
+            await queue.wait_idle()
+
+    def cancel(self):
+        """Cancel all queued and running jobs."""
+        for queue in self._queues.values():
+            queue.cancel()
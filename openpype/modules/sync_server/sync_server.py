@@ -2,6 +2,7 @@
 import os
 import asyncio
 import threading
+import functools
 import concurrent.futures
 from time import sleep
 
@@ -14,6 +15,8 @@ from openpype.pipeline import Anatomy
 from openpype.pipeline.load.utils import get_representation_path_with_anatomy
 
 from .utils import SyncStatus, ResumableError
+from .change_tracker import RepresentationChangeTracker
+from .scheduler import TransferJob, TransferScheduler
 
 
 async def upload(module, project_name, file, representation, provider_name,
@@ -290,6 +293,9 @@ class SyncServerThread(threading.Thread):
         Separate thread running synchronization server with asyncio loop.
         Stopped when tray is closed.
     """
+    # executor threads used for other than transfers (long running tasks)
+    EXTRA_EXECUTOR_WORKERS = 2
+
     def __init__(self, module):
         self.log = Logger.get_logger(self.__class__.__name__)
 
@@ -297,8 +303,18 @@ class SyncServerThread(threading.Thread):
         self.module = module
         self.loop = None
         self.is_running = False
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+        # resized to transfer concurrency of sites in sync loop
+        self._executor_workers = (
+            module.DEFAULT_TRANSFER_CONCURRENCY + self.EXTRA_EXECUTOR_WORKERS
+        )
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._executor_workers
+        )
         self.timer = None
+        self._change_trackers = {}
+        self._scheduler = None
+        # some files were not added to transfer queues because of limits
+        self._more_work = False
 
     def run(self):
         self.is_running = True
@@ -339,6 +355,9 @@ class SyncServerThread(threading.Thread):
                 import time
                 start_time = time.time()
                 self.module.set_sync_project_settings()  # clean cache
+                # write results of transfers finished since last loop
+                self.module.flush_db_updates()
+                self._more_work = False
                 project_name = None
                 enabled_projects = self.module.get_enabled_projects()
                 for project_name in enabled_projects:
@@ -349,14 +368,13 @@ class SyncServerThread(threading.Thread):
                     if not all([local_site, remote_site]):
                         continue
 
-                    sync_repres = self.module.get_sync_representations(
+                    sync_repres = self._get_sync_representations(
                         project_name,
                         local_site,
-                        remote_site
+                        remote_site,
+                        preset
                     )
 
-                    task_files_to_process = []
-                    files_processed_info = []
                     # process only unique file paths in one batch
                     # multiple representation could have same file path
                     # (textures),
@@ -371,86 +389,81 @@ class SyncServerThread(threading.Thread):
                                                        project_name,
                                                        remote_site,
                                                        presets=site_preset)
+                    queue = self.scheduler.get_queue(
+                        remote_site,
+                        self.module.get_transfer_concurrency(project_name)
+                    )
+                    # keep only 'limit' transfers pending for site, next files
+                    # are added on next loop with fresh state from DB
                     limit = lib.factory.get_provider_batch_limit(
-                        remote_provider)
+                        remote_provider) - queue.pending_count
                     # first call to get_provider could be expensive, its
                     # building folder tree structure in memory
                     # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
                     for sync in sync_repres:
                         if limit <= 0:
-                            continue
+                            self._more_work = True
+                            break
+                        priority = (
+                            sync.get("priority")
+                            or self.module.DEFAULT_PRIORITY
+                        )
                         files = sync.get("files") or []
-                        if files:
-                            for file in files:
-                                # skip already processed files
-                                file_path = file.get('path', '')
-                                if file_path in processed_file_path:
-                                    continue
-                                status = self.module.check_status(
+                        for file in files:
+                            # skip already processed files
+                            file_path = file.get('path', '')
+                            if file_path in processed_file_path:
+                                continue
+                            status = self.module.check_status(
+                                file,
+                                local_site,
+                                remote_site,
+                                preset.get('config'))
+                            if status == SyncStatus.DO_UPLOAD:
+                                func = upload
+                                site = remote_site
+                            elif status == SyncStatus.DO_DOWNLOAD:
+                                func = download
+                                site = local_site
+                            else:
+                                continue
+
+                            processed_file_path.add(file_path)
+                            key = (project_name, file_path, site)
+                            # transfer is still running from previous loop
+                            if key in queue:
+                                continue
+
+                            tree = handler.get_tree()
+                            limit -= 1
+                            queue.add(TransferJob(
+                                key,
+                                priority,
+                                functools.partial(
+                                    func,
+                                    self.module,
+                                    project_name,
                                     file,
-                                    local_site,
+                                    sync,
+                                    remote_provider,
                                     remote_site,
-                                    preset.get('config'))
-                                if status == SyncStatus.DO_UPLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        upload(self.module,
-                                               project_name,
-                                               file,
-                                               sync,
-                                               remote_provider,
-                                               remote_site,
-                                               tree,
-                                               site_preset))
-                                    task_files_to_process.append(task)
-                                    # store info for exception handlingy
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 remote_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-                                if status == SyncStatus.DO_DOWNLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        download(self.module,
-                                                 project_name,
-                                                 file,
-                                                 sync,
-                                                 remote_provider,
-                                                 remote_site,
-                                                 tree,
-                                                 site_preset))
-                                    task_files_to_process.append(task)
-
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 local_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-
-                    self.log.debug("Sync tasks count {}".format(
-                        len(task_files_to_process)
-                    ))
-                    files_created = await asyncio.gather(
-                        *task_files_to_process,
-                        return_exceptions=True)
-                    for file_id, info in zip(files_created,
-                                             files_processed_info):
-                        file, representation, site, project_name = info
-                        error = None
-                        if isinstance(file_id, BaseException):
-                            error = str(file_id)
-                            file_id = None
-                        self.module.update_db(project_name,
-                                              file_id,
-                                              file,
-                                              representation,
-                                              site,
-                                              error)
+                                    tree,
+                                    site_preset
+                                ),
+                                size=file.get("size"),
+                                # store info for exception handling
+                                data=(file, sync, site, project_name)
+                            ))
+
+                    self.log.debug("Sync tasks for {}: {} running, {} queued"
+                                   .format(remote_site,
+                                           queue.running_count,
+                                           queue.queued_count))
+
+                self._update_executor_workers()
+                # write results of transfers finished during loop
+                self.module.flush_db_updates()
+                self.scheduler.log_throughput()
 
                 duration = time.time() - start_time
                 self.log.debug("One loop took {:.2f}s".format(duration))
@@ -478,10 +491,122 @@ class SyncServerThread(threading.Thread):
                     "Unhandled except. in sync loop, stopping server",
                     exc_info=True)
 
+    @property
+    def scheduler(self):
+        """Transfer queues of sites, created in running event loop."""
+        if self._scheduler is None:
+            self._scheduler = TransferScheduler(
+                on_done=self._on_transfer_done, log=self.log
+            )
+        return self._scheduler
+
+    def _update_executor_workers(self):
+        """Match executor threads to transfer concurrency of all sites.
+
+        Transfers running in previous executor are finished there.
+        """
+        workers = max(
+            self.scheduler.concurrency,
+            self.module.DEFAULT_TRANSFER_CONCURRENCY
+        ) + self.EXTRA_EXECUTOR_WORKERS
+        if workers == self._executor_workers:
+            return
+
+        self.log.debug("Using {} executor threads".format(workers))
+        previous_executor = self.executor
+        self._executor_workers = workers
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers
+        )
+        self.loop.set_default_executor(self.executor)
+        previous_executor.shutdown(wait=False)
+
+    def _on_transfer_done(self, job, file_id, error):
+        """Store result of finished transfer.
+
+        Results are written in bulk, immediately when all queues are empty
+        so next loop could be started sooner if there is more work.
+        """
+        if isinstance(error, asyncio.CancelledError):
+            return
+
+        file, representation, site, project_name = job.data
+        if error is not None:
+            error = str(error)
+        self.module.queue_db_update(project_name,
+                                    file_id,
+                                    file,
+                                    representation,
+                                    site,
+                                    error)
+        if self.scheduler.pending_count:
+            self.module.flush_db_updates_if_due()
+            return
+
+        self.module.flush_db_updates()
+        if self._more_work:
+            self._more_work = False
+            self.reset_timer()
+
     def stop(self):
         """Sets is_running flag to false, 'check_shutdown' shuts server down"""
         self.is_running = False
 
+    def request_full_scan(self, project_name=None):
+        """Query all representations of project(s) on next loop.
+
+        Args:
+            project_name (str): limit to project, all projects if None
+        """
+        for tracker_project_name, tracker in self._change_trackers.items():
+            if project_name is None or tracker_project_name == project_name:
+                tracker.request_full_scan()
+
+    def _get_sync_representations(self, project_name, local_site,
+                                  remote_site, preset):
+        """Query representations to sync, only changed ones if possible.
+
+        Full query is used on first loop for project, on request or when
+        change tracking is not available.
+        """
+        if not self.module.INCREMENTAL_SYNC:
+            return self.module.get_sync_representations(
+                project_name, local_site, remote_site
+            )
+
+        tracker = self._change_trackers.get(project_name)
+        if tracker is None:
+            collection = self.module.connection.database[project_name]
+            tracker = RepresentationChangeTracker(collection, self.log)
+            self._change_trackers[project_name] = tracker
+
+        scan_key = (
+            local_site,
+            remote_site,
+            preset.get("config", {}).get("retry_cnt")
+        )
+        repre_ids = tracker.get_changed_ids(scan_key)
+        if repre_ids is None:
+            self.log.debug("Full scan of representations in {}".format(
+                project_name))
+        else:
+            self.log.debug("Checking {} changed representations in {}".format(
+                len(repre_ids), project_name))
+
+        sync_repres = list(self.module.get_sync_representations(
+            project_name,
+            local_site,
+            remote_site,
+            representation_ids=repre_ids
+        ))
+        tracker.set_pending_ids(repre["_id"] for repre in sync_repres)
+        return sync_repres
+
+    def _close_change_trackers(self):
+        for tracker in self._change_trackers.values():
+            tracker.close()
+        self._change_trackers = {}
+
     async def check_shutdown(self):
         """ Future that is running and checks if server should be running
             periodically.
@@ -494,6 +619,14 @@ class SyncServerThread(threading.Thread):
                 self.log.info("finished long running")
                 self.module.projects_processed.remove(task["project_name"])
             await asyncio.sleep(0.5)
+        if self._scheduler is not None:
+            self._scheduler.cancel()
+        self._close_change_trackers()
+        try:
+            self.module.flush_db_updates()
+        except Exception:
+            self.log.warning(
+                "Failed to write buffered sync updates", exc_info=True)
         tasks = [task for task in asyncio.all_tasks() if
                  task is not asyncio.current_task()]
         list(map(lambda task: task.cancel(), tasks))  # cancel all the tasks
@@ -9,6 +9,7 @@ from collections import deque, defaultdict
 
 import click
 from bson.objectid import ObjectId
+from pymongo import UpdateOne
 
 from openpype.client import (
     get_projects,
@@ -35,6 +36,7 @@ from openpype.settings.constants import (
 
 from .providers.local_drive import LocalDriveHandler
 from .providers import lib
+from .update_buffer import SyncStateUpdateBuffer
 
 from .utils import (
     time_function,
@@ -110,6 +112,11 @@ class SyncServerModule(OpenPypeModule, ITrayAction, IPluginPaths):
     LOCAL_SITE = 'local'
     LOG_PROGRESS_SEC = 5  # how often log progress to DB
     DEFAULT_PRIORITY = 50  # higher is better, allowed range 1 - 1000
+    DEFAULT_TRANSFER_CONCURRENCY = 4  # files transferred at once per site
+    DEFAULT_TRANSFER_CHUNK_SIZE = 8  # MB, resumable transfers chunk size
+    # query only representations changed since last loop (requires change
+    # streams on Mongo replica set, full query is used otherwise)
+    INCREMENTAL_SYNC = True
 
     name = "sync_server"
     label = "Sync Queue"
@@ -138,6 +145,8 @@ class SyncServerModule(OpenPypeModule, ITrayAction, IPluginPaths):
         self._anatomies = {}
 
         self._connection = None
+        # buffered sync state updates written in bulk
+        self._update_buffer = None
 
         # list of long blocking tasks
         self.long_running_tasks = deque()
@@ -1134,6 +1143,20 @@ class SyncServerModule(OpenPypeModule, ITrayAction, IPluginPaths):
         else:
             self.sync_server_thread.reset_timer()
 
+    def request_full_sync(self, project_name=None):
+        """
+            Query all representations on next loop, not only changed ones.
+
+            Args:
+                project_name (str): limit to project, all projects if None
+        """
+
+        if not self.enabled or self.sync_server_thread is None:
+            return
+
+        self.sync_server_thread.request_full_scan(project_name)
+        self.reset_timer()
+
     def is_representation_on_site(
         self, project_name, representation_id, site_name, max_retries=None
     ):
@@ -1675,7 +1698,8 @@ class SyncServerModule(OpenPypeModule, ITrayAction, IPluginPaths):
         return sites.get(site, 'N/A')
 
     @time_function
-    def get_sync_representations(self, project_name, active_site, remote_site):
+    def get_sync_representations(self, project_name, active_site, remote_site,
+                                 representation_ids=None):
         """
             Get representations that should be synced, these could be
             recognised by presence of document in 'files.sites', where key is
@@ -1691,6 +1715,8 @@ class SyncServerModule(OpenPypeModule, ITrayAction, IPluginPaths):
                 'local_0' when working from home, 'studio' when working in the
                 studio (default)
             remote_site (string): identifier of remote site I want to sync to
+            representation_ids (Iterable[ObjectId]): limit query only to these
+                representations, all representations are queried if None
 
         Returns:
             (list) of dictionaries
@@ -1739,6 +1765,11 @@ class SyncServerModule(OpenPypeModule, ITrayAction, IPluginPaths):
                 ]}
             ]
         }
+        if representation_ids is not None:
+            representation_ids = list(representation_ids)
+            if not representation_ids:
+                return []
+            match["_id"] = {"$in": representation_ids}
 
         aggr = [
             {"$match": match},
@@ -1846,6 +1877,9 @@ class SyncServerModule(OpenPypeModule, ITrayAction, IPluginPaths):
             Update 'provider' portion of records in DB with success (file_id)
             or error (exception)
 
+            Progress updates are buffered, only the latest progress of file
+            is written by time-based flush (see 'LOG_PROGRESS_SEC').
+
         Args:
             project_name (string): name of project - force to db connection as
               each file might come from different collection
@@ -1860,6 +1894,95 @@ class SyncServerModule(OpenPypeModule, ITrayAction, IPluginPaths):
         Returns:
             None
         """
+        if progress is not None:
+            self.queue_db_update(project_name, new_file_id, file,
+                                 representation, site, progress=progress)
+            return
+
+        query, update, arr_filter = self._prepare_db_update(
+            new_file_id, file, representation, site, error, progress, priority
+        )
+        self.connection.database[project_name].update_one(
+            query,
+            update,
+            upsert=True,
+            array_filters=arr_filter
+        )
+
+        if priority is None:
+            self._log_db_update(new_file_id, file, representation, error)
+
+    def queue_db_update(self, project_name, new_file_id, file, representation,
+                        site, error=None, progress=None):
+        """
+            Buffer update of 'provider' portion of records in DB.
+
+            Same as 'update_db' but written to DB with other updates of
+            the project in one 'bulk_write' on 'flush_db_updates'.
+
+        Args:
+            project_name (string): name of project
+            new_file_id (string): only present if file synced successfully
+            file (dictionary): info about processed file (pulled from DB)
+            representation (dictionary): parent repr of file (from DB)
+            site (string): label ('gdrive', 'S3')
+            error (string): exception message
+            progress (float): 0-0.99 of progress of upload/download
+        """
+        query, update, arr_filter = self._prepare_db_update(
+            new_file_id, file, representation, site, error, progress
+        )
+        operation = UpdateOne(
+            query, update, upsert=True, array_filters=arr_filter
+        )
+        file_id = None
+        if file:
+            file_id = file.get("_id")
+        key = (representation.get("_id"), file_id, site)
+        if progress is not None:
+            self.update_buffer.add_progress(project_name, key, operation)
+            return
+
+        self.update_buffer.add_state(project_name, key, operation)
+        self._log_db_update(new_file_id, file, representation, error)
+
+    def flush_db_updates(self, project_name=None):
+        """
+            Write buffered updates to DB.
+
+        Args:
+            project_name (string): flush only updates of project, all
+                buffered updates are written if None
+        """
+        self.update_buffer.flush(project_name)
+
+    def flush_db_updates_if_due(self):
+        """
+            Write buffered updates to DB if flush interval elapsed.
+
+            Used when transfers finish continuously, results are written in
+            bulk at most once per 'LOG_PROGRESS_SEC'.
+        """
+        self.update_buffer.flush_if_due()
+
+    @property
+    def update_buffer(self):
+        if self._update_buffer is None:
+            self._update_buffer = SyncStateUpdateBuffer(
+                lambda project_name: self.connection.database[project_name],
+                flush_interval=self.LOG_PROGRESS_SEC,
+                log=self.log
+            )
+        return self._update_buffer
+
+    def _prepare_db_update(self, new_file_id, file, representation, site,
+                           error=None, progress=None, priority=None):
+        """
+            Prepare query, update and array filters for file site update.
+
+        Returns:
+            (tuple): query (dict), update (dict), array filters (list)
+        """
         representation_id = representation.get("_id")
         file_id = None
         if file:
@@ -1872,6 +1995,10 @@ class SyncServerModule(OpenPypeModule, ITrayAction, IPluginPaths):
         update = {}
         if new_file_id:
             update["$set"] = self._get_success_dict(new_file_id)
+            # checksum computed by provider during transfer, stored on file
+            #   so next transfers of the file can be verified against it
+            if file_id and file.get("checksum"):
+                update["$set"]["files.$[f].checksum"] = file["checksum"]
             # reset previous errors if any
             update["$unset"] = self._get_error_dict("", "", "")
         elif progress is not None:
@@ -1890,16 +2017,9 @@ class SyncServerModule(OpenPypeModule, ITrayAction, IPluginPaths):
         if file_id:
             arr_filter.append({'f._id': ObjectId(file_id)})
 
-        self.connection.database[project_name].update_one(
-            query,
-            update,
-            upsert=True,
-            array_filters=arr_filter
-        )
-
-        if progress is not None or priority is not None:
-            return
+        return query, update, arr_filter
 
+    def _log_db_update(self, new_file_id, file, representation, error):
         status = 'failed'
         error_str = 'with error {}'.format(error)
         if new_file_id:
@@ -1911,7 +2031,7 @@ class SyncServerModule(OpenPypeModule, ITrayAction, IPluginPaths):
             (
                 "File for {} - {source_file} process {status} {error_str}"
             ).format(
-                representation_id,
+                representation.get("_id"),
                 status=status,
                 source_file=source_file,
                 error_str=error_str
@@ -2267,6 +2387,33 @@ class SyncServerModule(OpenPypeModule, ITrayAction, IPluginPaths):
         ld = self.sync_project_settings[project_name]["config"]["loop_delay"]
         return int(ld)
 
+    def get_transfer_concurrency(self, project_name):
+        """
+            Return maximum number of files transferred at once for one site.
+        Returns:
+            (int)
+        """
+        config = self.sync_project_settings[project_name]["config"]
+        return int(
+            config.get("transfer_concurrency")
+            or self.DEFAULT_TRANSFER_CONCURRENCY
+        )
+
+    def get_transfer_chunk_size(self, project_name):
+        """
+            Return size of chunk in bytes for resumable transfers.
+
+            Interrupted transfer continues from last completed chunk.
+        Returns:
+            (int)
+        """
+        config = self.sync_project_settings[project_name]["config"]
+        chunk_size_mb = (
+            config.get("transfer_chunk_size")
+            or self.DEFAULT_TRANSFER_CHUNK_SIZE
+        )
+        return int(chunk_size_mb * 1024 * 1024)
+
     def show_widget(self):
         """Show dialog for Sync Queue"""
         no_errors = False
@@ -0,0 +1,128 @@
+"""Buffer of sync state updates written to DB in bulk."""
+import time
+import threading
+from collections import OrderedDict
+
+from openpype.lib import Logger
+
+
+class SyncStateUpdateBuffer:
+    """Collects update operations of file sites and writes them in bulk.
+
+    Operations are stored per project and written with single 'bulk_write'
+    per project on flush. Progress operations are coalesced so only latest
+    progress of each file on a site is written and are dropped when final
+    state (success or error) of the same file is added.
+
+    Progress is flushed automatically when 'flush_interval' seconds passed
+    since last flush. Final states are written on explicit 'flush'.
+
+    Args:
+        get_collection (Callable[[str], pymongo.collection.Collection]):
+            Function returning collection of a project.
+        flush_interval (float): Time-based flush interval of progress
+            in seconds.
+        log (Optional[logging.Logger]): Logger object.
+    """
+
+    def __init__(self, get_collection, flush_interval=5, log=None):
+        if log is None:
+            log = Logger.get_logger(self.__class__.__name__)
+        self.log = log
+        self._get_collection = get_collection
+        self._flush_interval = flush_interval
+        self._lock = threading.RLock()
+        # Latest progress operation by (representation, file, site)
+        self._progress_ops = {}
+        # Final state operations by (representation, file, site)
+        self._state_ops = {}
+        self._last_flush = time.time()
+
+    def add_progress(self, project_name, key, operation):
+        """Add progress operation which replaces previous progress of file.
+
+        Args:
+            project_name (str): Project name.
+            key (tuple): Identifier of file on site e.g.
+                (representation id, file id, site name).
+            operation (pymongo.UpdateOne): Update operation.
+        """
+
+        with self._lock:
+            project_state_ops = self._state_ops.get(project_name) or {}
+            if key not in project_state_ops:
+                self._progress_ops.setdefault(
+                    project_name, OrderedDict()
+                )[key] = operation
+
+        if time.time() - self._last_flush >= self._flush_interval:
+            self.flush(progress_only=True)
+
+    def add_state(self, project_name, key, operation):
+        """Add final state operation (success or error) of a file.
+
+        Pending progress of the file is dropped.
+
+        Args:
+            project_name (str): Project name.
+            key (tuple): Identifier of file on site e.g.
+                (representation id, file id, site name).
+            operation (pymongo.UpdateOne): Update operation.
+        """
+
+        with self._lock:
+            self._progress_ops.get(project_name, {}).pop(key, None)
+            self._state_ops.setdefault(
+                project_name, OrderedDict()
+            )[key] = operation
+
+    def flush_if_due(self):
+        """Flush all operations if 'flush_interval' passed since last flush.
+
+        Returns:
+            int: Number of written operations.
+        """
+
+        if time.time() - self._last_flush >= self._flush_interval:
+            return self.flush()
+        return 0
+
+    def flush(self, project_name=None, progress_only=False):
+        """Write buffered operations to DB.
+
+        Args:
+            project_name (Optional[str]): Flush only operations of project.
+            progress_only (bool): Flush only progress operations.
+
+        Returns:
+            int: Number of written operations.
+        """
+
+        with self._lock:
+            self._last_flush = time.time()
+            if project_name is None:
+                project_names = set(self._progress_ops.keys())
+                if not progress_only:
+                    project_names |= set(self._state_ops.keys())
+            else:
+                project_names = {project_name}
+
+            ops_by_project = {}
+            for _project_name in project_names:
+                operations = list(
+                    self._progress_ops.pop(_project_name, {}).values()
+                )
+                if not progress_only:
+                    operations.extend(
+                        self._state_ops.pop(_project_name, {}).values()
+                    )
+                if operations:
+                    ops_by_project[_project_name] = operations
+
+        count = 0
+        for _project_name, operations in ops_by_project.items():
+            self.log.debug("Writing {} sync updates to {}".format(
+                len(operations), _project_name))
+            self._get_collection(_project_name).bulk_write(operations)
+            count += len(operations)
+        return count
@@ -43,6 +43,7 @@ from .load import (
     load_container,
     remove_container,
     update_container,
+    update_containers,
     switch_container,
 
     loaders_from_representation,
@@ -161,6 +162,7 @@ __all__ = (
     "load_container",
     "remove_container",
     "update_container",
+    "update_containers",
     "switch_container",
 
     "loaders_from_representation",
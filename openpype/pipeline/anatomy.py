@@ -641,6 +641,39 @@ class AnatomyStringTemplate(StringTemplate):
         rootless_path = anatomy_templates.rootless_path_from_result(result)
         return AnatomyTemplateResult(result, rootless_path)
 
+    def format_string(self, data, strict=True):
+        """Fill template with 'root' key added to data if not available.
+
+        Args:
+            data (dict[str, Any]): Formatting data for template.
+            strict (bool): Raise error if template is not solved.
+
+        Returns:
+            str: Filled template.
+        """
+
+        if not data.get("root"):
+            data = dict(data)
+            data["root"] = self.anatomy_templates.anatomy.roots
+        return StringTemplate.format_string(self, data, strict)
+
+    def format_sequence(self, data, indexes, key="frame"):
+        """Fill template for each index with 'root' key added to data.
+
+        Args:
+            data (dict[str, Any]): Formatting data for template.
+            indexes (Iterable[int]): Sequence indexes e.g. frames.
+            key (str): Key in template which is filled with sequence index.
+
+        Returns:
+            list[str]: Filled template for each index.
+        """
+
+        if not data.get("root"):
+            data = dict(data)
+            data["root"] = self.anatomy_templates.anatomy.roots
+        return StringTemplate.format_sequence(self, data, indexes, key)
+
 
 class AnatomyTemplates(TemplatesDict):
     inner_key_pattern = re.compile(r"(\{@.*?[^{}0]*\})")
@@ -19,6 +19,7 @@ from .utils import (
     load_container,
     remove_container,
     update_container,
+    update_containers,
     switch_container,
 
     get_loader_identifier,
@@ -72,6 +73,7 @@ __all__ = (
     "load_container",
     "remove_container",
     "update_container",
+    "update_containers",
     "switch_container",
 
     "get_loader_identifier",
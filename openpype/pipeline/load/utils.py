@@ -6,6 +6,7 @@ import logging
 import inspect
 import collections
 import numbers
+from concurrent.futures import ThreadPoolExecutor
 
 from openpype.host import ILoadHost
 from openpype.client import (
@@ -13,15 +14,12 @@ from openpype.client import (
     get_assets,
     get_subsets,
     get_versions,
-    get_version_by_id,
-    get_last_version_by_subset_id,
-    get_hero_version_by_subset_id,
-    get_version_by_name,
+    get_hero_versions,
     get_last_versions,
     get_representations,
     get_representation_by_id,
-    get_representation_by_name,
-    get_representation_parents
+    get_representation_parents,
+    entities_cache,
 )
 from openpype.lib import (
     StringTemplate,
@@ -39,6 +37,11 @@ ContainersFilterResult = collections.namedtuple(
     ["latest", "outdated", "not_found", "invalid"]
 )
 
+ContainersUpdateResult = collections.namedtuple(
+    "ContainersUpdateResult",
+    ["updated", "failed"]
+)
+
 
 class HeroVersionType(object):
     def __init__(self, version):
@@ -457,51 +460,310 @@ def remove_container(container):
 def update_container(container, version=-1):
     """Update a container"""
 
-    # Compute the different version from 'representation'
-    project_name = legacy_io.active_project()
-    current_representation = get_representation_by_id(
-        project_name, container["representation"]
-    )
+    result = update_containers([container], version)
+    if result.failed:
+        _, _, exc = result.failed[0]
+        raise exc
+    _, output = result.updated[0]
+    return output
 
-    assert current_representation is not None, "This is a bug"
 
-    current_version = get_version_by_id(
-        project_name, current_representation["parent"], fields=["parent"]
-    )
-    if version == -1:
-        new_version = get_last_version_by_subset_id(
-            project_name, current_version["parent"], fields=["_id"]
-        )
+def _get_containers_loaders(containers):
+    """Loader plugins by identifier for passed containers.
 
-    elif isinstance(version, HeroVersionType):
-        new_version = get_hero_version_by_subset_id(
-            project_name, current_version["parent"], fields=["_id"]
+    Loader plugins are discovered only once for all containers.
+    """
+    from .plugins import discover_loader_plugins
+
+    loader_names = {container.get("loader") for container in containers}
+    loaders_by_name = {}
+    for Plugin in discover_loader_plugins():
+        identifier = get_loader_identifier(Plugin)
+        if (
+            identifier in loader_names
+            and identifier not in loaders_by_name
+        ):
+            loaders_by_name[identifier] = Plugin
+    return loaders_by_name
+
+
+def _get_target_versions_by_key(project_name, version_by_subset_id):
+    """Query versions to which containers should be updated.
+
+    At most one query is done for each type of requested version (last,
+    hero and specific version names).
+
+    Args:
+        project_name (str): Project name.
+        version_by_subset_id (dict[ObjectId, set]): Requested versions
+            by subset id. Hero version is marked with 'HeroVersionType'
+            class.
+
+    Returns:
+        dict[tuple[ObjectId, Any], dict]: Version documents by subset id
+            and requested version.
+    """
+
+    last_subset_ids = set()
+    hero_subset_ids = set()
+    names_subset_ids = set()
+    version_names = set()
+    for subset_id, versions in version_by_subset_id.items():
+        for version in versions:
+            if version == -1:
+                last_subset_ids.add(subset_id)
+            elif version is HeroVersionType:
+                hero_subset_ids.add(subset_id)
+            else:
+                names_subset_ids.add(subset_id)
+                version_names.add(version)
+
+    output = {}
+    if last_subset_ids:
+        last_versions = get_last_versions(
+            project_name, last_subset_ids, fields=["_id", "parent"]
         )
+        for subset_id, version_doc in last_versions.items():
+            output[(subset_id, -1)] = version_doc
+
+    if hero_subset_ids:
+        for version_doc in get_hero_versions(
+            project_name,
+            subset_ids=hero_subset_ids,
+            fields=["_id", "parent"]
+        ):
+            output[(version_doc["parent"], HeroVersionType)] = version_doc
+
+    if names_subset_ids:
+        for version_doc in get_versions(
+            project_name,
+            subset_ids=names_subset_ids,
+            versions=version_names,
+            fields=["_id", "parent", "name"]
+        ):
+            key = (version_doc["parent"], version_doc["name"])
+            output[key] = version_doc
+    return output
+
+
+def _get_version_key(subset_id, version):
+    if isinstance(version, HeroVersionType):
+        return subset_id, HeroVersionType
+    return subset_id, version
+
+
+def _get_representation_path_exists(repre_doc, root):
+    path = get_representation_path(repre_doc, root)
+    return path, bool(path) and os.path.exists(path)
+
+
+def update_containers(
+    containers, version=-1, project_name=None, max_workers=None
+):
+    """Update containers to another version of their representations.
+
+    Representations to update to are resolved with fixed number of batched
+    queries for all containers. Existence of representation paths is
+    checked in parallel and after that is update triggered on container
+    loaders.
 
+    Containers which can't be updated don't stop update of others and are
+    returned in 'failed' with exception describing the issue.
+
+    Args:
+        containers (Iterable[dict]): Containers to update.
+        version (Union[int, HeroVersionType, list]): Version to update to.
+            Value -1 is latest version, 'HeroVersionType' is hero version.
+            Can be list of versions with version for each container.
+        project_name (Optional[str]): Project name. Active project is used
+            if not passed.
+        max_workers (Optional[int]): Number of threads checking existence
+            of representation paths.
+
+    Returns:
+        ContainersUpdateResult: Named tuple with 'updated' containers with
+            result of loader update and 'failed' containers with requested
+            version and exception.
+    """
+
+    containers = list(containers)
+    if isinstance(version, (list, tuple)):
+        if len(version) != len(containers):
+            raise ValueError((
+                "Number of containers mismatches number of versions:"
+                " {} containers - {} versions"
+            ).format(len(containers), len(version)))
+        versions = list(version)
     else:
-        new_version = get_version_by_name(
-            project_name, version, current_version["parent"], fields=["_id"]
-        )
+        versions = [version] * len(containers)
 
-    assert new_version is not None, "This is a bug"
+    updated = []
+    failed = []
+    output = ContainersUpdateResult(updated, failed)
+    if not containers:
+        return output
 
-    new_representation = get_representation_by_name(
-        project_name, current_representation["name"], new_version["_id"]
-    )
-    assert new_representation is not None, "Representation wasn't found"
+    if project_name is None:
+        project_name = legacy_io.active_project()
 
-    path = get_representation_path(new_representation)
-    assert os.path.exists(path), "Path {} doesn't exist".format(path)
+    repre_ids = {
+        container["representation"]
+        for container in containers
+        if container.get("representation")
+    }
+    repre_docs_by_id = {}
+    if repre_ids:
+        repre_docs_by_id = {
+            str(repre_doc["_id"]): repre_doc
+            for repre_doc in get_representations(
+                project_name,
+                representation_ids=repre_ids,
+                fields=["_id", "parent", "name"]
+            )
+        }
 
-    # Run update on the Loader for this container
-    Loader = _get_container_loader(container)
-    if not Loader:
-        raise LoaderNotFoundError(
-            "Can't update container because loader '{}' was not found."
-            .format(container.get("loader"))
+    version_ids = {
+        repre_doc["parent"]
+        for repre_doc in repre_docs_by_id.values()
+    }
+    versions_by_id = {}
+    if version_ids:
+        versions_by_id = {
+            version_doc["_id"]: version_doc
+            for version_doc in get_versions(
+                project_name,
+                version_ids=version_ids,
+                hero=True,
+                fields=["_id", "parent"]
+            )
+        }
+
+    # Resolve current representation and subset of each container
+    items = []
+    version_by_subset_id = collections.defaultdict(set)
+    for container, item_version in zip(containers, versions):
+        repre_doc = repre_docs_by_id.get(
+            str(container.get("representation")))
+        if repre_doc is None:
+            failed.append((container, item_version, AssertionError(
+                "Representation of container '{}' was not found".format(
+                    container.get("objectName"))
+            )))
+            continue
+
+        version_doc = versions_by_id.get(repre_doc["parent"])
+        if version_doc is None:
+            failed.append((container, item_version, AssertionError(
+                "Version of container '{}' was not found".format(
+                    container.get("objectName"))
+            )))
+            continue
+
+        subset_id = version_doc["parent"]
+        version_by_subset_id[subset_id].add(
+            _get_version_key(subset_id, item_version)[1]
+        )
+        items.append((container, item_version, subset_id, repre_doc))
+
+    target_versions_by_key = _get_target_versions_by_key(
+        project_name, version_by_subset_id
+    )
+
+    names_by_version_ids = collections.defaultdict(set)
+    resolved_items = []
+    for container, item_version, subset_id, repre_doc in items:
+        version_doc = target_versions_by_key.get(
+            _get_version_key(subset_id, item_version)
         )
+        if version_doc is None:
+            failed.append((container, item_version, AssertionError(
+                "Version '{}' of container '{}' was not found".format(
+                    item_version, container.get("objectName"))
+            )))
+            continue
+        names_by_version_ids[version_doc["_id"]].add(repre_doc["name"])
+        resolved_items.append(
+            (container, item_version, version_doc["_id"], repre_doc["name"])
+        )
+
+    new_repre_docs_by_key = {}
+    if names_by_version_ids:
+        new_repre_docs_by_key = {
+            (repre_doc["parent"], repre_doc["name"]): repre_doc
+            for repre_doc in get_representations(
+                project_name,
+                names_by_version_ids={
+                    version_id: list(names)
+                    for version_id, names in names_by_version_ids.items()
+                }
+            )
+        }
 
-    return Loader().update(container, new_representation)
+    update_items = []
+    for container, item_version, version_id, repre_name in resolved_items:
+        new_repre_doc = new_repre_docs_by_key.get((version_id, repre_name))
+        if new_repre_doc is None:
+            failed.append((container, item_version, AssertionError(
+                "Representation wasn't found"
+            )))
+            continue
+        update_items.append((container, item_version, new_repre_doc))
+
+    if not update_items:
+        return output
+
+    from openpype.pipeline import registered_root
+
+    root = registered_root()
+    repre_docs = [new_repre_doc for _, _, new_repre_doc in update_items]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        paths_exist = list(executor.map(
+            lambda repre_doc: _get_representation_path_exists(
+                repre_doc, root
+            ),
+            repre_docs
+        ))
+
+    loaders_by_name = _get_containers_loaders(
+        container for container, _, _ in update_items
+    )
+    # Loaders often query the same parent documents
+    with entities_cache() as cache:
+        # Parents of new representations are queried at once on first
+        #   lookup made by a loader
+        if cache is not None:
+            prefetch_ids = set(version_by_subset_id.keys())
+            for _, _, new_repre_doc in update_items:
+                prefetch_ids.add(new_repre_doc["_id"])
+                prefetch_ids.add(new_repre_doc["parent"])
+            cache.prefetch(project_name, prefetch_ids)
+
+        for (container, item_version, new_repre_doc), path_exists in zip(
+            update_items, paths_exist
+        ):
+            path, exists = path_exists
+            if not exists:
+                failed.append((container, item_version, AssertionError(
+                    "Path {} doesn't exist".format(path)
+                )))
+                continue
+
+            Loader = loaders_by_name.get(container.get("loader"))
+            if not Loader:
+                failed.append((container, item_version, LoaderNotFoundError(
+                    "Can't update container because loader '{}' was not found."
+                    .format(container.get("loader"))
+                )))
+                continue
+
+            try:
+                result = Loader().update(container, new_repre_doc)
+            except AssertionError as exc:
+                failed.append((container, item_version, exc))
+                continue
+            updated.append((container, result))
+
+    return output
 
 
 def switch_container(container, representation, loader_plugin=None):
@@ -15,13 +15,15 @@ class DiscoverResult:
     """Result of Plug-ins discovery of a single superclass type.
 
     Stores discovered, duplicated, ignored and abstract plugins and file paths
-    which crashed on execution of file.
+    which crashed on execution of file. Import times of files imported
+    during discovery are stored in 'import_times'.
     """
 
     def __init__(self, superclass):
         self.superclass = superclass
         self.plugins = []
         self.crashed_file_paths = {}
+        self.import_times = {}
         self.duplicated_plugins = []
         self.abstract_plugins = []
         self.ignored_plugins = set()
@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 import inspect
 import copy
 import tempfile
@@ -265,22 +266,101 @@ def load_help_content_from_plugin(plugin):
     return load_help_content_from_filepath(filepath)
 
 
-def publish_plugins_discover(paths=None):
+_MISSING = object()
+# Imported publish plugins files by their path
+_PUBLISH_PLUGINS_FILE_CACHE = {}
+# Files importing longer than this (in seconds) are logged
+SLOW_PLUGIN_IMPORT_SECONDS = 0.1
+
+
+def _is_dunder(key):
+    return key.startswith("__") and key.endswith("__")
+
+
+def _copy_attribute_value(value):
+    """Copy of mutable container, other values are returned as they are.
+
+    Containers can be modified in place e.g. by 'apply_settings' of plugin.
+    """
+    if not isinstance(value, (list, dict, set)):
+        return value
+    try:
+        return copy.deepcopy(value)
+    except Exception:
+        return value
+
+
+class _PublishPluginsFileCache:
+    """Imported publish plugins file with initial state of its plugins.
+
+    Args:
+        file_key (tuple[int, int]): Modification time and size of file.
+        module (types.ModuleType): Imported module.
+    """
+
+    def __init__(self, file_key, module):
+        self.file_key = file_key
+        self.module = module
+        self._attributes_by_plugin = {}
+
+    def store_plugin_attributes(self, plugin):
+        """Store attributes of plugin class if were not stored yet."""
+        if plugin not in self._attributes_by_plugin:
+            self._attributes_by_plugin[plugin] = {
+                key: _copy_attribute_value(value)
+                for key, value in vars(plugin).items()
+                if not _is_dunder(key)
+            }
+
+    def restore_plugin_attributes(self):
+        """Restore attributes of plugin classes to state after import.
+
+        Attributes of plugins are changed e.g. by settings filter, which
+        may differ on next discovery. Mutable containers are replaced with
+        new copies as they could be modified in place.
+        """
+        for plugin, attributes in self._attributes_by_plugin.items():
+            current = vars(plugin)
+            for key in tuple(current.keys()):
+                if not _is_dunder(key) and key not in attributes:
+                    delattr(plugin, key)
+
+            for key, value in attributes.items():
+                copied_value = _copy_attribute_value(value)
+                if (
+                    copied_value is not value
+                    or current.get(key, _MISSING) is not value
+                ):
+                    setattr(plugin, key, copied_value)
+
+
+def clear_publish_plugins_discover_cache():
+    """Clear imported publish plugin files, all are imported on next discover.
+    """
+    _PUBLISH_PLUGINS_FILE_CACHE.clear()
+
+
+def publish_plugins_discover(paths=None, use_cache=True):
     """Find and return available pyblish plug-ins
 
     Overridden function from `pyblish` module to be able to collect
         crashed files and reason of their crash.
 
+    Imported files are cached by path, modification time and size so only
+    new and changed files are imported again on next call. Attributes of
+    plugins from cached files are restored to state after import.
+
     Arguments:
         paths (list, optional): Paths to discover plug-ins from.
             If no paths are provided, all paths are searched.
+        use_cache (bool): Use already imported files if were not changed.
     """
 
     # The only difference with `pyblish.api.discover`
     result = DiscoverResult(pyblish.api.Plugin)
 
     plugins = {}
-    plugin_names = []
+    plugin_names = set()
 
     allow_duplicates = pyblish.plugin.ALLOW_DUPLICATES
     log = pyblish.plugin.log
@@ -294,13 +374,14 @@ def publish_plugins_discover(paths=None):
         if not os.path.isdir(path):
             continue
 
-        for fname in os.listdir(path):
+        for entry in os.scandir(path):
+            fname = entry.name
             if fname.startswith("_"):
                 continue
 
             abspath = os.path.join(path, fname)
 
-            if not os.path.isfile(abspath):
+            if not entry.is_file():
                 continue
 
             mod_name, mod_ext = os.path.splitext(fname)
@@ -308,19 +389,38 @@ def publish_plugins_discover(paths=None):
             if mod_ext != ".py":
                 continue
 
-            try:
-                module = import_filepath(abspath, mod_name)
+            stat = entry.stat()
+            file_key = (stat.st_mtime_ns, stat.st_size)
+            file_cache = None
+            if use_cache:
+                file_cache = _PUBLISH_PLUGINS_FILE_CACHE.get(abspath)
 
-                # Store reference to original module, to avoid
-                # garbage collection from collecting it's global
-                # imports, such as `import os`.
-                sys.modules[abspath] = module
+            if file_cache is not None and file_cache.file_key == file_key:
+                file_cache.restore_plugin_attributes()
+                module = file_cache.module
 
-            except Exception as err:
-                result.crashed_file_paths[abspath] = sys.exc_info()
+            else:
+                start = time.time()
+                try:
+                    module = import_filepath(abspath, mod_name)
 
-                log.debug("Skipped: \"%s\" (%s)", mod_name, err)
-                continue
+                    # Store reference to original module, to avoid
+                    # garbage collection from collecting it's global
+                    # imports, such as `import os`.
+                    sys.modules[abspath] = module
+
+                except Exception as err:
+                    _PUBLISH_PLUGINS_FILE_CACHE.pop(abspath, None)
+                    result.crashed_file_paths[abspath] = sys.exc_info()
+
+                    log.debug("Skipped: \"%s\" (%s)", mod_name, err)
+                    continue
+
+                finally:
+                    result.import_times[abspath] = time.time() - start
+
+                file_cache = _PublishPluginsFileCache(file_key, module)
+                _PUBLISH_PLUGINS_FILE_CACHE[abspath] = file_cache
 
             for plugin in pyblish.plugin.plugins_from_module(module):
                 # Ignore base plugin classes
@@ -336,12 +436,25 @@ def publish_plugins_discover(paths=None):
                     log.debug("Duplicate plug-in found: %s", plugin)
                     continue
 
-                plugin_names.append(plugin.__name__)
+                plugin_names.add(plugin.__name__)
 
                 plugin.__module__ = module.__file__
+                file_cache.store_plugin_attributes(plugin)
                 key = "{0}.{1}".format(plugin.__module__, plugin.__name__)
                 plugins[key] = plugin
 
+    slow_imports = sorted(
+        (
+            (import_time, filepath)
+            for filepath, import_time in result.import_times.items()
+            if import_time >= SLOW_PLUGIN_IMPORT_SECONDS
+        ),
+        reverse=True
+    )
+    for import_time, filepath in slow_imports:
+        log.debug("Slow import of plugins file (%.3fs): %s",
+                  import_time, filepath)
+
     # Include plug-ins from registration.
     # Directly registered plug-ins take precedence.
     for plugin in pyblish.plugin.registered_plugins():
@@ -350,7 +463,7 @@ def publish_plugins_discover(paths=None):
             log.debug("Duplicate plug-in found: %s", plugin)
             continue
 
-        plugin_names.append(plugin.__name__)
+        plugin_names.add(plugin.__name__)
 
         plugins[plugin.__name__] = plugin
 
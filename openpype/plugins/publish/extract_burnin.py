@@ -1,4 +1,5 @@
 import os
+import sys
 import json
 import copy
 import tempfile
@@ -13,11 +14,13 @@ from openpype import resources, PACKAGE_DIR
 from openpype.pipeline import publish
 from openpype.lib import (
     run_openpype_process,
+    get_openpype_execute_args,
 
     get_transcode_temp_directory,
     convert_input_paths_for_ffmpeg,
     should_convert_for_ffmpeg
 )
+from openpype.lib.transcoding import run_parallel_conversions
 from openpype.lib.profiles_filtering import filter_profiles
 from openpype.pipeline.publish.lib import add_repre_files_for_cleanup
 
@@ -77,6 +80,12 @@ class ExtractBurnin(publish.Extractor):
     profiles = None
     options = None
 
+    # Maximum of burnins rendered at the same time
+    burnin_workers = 4
+    # Render burnins in current process when running in OpenPype interpreter
+    #   instead of launching the burnin script in new process for each
+    burnin_in_process = True
+
     def process(self, instance):
         if not self.profiles:
             self.log.warning("No profiles present for create burnin")
@@ -189,13 +198,13 @@ class ExtractBurnin(publish.Extractor):
         _burnin_data, _temp_data = self.prepare_basic_data(instance)
 
         anatomy = instance.context.data["anatomy"]
-        scriptpath = self.burnin_script_path()
 
-        # Args that will execute the script
-        executable_args = ["run", scriptpath]
         burnins_per_repres = self._get_burnins_per_representations(
             instance, burnin_defs
         )
+        # Burnins of all representations are rendered at once
+        burnin_jobs = []
+        processed_repres = []
         for repre, repre_burnin_defs in burnins_per_repres:
             # Create copy of `_burnin_data` and `_temp_data` for repre.
             burnin_data = copy.deepcopy(_burnin_data)
@@ -331,32 +340,7 @@ class ExtractBurnin(publish.Extractor):
                     "script_data: {}".format(json.dumps(script_data, indent=4))
                 )
 
-                # Dump data to string
-                dumped_script_data = json.dumps(script_data)
-
-                # Store dumped json to temporary file
-                temporary_json_file = tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".json", delete=False
-                )
-                temporary_json_file.write(dumped_script_data)
-                temporary_json_file.close()
-                temporary_json_filepath = temporary_json_file.name.replace(
-                    "\\", "/"
-                )
-
-                # Prepare subprocess arguments
-                args = list(executable_args)
-                args.append(temporary_json_filepath)
-                self.log.debug("Executing: {}".format(" ".join(args)))
-
-                # Run burnin script
-                process_kwargs = {
-                    "logger": self.log
-                }
-
-                run_openpype_process(*args, **process_kwargs)
-                # Remove the temporary json
-                os.remove(temporary_json_filepath)
+                burnin_jobs.append(script_data)
 
                 for filepath in temp_data["full_input_paths"]:
                     filepath = filepath.replace("\\", "/")
@@ -368,18 +352,38 @@ class ExtractBurnin(publish.Extractor):
 
                 add_repre_files_for_cleanup(instance, new_repre)
 
+            processed_repres.append({
+                "repre": repre,
+                "do_convert": do_convert,
+                "src_repre_staging_dir": src_repre_staging_dir,
+                "files_to_delete": files_to_delete,
+            })
+
+        burnin_module = self._get_in_process_burnin_module()
+        run_parallel_conversions(
+            lambda script_data: self._render_burnin(
+                script_data, burnin_module
+            ),
+            burnin_jobs,
+            max_workers=self.burnin_workers,
+            logger=self.log
+        )
+
+        for item in processed_repres:
+            repre = item["repre"]
             # Cleanup temp staging dir after procesisng of output definitions
-            if do_convert:
+            if item["do_convert"]:
                 temp_dir = repre["stagingDir"]
                 shutil.rmtree(temp_dir)
                 # Set staging dir of source representation back to previous
                 #   value
-                repre["stagingDir"] = src_repre_staging_dir
+                repre["stagingDir"] = item["src_repre_staging_dir"]
 
             # Remove source representation
             # NOTE we maybe can keep source representation if necessary
             instance.data["representations"].remove(repre)
 
+            files_to_delete = item["files_to_delete"]
             self.log.debug("Files to delete: {}".format(files_to_delete))
 
             # Delete input files
@@ -388,6 +392,81 @@ class ExtractBurnin(publish.Extractor):
                     os.remove(filepath)
                     self.log.debug("Removed: \"{}\"".format(filepath))
 
+    def _get_in_process_burnin_module(self):
+        """Burnin script module if burnins can be rendered in this process.
+
+        Returns:
+            Union[ModuleType, None]: Module of burnin script or None if
+                script should be launched in new OpenPype process.
+        """
+        if not self.burnin_in_process:
+            return None
+
+        try:
+            executable = get_openpype_execute_args()[0]
+        except KeyError:
+            return None
+
+        if (
+            os.path.normcase(os.path.realpath(executable))
+            != os.path.normcase(os.path.realpath(sys.executable))
+        ):
+            return None
+
+        try:
+            from openpype.scripts import otio_burnin
+        except Exception:
+            self.log.debug(
+                "Failed to import burnin script, using new process.",
+                exc_info=True
+            )
+            return None
+        return otio_burnin
+
+    def _render_burnin(self, script_data, burnin_module=None):
+        """Render burnin using data for burnin script.
+
+        Args:
+            script_data (dict[str, Any]): Data for burnin script.
+            burnin_module (Optional[ModuleType]): Burnin script module used
+                to render burnin in current process.
+        """
+        if burnin_module is not None:
+            self.log.debug("Rendering burnin to \"{}\"".format(
+                script_data["output"]))
+            burnin_module.burnins_from_script_data(
+                copy.deepcopy(script_data)
+            )
+            return
+
+        # Dump data to string
+        dumped_script_data = json.dumps(script_data)
+
+        # Store dumped json to temporary file
+        temporary_json_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        )
+        temporary_json_file.write(dumped_script_data)
+        temporary_json_file.close()
+        temporary_json_filepath = temporary_json_file.name.replace(
+            "\\", "/"
+        )
+
+        # Prepare subprocess arguments
+        args = ["run", self.burnin_script_path(), temporary_json_filepath]
+        self.log.debug("Executing: {}".format(" ".join(args)))
+
+        # Run burnin script
+        process_kwargs = {
+            "logger": self.log
+        }
+
+        try:
+            run_openpype_process(*args, **process_kwargs)
+        finally:
+            # Remove the temporary json
+            os.remove(temporary_json_filepath)
+
     def _get_burnin_options(self):
         # Prepare burnin options
         burnin_options = copy.deepcopy(self.default_options)
@@ -10,7 +10,7 @@ from openpype.lib import (
 )
 
 from openpype.lib.transcoding import (
-    convert_colorspace,
+    ColorspaceTranscodeScheduler,
     get_transcode_temp_directory,
 )
 
@@ -64,6 +64,12 @@ class ExtractOIIOTranscode(publish.Extractor):
     profiles = None
     options = None
 
+    # Maximum of parallel oiiotool processes
+    #   - 'None' uses count of CPUs
+    transcode_workers = None
+    # Maximum of frames converted by single oiiotool process
+    frames_per_process = None
+
     def process(self, instance):
         if not self.profiles:
             self.log.debug("No profiles present for color transcode")
@@ -81,6 +87,12 @@ class ExtractOIIOTranscode(publish.Extractor):
         if not profile:
             return
 
+        # All outputs of all representations are converted at once
+        transcode_scheduler = ColorspaceTranscodeScheduler(
+            max_workers=self.transcode_workers,
+            frames_per_process=self.frames_per_process,
+            logger=self.log
+        )
         new_representations = []
         repres = instance.data["representations"]
         for idx, repre in enumerate(list(repres)):
@@ -149,7 +161,7 @@ class ExtractOIIOTranscode(publish.Extractor):
                     output_path = self._get_output_file_path(input_path,
                                                              new_staging_dir,
                                                              output_extension)
-                    convert_colorspace(
+                    transcode_scheduler.add(
                         input_path,
                         output_path,
                         config_path,
@@ -158,7 +170,6 @@ class ExtractOIIOTranscode(publish.Extractor):
                         view,
                         display,
                         additional_command_args,
-                        self.log,
                         input_args=["-i:ch=R,G,B"]
                     )
 
@@ -197,6 +208,8 @@ class ExtractOIIOTranscode(publish.Extractor):
                 self._mark_original_repre_for_deletion(repre, profile,
                                                        added_review)
 
+        transcode_scheduler.process()
+
         for repre in tuple(instance.data["representations"]):
             tags = repre.get("tags") or []
             if "delete" in tags and "thumbnail" not in tags:
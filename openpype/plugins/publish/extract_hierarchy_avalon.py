@@ -4,7 +4,8 @@ import pyblish.api
 from openpype import AYON_SERVER_ENABLED
 from openpype.client import (
     get_assets,
-    get_archived_assets
+    get_archived_assets,
+    clear_entities_cache,
 )
 from openpype.pipeline import legacy_io
 
@@ -84,6 +85,9 @@ class ExtractHierarchyToAvalon(pyblish.api.ContextPlugin):
             for child_name, child_data in children.items():
                 hierarchy_queue.append((child_name, child_data, new_parent))
 
+        # Documents were written directly, cached documents are outdated
+        clear_entities_cache(project_name)
+
     def extract_asset_names(self, hierarchy_context):
         """Extract all possible asset names from hierarchy context.
 
@@ -8,7 +8,6 @@ from abc import ABCMeta, abstractmethod
 
 import six
 import clique
-import speedcopy
 import pyblish.api
 
 from openpype.lib import (
@@ -16,6 +15,7 @@ from openpype.lib import (
     filter_profiles,
     path_to_subprocess_arg,
     run_subprocess,
+    duplicate_file,
 )
 from openpype.lib.transcoding import (
     IMAGE_EXTENSIONS,
@@ -78,6 +78,11 @@ class ExtractReview(pyblish.api.InstancePlugin):
     # Preset attributes
     profiles = None
 
+    # Render compatible output definitions of a representation with single
+    #   ffmpeg process, source is decoded only once and 'split' filter
+    #   creates video stream for each output
+    single_pass_outputs = False
+
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
         # Skip review when requested.
@@ -321,6 +326,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
     ):
         fill_data = copy.deepcopy(instance.data["anatomyData"])
 
+        output_items = []
+        files_to_clean = []
+        # Gaps in sequence are filled once for all output definitions
+        gaps_filled = False
         for _output_def in output_definitions:
             output_def = copy.deepcopy(_output_def)
             # Make sure output definition has "tags" key
@@ -363,15 +372,15 @@ class ExtractReview(pyblish.api.InstancePlugin):
             )
 
             temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
-            if temp_data["input_is_sequence"]:
+            if temp_data["input_is_sequence"] and not gaps_filled:
+                gaps_filled = True
                 self.log.debug("Checking sequence to fill gaps in sequence..")
-                files_to_clean = self.fill_sequence_gaps(
+                files_to_clean.extend(self.fill_sequence_gaps(
                     files=temp_data["origin_repre"]["files"],
                     staging_dir=new_repre["stagingDir"],
                     start_frame=temp_data["frame_start"],
                     end_frame=temp_data["frame_end"]
-                )
+                ))
 
             # create or update outputName
             output_name = new_repre.get("outputName", "")
@@ -389,7 +398,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             })
 
             try:  # temporary until oiiotool is supported cross platform
-                ffmpeg_args = self._ffmpeg_arguments(
+                ffmpeg_parts = self._ffmpeg_argument_parts(
                     output_def,
                     instance,
                     new_repre,
@@ -408,9 +417,35 @@ class ExtractReview(pyblish.api.InstancePlugin):
                         ),
                         exc_info=True
                     )
-                    return
+                    break
                 raise NotImplementedError
 
+            output_items.append({
+                "output_def": output_def,
+                "new_repre": new_repre,
+                "temp_data": temp_data,
+                "output_name": output_name,
+                "output_ext": output_ext,
+                "ffmpeg_parts": ffmpeg_parts,
+            })
+
+        for items in self._group_output_items(output_items):
+            if len(items) == 1:
+                ffmpeg_args = self.ffmpeg_full_args(
+                    *items[0]["ffmpeg_parts"]
+                )
+            else:
+                ffmpeg_args = self.ffmpeg_multi_output_args(
+                    [item["ffmpeg_parts"] for item in items],
+                    [
+                        not item["temp_data"]["output_ext_is_image"]
+                        for item in items
+                    ]
+                )
+                self.log.debug(
+                    "Rendering {} outputs with single decode.".format(
+                        len(items))
+                )
             subprcs_cmd = " ".join(ffmpeg_args)
 
             # run subprocess
@@ -418,33 +453,85 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
             run_subprocess(subprcs_cmd, shell=True, logger=self.log)
 
-            # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
-
-            new_repre.update({
-                "fps": temp_data["fps"],
-                "name": "{}_{}".format(output_name, output_ext),
-                "outputName": output_name,
-                "outputDef": output_def,
-                "frameStartFtrack": temp_data["output_frame_start"],
-                "frameEndFtrack": temp_data["output_frame_end"],
-                "ffmpeg_cmd": subprcs_cmd
-            })
+            for item in items:
+                self._add_output_representation(
+                    instance, item, subprcs_cmd
+                )
 
-            # Force to pop these key if are in new repre
-            new_repre.pop("thumbnail", None)
-            if "clean_name" in new_repre.get("tags", []):
-                new_repre.pop("outputName")
+        # delete files added to fill gaps
+        for filepath in files_to_clean:
+            os.unlink(filepath)
+
+    def _add_output_representation(self, instance, output_item, ffmpeg_cmd):
+        new_repre = output_item["new_repre"]
+        temp_data = output_item["temp_data"]
+        output_name = output_item["output_name"]
+        output_ext = output_item["output_ext"]
+        new_repre.update({
+            "fps": temp_data["fps"],
+            "name": "{}_{}".format(output_name, output_ext),
+            "outputName": output_name,
+            "outputDef": output_item["output_def"],
+            "frameStartFtrack": temp_data["output_frame_start"],
+            "frameEndFtrack": temp_data["output_frame_end"],
+            "ffmpeg_cmd": ffmpeg_cmd
+        })
+
+        # Force to pop these key if are in new repre
+        new_repre.pop("thumbnail", None)
+        if "clean_name" in new_repre.get("tags", []):
+            new_repre.pop("outputName")
+
+        # adding representation
+        self.log.debug(
+            "Adding new representation: {}".format(new_repre)
+        )
+        instance.data["representations"].append(new_repre)
 
-            # adding representation
-            self.log.debug(
-                "Adding new representation: {}".format(new_repre)
-            )
-            instance.data["representations"].append(new_repre)
+        add_repre_files_for_cleanup(instance, new_repre)
+
+    def _group_output_items(self, output_items):
+        """Group outputs which can be rendered by single ffmpeg process.
 
-            add_repre_files_for_cleanup(instance, new_repre)
+        Outputs are compatible when they have the same input arguments,
+        only one input (no audio inputs), no audio filters and no labeled
+        video filters which would collide in filter graph.
+
+        Args:
+            output_items (list[dict]): Prepared outputs.
+
+        Returns:
+            list[list[dict]]: Groups of outputs in original order.
+        """
+        if not self.single_pass_outputs:
+            return [[item] for item in output_items]
+
+        groups = []
+        groups_by_key = {}
+        for item in output_items:
+            input_args, video_filters, audio_filters, _ = (
+                item["ffmpeg_parts"]
+            )
+            # Inputs can be passed as "-i" and path or as "-i <path>"
+            inputs_count = len([
+                arg for arg in input_args
+                if arg == "-i" or arg.startswith("-i ")
+            ])
+            # Only audio of first input is mapped to grouped outputs
+            compatible = (
+                not audio_filters
+                and inputs_count == 1
+                and not any("[" in value for value in video_filters)
+            )
+            key = tuple(input_args)
+            if not compatible or key not in groups_by_key:
+                group = [item]
+                groups.append(group)
+                if compatible:
+                    groups_by_key[key] = group
+                continue
+            groups_by_key[key].append(item)
+        return groups
 
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
@@ -577,6 +664,34 @@ class ExtractReview(pyblish.api.InstancePlugin):
             temp_data (dict): Base data for successful process.
         """
 
+        return self.ffmpeg_full_args(*self._ffmpeg_argument_parts(
+            output_def,
+            instance,
+            new_repre,
+            temp_data,
+            fill_data,
+            layer_name
+        ))
+
+    def _ffmpeg_argument_parts(
+        self,
+        output_def,
+        instance,
+        new_repre,
+        temp_data,
+        fill_data,
+        layer_name
+    ):
+        """Prepares parts of ffmpeg arguments for expected extraction.
+
+        Arguments are the same as for '_ffmpeg_arguments'.
+
+        Returns:
+            tuple[list[str], list[str], list[str], list[str]]: Input
+                arguments, video filters, audio filters and output arguments
+                with output path as last item.
+        """
+
         # Get FFmpeg arguments from profile presets
         out_def_ffmpeg_args = output_def.get("ffmpeg_args") or {}
 
@@ -755,7 +870,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
+        ffmpeg_output_args = self._move_filters_from_output_args(
+            ffmpeg_video_filters, ffmpeg_audio_filters, ffmpeg_output_args
+        )
+        return (
             ffmpeg_input_args,
             ffmpeg_video_filters,
             ffmpeg_audio_filters,
@@ -804,6 +922,39 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+        output_args = self._move_filters_from_output_args(
+            video_filters, audio_filters, output_args
+        )
+
+        all_args = [
+            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
+        ]
+        all_args.extend(input_args)
+        if video_filters:
+            all_args.append("-filter:v")
+            all_args.append("\"{}\"".format(",".join(video_filters)))
+
+        if audio_filters:
+            all_args.append("-filter:a")
+            all_args.append("\"{}\"".format(",".join(audio_filters)))
+
+        all_args.extend(output_args)
+
+        return all_args
+
+    def _move_filters_from_output_args(
+        self, video_filters, audio_filters, output_args
+    ):
+        """Move video and audio filters from output arguments to filters.
+
+        Args:
+            video_filters (list): Video filters, are modified in place.
+            audio_filters (list): Audio filters, are modified in place.
+            output_args (list): Output arguments.
+
+        Returns:
+            list: Output arguments without filters.
+        """
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -820,30 +971,59 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     output_args.remove(arg)
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
+        return output_args
+
+    def ffmpeg_multi_output_args(self, outputs_parts, with_audio):
+        """Arguments rendering multiple outputs from single decode of input.
+
+        Video stream of input is split with 'split' filter and video filters
+        of each output are applied to its own branch of filter graph.
+
+        Args:
+            outputs_parts (list[tuple[list, list, list, list]]): Input
+                arguments, video filters, audio filters and output arguments
+                of each output. Input arguments must be the same for all
+                outputs and audio filters must be empty.
+            with_audio (list[bool]): Map audio of input to output, if has
+                any. Should be 'False' for image outputs.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+        input_args = outputs_parts[0][0]
+        split_labels = "".join(
+            "[s{}]".format(idx) for idx in range(len(outputs_parts))
+        )
+        graph_parts = ["[0:v]split={}{}".format(
+            len(outputs_parts), split_labels
+        )]
+        output_args = []
+        for idx, parts in enumerate(outputs_parts):
+            _, video_filters, _, _output_args = parts
+            filters = ",".join(video_filters) or "null"
+            graph_parts.append("[s{0}]{1}[v{0}]".format(idx, filters))
+            output_args.extend(["-map", "\"[v{}]\"".format(idx)])
+            if with_audio[idx]:
+                output_args.extend(["-map", "0:a?"])
+            output_args.extend(_output_args)
 
         all_args = [
             subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
         ]
         all_args.extend(input_args)
-        if video_filters:
-            all_args.append("-filter:v")
-            all_args.append("\"{}\"".format(",".join(video_filters)))
-
-        if audio_filters:
-            all_args.append("-filter:a")
-            all_args.append("\"{}\"".format(",".join(audio_filters)))
-
+        all_args.append("-filter_complex")
+        all_args.append("\"{}\"".format(";".join(graph_parts)))
         all_args.extend(output_args)
-
         return all_args
 
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
         # type: (list, str, int, int) -> list
         """Fill missing files in sequence by duplicating existing ones.
 
-        This will take nearest frame file and copy it with so as to fill
+        This will take nearest frame file and link it with so as to fill
         gaps in sequence. Last existing file there is is used to for the
-        hole ahead.
+        hole ahead. Hardlinks, reflinks or symlinks are used if filesystem
+        supports them, file is copied otherwise.
 
         Args:
             files (list): List of representation files.
@@ -879,6 +1059,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         # Calculate paths
         added_files = []
+        methods_count = {}
         col_format = col.format("{head}{padding}{tail}")
         for hole_frame, src_frame in hole_frame_to_nearest.items():
             hole_fpath = os.path.join(staging_dir, col_format % hole_frame)
@@ -887,9 +1068,18 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 raise KnownPublishError(
                     "Missing previously detected file: {}".format(src_fpath))
 
-            speedcopy.copyfile(src_fpath, hole_fpath)
+            method = duplicate_file(src_fpath, hole_fpath)
+            methods_count[method] = methods_count.get(method, 0) + 1
             added_files.append(hole_fpath)
 
+        if methods_count:
+            self.log.debug("Filled {} missing frames ({}).".format(
+                len(added_files),
+                ", ".join(
+                    "{}: {}".format(method, count)
+                    for method, count in sorted(methods_count.items())
+                )
+            ))
         return added_files
 
     def input_output_paths(self, new_repre, output_def, temp_data):
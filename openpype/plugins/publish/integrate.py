@@ -25,7 +25,10 @@ from openpype.client import (
     get_subset_by_name,
     get_version_by_name,
 )
-from openpype.lib import source_hash
+from openpype.lib import (
+    source_hash_from_stat,
+    get_files_stats,
+)
 from openpype.lib.file_transaction import (
     FileTransaction,
     DuplicateDestinationError
@@ -145,6 +148,10 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
     default_template_name = "publish"
 
+    # Amount of threads used to transfer files to publish destinations
+    #   - '1' transfers files one by one
+    file_transfer_workers = 8
+
     # Representation context keys that should always be written to
     # the database even if not used by the destination template
     db_representation_context_keys = [
@@ -175,9 +182,12 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["family"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.file_transfer_workers
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
@@ -762,22 +772,19 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+            #   - template is fully solved only for first index to get
+            #       context, other paths are created by sequence formatting
+            index_key = "udim" if is_udim else "frame"
+            template_data[index_key] = destination_indexes[0]
+            template_filled = path_template_obj.format_strict(template_data)
+            self.log.debug(
+                "Template filled: {}".format(str(template_filled))
+            )
+            repre_context = template_filled.used_values
+            dst_filepaths = path_template_obj.format_sequence(
+                template_data, destination_indexes, index_key
+            )
+            template_data[index_key] = destination_indexes[-1]
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -994,12 +1001,56 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             in representation
         """
 
+        # Stat all files at once and reuse the result for size and hash
+        stats_by_path = get_files_stats(
+            destinations, max_workers=self.file_transfer_workers
+        )
+        rootless_paths = self.get_rootless_paths(anatomy, destinations)
+
         file_infos = []
-        for file_path in destinations:
-            file_info = self.prepare_file_info(file_path, anatomy, sites=sites)
-            file_infos.append(file_info)
+        for file_path, rootless_path in zip(destinations, rootless_paths):
+            stat_result = stats_by_path[file_path]
+            file_infos.append({
+                "_id": ObjectId(),
+                "path": rootless_path,
+                "size": stat_result.st_size,
+                "hash": source_hash_from_stat(file_path, stat_result),
+                "sites": sites
+            })
         return file_infos
 
+    def get_rootless_paths(self, anatomy, paths):
+        """Returns rootless paths for multiple paths.
+
+        Rootless path is calculated only once per directory of the paths.
+
+        Args:
+            anatomy (Anatomy): Project anatomy.
+            paths (list[str]): Absolute paths.
+
+        Returns:
+            list[str]: Rootless paths or unmodified paths if root is not
+                found.
+        """
+
+        rootless_dirs = {}
+        output = []
+        for path in paths:
+            dirname, basename = os.path.split(path)
+            if dirname not in rootless_dirs:
+                success, rootless_dir = anatomy.find_root_template_from_path(
+                    dirname
+                )
+                rootless_dirs[dirname] = rootless_dir if success else None
+
+            rootless_dir = rootless_dirs[dirname]
+            if rootless_dir is None:
+                # Log warning for path that can't be remapped
+                output.append(self.get_rootless_path(anatomy, path))
+            else:
+                output.append(rootless_dir.rstrip("/") + "/" + basename)
+        return output
+
     def prepare_file_info(self, path, anatomy, sites):
         """ Prepare information for one file (asset or resource)
 
@@ -1014,11 +1065,12 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             dict: file info dictionary
         """
 
+        stat_result = os.stat(path)
         return {
             "_id": ObjectId(),
             "path": self.get_rootless_path(anatomy, path),
-            "size": os.path.getsize(path),
-            "hash": source_hash(path),
+            "size": stat_result.st_size,
+            "hash": source_hash_from_stat(path, stat_result),
             "sites": sites
         }
 
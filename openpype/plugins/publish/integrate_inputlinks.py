@@ -4,6 +4,7 @@ from bson.objectid import ObjectId
 import pyblish.api
 
 from openpype import AYON_SERVER_ENABLED
+from openpype.client import clear_entities_cache
 from openpype.pipeline import legacy_io
 
 
@@ -135,6 +136,7 @@ class IntegrateInputLinks(pyblish.api.ContextPlugin):
                 {"_id": version_doc["_id"]},
                 {"$set": {"data.inputLinks": input_links}}
             )
+            clear_entities_cache(instance.context.data["projectName"])
 
 
 if AYON_SERVER_ENABLED:
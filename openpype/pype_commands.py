@@ -94,6 +94,7 @@ class PypeCommands:
             install_openpype_plugins,
             get_global_context,
         )
+        from openpype.client import entities_cache
         from openpype.tools.utils.host_tools import show_publish
         from openpype.tools.utils.lib import qt_app_context
 
@@ -154,11 +155,13 @@ class PypeCommands:
             error_format = ("Failed {plugin.__name__}: "
                             "{error} -- {error.traceback}")
 
-            for result in pyblish.util.publish_iter():
-                if result["error"]:
-                    log.error(error_format.format(**result))
-                    # uninstall()
-                    sys.exit(1)
+            # Point queries of entities are cached during publishing
+            with entities_cache():
+                for result in pyblish.util.publish_iter():
+                    if result["error"]:
+                        log.error(error_format.format(**result))
+                        # uninstall()
+                        sys.exit(1)
 
         log.info("Publish finished.")
 
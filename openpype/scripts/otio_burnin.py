@@ -820,12 +820,16 @@ def burnins_from_data(
         os.remove(path)
 
 
-if __name__ == "__main__":
-    print("* Burnin script started")
-    in_data_json_path = sys.argv[-1]
-    with open(in_data_json_path, "r") as file_stream:
-        in_data = json.load(file_stream)
+def burnins_from_script_data(in_data):
+    """Add burnins using data passed to the script.
+
+    Entry point which can be used in process instead of running the script.
+    Passed data are modified during processing.
 
+    Args:
+        in_data (dict[str, Any]): Data which are passed to script in json
+            file, e.g. by 'ExtractBurnin' plugin.
+    """
     burnins_from_data(
         in_data["input"],
         in_data["output"],
@@ -837,4 +841,13 @@ if __name__ == "__main__":
         first_frame=in_data.get("first_frame"),
         source_ffmpeg_cmd=in_data.get("ffmpeg_cmd")
     )
+
+
+if __name__ == "__main__":
+    print("* Burnin script started")
+    in_data_json_path = sys.argv[-1]
+    with open(in_data_json_path, "r") as file_stream:
+        in_data = json.load(file_stream)
+
+    burnins_from_script_data(in_data)
     print("* Burnin script has finished")
@@ -1,6 +1,8 @@
 import os
 import json
 import copy
+import itertools
+import functools
 import collections
 import datetime
 from abc import ABCMeta, abstractmethod
@@ -28,6 +30,7 @@ from .constants import (
 
     LEGACY_SETTINGS_VERSION
 )
+from .lib import copy_settings_data
 
 
 class SettingsStateInfo:
@@ -457,6 +460,22 @@ class SettingsHandler(object):
 
         pass
 
+    def get_project_settings_revision(self, project_name):
+        """Revision of studio and project overrides of project settings.
+
+        Revision changes when any of the overrides changed. Used as key of
+        cached merged project settings.
+
+        Args:
+            project_name(str): Name of project.
+
+        Returns:
+            Union[Hashable, None]: Revision or None if revisions are not
+                supported by handler.
+        """
+
+        return None
+
     @abstractmethod
     def get_system_last_saved_info(self):
         """State of last system settings overrides at the moment when called.
@@ -558,24 +577,60 @@ class LocalSettingsHandler:
         pass
 
 
+def get_document_fingerprint(document):
+    """Values identifying state of settings document.
+
+    Args:
+        document (Union[dict, None]): Settings document.
+
+    Returns:
+        Union[tuple, None]: Document id with timestamp of last save,
+            '(None, None)' if document does not exist or None if state of
+            document can't be identified.
+    """
+    if document is None:
+        return None, None
+
+    last_saved_info = document.get("last_saved_info") or {}
+    timestamp = last_saved_info.get("timestamp")
+    if not timestamp or "_id" not in document:
+        return None
+    return document["_id"], timestamp
+
+
 class CacheValues:
     cache_lifetime = 10
+    # Revisions are unique across all cache objects
+    _revision_counter = itertools.count(1)
 
-    def __init__(self):
+    def __init__(self, lifetime=None):
+        if lifetime is None:
+            lifetime = self.cache_lifetime
+        self.lifetime = lifetime
         self.data = None
         self.creation_time = None
         self.version = None
         self.last_saved_info = None
+        # Changed each time data change
+        self.revision = None
+        # State of source document used for revalidation
+        self.fingerprint = None
 
     def data_copy(self):
         if not self.data:
             return {}
-        return copy.deepcopy(self.data)
+        return copy_settings_data(self.data)
 
-    def update_data(self, data, version):
+    def _set_data(self, data):
+        if self.revision is None or data != self.data:
+            self.revision = next(self._revision_counter)
         self.data = data
+
+    def update_data(self, data, version):
+        self._set_data(data)
         self.creation_time = datetime.datetime.now()
         self.version = version
+        self.fingerprint = None
 
     def update_last_saved_info(self, last_saved_info):
         self.last_saved_info = last_saved_info
@@ -590,8 +645,10 @@ class CacheValues:
                 if value:
                     data = json.loads(value)
 
-        self.data = data
+        self._set_data(data)
+        self.creation_time = datetime.datetime.now()
         self.version = version
+        self.fingerprint = get_document_fingerprint(document)
 
     def to_json_string(self):
         return json.dumps(self.data or {})
@@ -600,11 +657,15 @@ class CacheValues:
     def is_outdated(self):
         if self.creation_time is None:
             return True
-        delta = (datetime.datetime.now() - self.creation_time).seconds
-        return delta > self.cache_lifetime
+        delta = datetime.datetime.now() - self.creation_time
+        return delta.total_seconds() > self.lifetime
 
     def set_outdated(self):
-        self.create_time = None
+        self.creation_time = None
+
+    def mark_valid(self):
+        """Data were validated to be up to date."""
+        self.creation_time = datetime.datetime.now()
 
 
 class MongoSettingsHandler(SettingsHandler):
@@ -612,8 +673,14 @@ class MongoSettingsHandler(SettingsHandler):
     key_suffix = "_versioned"
     _version_order_key = "versions_order"
     _all_versions_keys = "all_versions"
+    # Seconds after which cached values are revalidated
+    cache_lifetime = CacheValues.cache_lifetime
+    _fingerprint_projection = {
+        "_id": True,
+        "last_saved_info.timestamp": True
+    }
 
-    def __init__(self):
+    def __init__(self, cache_lifetime=None):
         # Get mongo connection
         settings_collection = OpenPypeMongoConnection.get_mongo_client()
 
@@ -638,10 +705,16 @@ class MongoSettingsHandler(SettingsHandler):
 
         self.collection = settings_collection[database_name][collection_name]
 
-        self.global_settings_cache = CacheValues()
-        self.system_settings_cache = CacheValues()
-        self.project_settings_cache = collections.defaultdict(CacheValues)
-        self.project_anatomy_cache = collections.defaultdict(CacheValues)
+        if cache_lifetime is not None:
+            self.cache_lifetime = cache_lifetime
+        create_cache = functools.partial(CacheValues, self.cache_lifetime)
+
+        self.global_settings_cache = create_cache()
+        self.system_settings_cache = create_cache()
+        # Revision of global settings applied on cached system settings
+        self._system_globals_revision = None
+        self.project_settings_cache = collections.defaultdict(create_cache)
+        self.project_anatomy_cache = collections.defaultdict(create_cache)
 
     def _prepare_project_settings_keys(self):
         from .entities import ProjectSettings
@@ -1057,6 +1130,38 @@ class MongoSettingsHandler(SettingsHandler):
         else:
             self.collection.insert_one(new_project_settings_doc)
 
+    def _revalidate_cache(self, cache, document_filter):
+        """Revalidate outdated cache with cheap query of document state.
+
+        Whole document is not queried again if id and last save timestamp
+        of document did not change since it was cached.
+
+        Args:
+            cache (CacheValues): Outdated cache.
+            document_filter (dict): Filter of settings document for current
+                version.
+
+        Returns:
+            bool: Cached values are up to date.
+        """
+        fingerprint = cache.fingerprint
+        if fingerprint is None:
+            return False
+
+        document = self.collection.find_one(
+            document_filter, self._fingerprint_projection
+        )
+        # Cached document was found as closest version of settings
+        if document is None and fingerprint[0] is not None:
+            document = self.collection.find_one(
+                {"_id": fingerprint[0]}, self._fingerprint_projection
+            )
+
+        if get_document_fingerprint(document) != fingerprint:
+            return False
+        cache.mark_valid()
+        return True
+
     def _get_versions_order_doc(self, projection=None):
         # TODO cache
         return self.collection.find_one(
@@ -1298,18 +1403,27 @@ class MongoSettingsHandler(SettingsHandler):
                 "type": SYSTEM_SETTINGS_KEY
             })
 
+        return self.collection.find_one(
+            self._get_system_settings_filter(version)
+        )
+
+    def _get_system_settings_filter(self, version=None):
         if version is None:
             version = self._current_version
-
-        return self.collection.find_one({
+        return {
             "type": self._system_settings_key,
             "version": version
-        })
+        }
 
     def _get_project_settings_overrides_for_version(
         self, project_name, version=None
     ):
         # QUESTION cache?
+        return self.collection.find_one(
+            self._get_project_settings_filter(project_name, version)
+        )
+
+    def _get_project_settings_filter(self, project_name, version=None):
         if version == LEGACY_SETTINGS_VERSION:
             document_filter = {
                 "type": PROJECT_SETTINGS_KEY
@@ -1328,7 +1442,7 @@ class MongoSettingsHandler(SettingsHandler):
             document_filter["is_default"] = True
         else:
             document_filter["project_name"] = project_name
-        return self.collection.find_one(document_filter)
+        return document_filter
 
     def _get_project_anatomy_overrides_for_version(self, version=None):
         # QUESTION cache?
@@ -1338,19 +1452,40 @@ class MongoSettingsHandler(SettingsHandler):
                 "is_default": True
             })
 
+        return self.collection.find_one(
+            self._get_project_anatomy_filter(version)
+        )
+
+    def _get_project_anatomy_filter(self, version=None):
         if version is None:
             version = self._current_version
-
-        return self.collection.find_one({
+        return {
             "type": self._project_anatomy_key,
             "is_default": True,
             "version": version
-        })
+        }
+
+    def _is_system_settings_cache_valid(self):
+        cache = self.system_settings_cache
+        if not cache.is_outdated:
+            return True
+
+        # Global settings are applied on system settings
+        self.get_global_settings_doc()
+        globals_revision = self.global_settings_cache.revision
+        if globals_revision != self._system_globals_revision:
+            return False
+        return self._revalidate_cache(
+            cache, self._get_system_settings_filter()
+        )
 
     def get_studio_system_settings_overrides(self, return_version):
         """Studio overrides of system settings."""
-        if self.system_settings_cache.is_outdated:
+        if not self._is_system_settings_cache_valid():
             globals_document = self.get_global_settings_doc()
+            self._system_globals_revision = (
+                self.global_settings_cache.revision
+            )
             document, version = self._get_system_settings_overrides_doc()
 
             last_saved_info = SettingsStateInfo.from_document(
@@ -1396,8 +1531,11 @@ class MongoSettingsHandler(SettingsHandler):
 
         return self.system_settings_cache.last_saved_info.copy()
 
-    def _get_project_settings_overrides(self, project_name, return_version):
-        if self.project_settings_cache[project_name].is_outdated:
+    def _get_project_settings_cache(self, project_name):
+        cache = self.project_settings_cache[project_name]
+        if cache.is_outdated and not self._revalidate_cache(
+            cache, self._get_project_settings_filter(project_name)
+        ):
             document, version = self._get_project_settings_overrides_doc(
                 project_name
             )
@@ -1410,8 +1548,10 @@ class MongoSettingsHandler(SettingsHandler):
             self.project_settings_cache[project_name].update_last_saved_info(
                 last_saved_info
             )
+        return self.project_settings_cache[project_name]
 
-        cache = self.project_settings_cache[project_name]
+    def _get_project_settings_overrides(self, project_name, return_version):
+        cache = self._get_project_settings_cache(project_name)
         data = cache.data_copy()
         if return_version:
             return data, cache.version
@@ -1444,6 +1584,15 @@ class MongoSettingsHandler(SettingsHandler):
         """Studio overrides of default project settings."""
         return self._get_project_settings_overrides(None, return_version)
 
+    def get_project_settings_revision(self, project_name):
+        studio_revision = self._get_project_settings_cache(None).revision
+        project_revision = None
+        if project_name:
+            project_revision = (
+                self._get_project_settings_cache(project_name).revision
+            )
+        return studio_revision, project_revision
+
     def get_project_settings_overrides(self, project_name, return_version):
         """Studio overrides of project settings for specific project.
 
@@ -1502,8 +1651,18 @@ class MongoSettingsHandler(SettingsHandler):
         return output
 
     def _get_project_anatomy_overrides(self, project_name, return_version):
-        if self.project_anatomy_cache[project_name].is_outdated:
-            if project_name is None:
+        cache = self.project_anatomy_cache[project_name]
+        if cache.is_outdated:
+            if project_name is not None:
+                project_doc = get_project(project_name)
+                cache.update_data(
+                    self.project_doc_to_anatomy_data(project_doc),
+                    self._current_version
+                )
+
+            elif not self._revalidate_cache(
+                cache, self._get_project_anatomy_filter()
+            ):
                 document = self._get_project_anatomy_overrides_for_version()
                 if document is None:
                     document = self._find_closest_project_anatomy()
@@ -1514,18 +1673,8 @@ class MongoSettingsHandler(SettingsHandler):
                         version = document["version"]
                     else:
                         version = LEGACY_SETTINGS_VERSION
-                self.project_anatomy_cache[project_name].update_from_document(
-                    document, version
-                )
-
-            else:
-                project_doc = get_project(project_name)
-                self.project_anatomy_cache[project_name].update_data(
-                    self.project_doc_to_anatomy_data(project_doc),
-                    self._current_version
-                )
+                cache.update_from_document(document, version)
 
-        cache = self.project_anatomy_cache[project_name]
         data = cache.data_copy()
         if return_version:
             return data, cache.version
@@ -1804,7 +1953,10 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
     with `get_local_site_id` function.
     """
 
-    def __init__(self, local_site_id=None):
+    # Seconds after which cached values are queried again
+    cache_lifetime = CacheValues.cache_lifetime
+
+    def __init__(self, local_site_id=None, cache_lifetime=None):
         # Get mongo connection
         from openpype.lib import get_local_site_id
 
@@ -1828,7 +1980,9 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
 
         self.local_site_id = local_site_id
 
-        self.local_settings_cache = CacheValues()
+        if cache_lifetime is not None:
+            self.cache_lifetime = cache_lifetime
+        self.local_settings_cache = CacheValues(self.cache_lifetime)
 
     def save_local_settings(self, data):
         """Save local settings.
@@ -53,6 +53,10 @@ _SETTINGS_HANDLER = None
 # Handler of local settings
 _LOCAL_SETTINGS_HANDLER = None
 
+# Merged project settings by project name and arguments
+# - values are shared and must not be modified, copy is returned to caller
+_PROJECT_SETTINGS_CACHE = {}
+
 
 def clear_metadata_from_settings(values):
     """Remove all metadata keys from loaded settings."""
@@ -67,6 +71,30 @@ def clear_metadata_from_settings(values):
             clear_metadata_from_settings(item)
 
 
+def copy_settings_data(value):
+    """Copy of settings data.
+
+    Faster alternative of 'copy.deepcopy' for json serializable data. Only
+    dictionaries and lists are copied, other json values are immutable.
+
+    Args:
+        value (Any): Settings value.
+
+    Returns:
+        Any: Copy of value.
+    """
+    if isinstance(value, dict):
+        return {
+            key: copy_settings_data(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [copy_settings_data(item) for item in value]
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return copy.deepcopy(value)
+
+
 def calculate_changes(old_value, new_value):
     changes = {}
     for key, value in new_value.items():
@@ -548,6 +576,16 @@ def reset_default_settings():
     """Reset cache of default settings. Can't be used now."""
     global _DEFAULT_SETTINGS
     _DEFAULT_SETTINGS = None
+    clear_project_settings_cache()
+
+
+def clear_project_settings_cache():
+    """Clear cache of merged project settings.
+
+    Cache is invalidated automatically when studio, project or local
+    overrides change. Clearing is needed only when defaults change.
+    """
+    _PROJECT_SETTINGS_CACHE.clear()
 
 
 def _get_default_settings():
@@ -598,10 +636,15 @@ def get_default_settings():
     Returns:
         dict: Loaded default settings.
     """
+    return copy_settings_data(_get_default_settings_data())
+
+
+def _get_default_settings_data():
+    """Cached default settings which must not be modified."""
     global _DEFAULT_SETTINGS
     if _DEFAULT_SETTINGS is None:
         _DEFAULT_SETTINGS = _get_default_settings()
-    return copy.deepcopy(_DEFAULT_SETTINGS)
+    return _DEFAULT_SETTINGS
 
 
 def load_json_file(fpath):
@@ -724,10 +767,31 @@ def merge_overrides(source_dict, override_dict):
 def apply_overrides(source_data, override_data):
     if not override_data:
         return source_data
-    _source_data = copy.deepcopy(source_data)
+    _source_data = copy_settings_data(source_data)
     return merge_overrides(_source_data, override_data)
 
 
+def _merge_overrides_shared(source_dict, override_dict):
+    """Merge overrides without modification of source data.
+
+    Same as 'merge_overrides' but only dictionaries on path to overridden
+    values are copied, other values are shared with 'source_dict'. Output
+    must be copied before it's modified.
+    """
+    output = dict(source_dict)
+    overridden_keys = set(override_dict.pop(M_OVERRIDDEN_KEY, None) or [])
+    for key, value in override_dict.items():
+        if key in overridden_keys or key not in output:
+            output[key] = value
+
+        elif isinstance(value, dict) and isinstance(output[key], dict):
+            output[key] = _merge_overrides_shared(output[key], value)
+
+        else:
+            output[key] = value
+    return output
+
+
 def _apply_applications_settings_override(system_settings, local_settings):
     current_platform = platform.system().lower()
     apps_settings = system_settings[APPS_SETTINGS_KEY]
@@ -1026,7 +1090,7 @@ def get_anatomy_settings(
     project_overrides = get_project_anatomy_overrides(
         project_name
     )
-    result = copy.deepcopy(studio_overrides)
+    result = copy_settings_data(studio_overrides)
     if project_overrides:
         for key, value in project_overrides.items():
             result[key] = value
@@ -1048,38 +1112,68 @@ def get_anatomy_settings(
     return result
 
 
+@require_handler
+def _get_project_settings_revision(project_name):
+    return _SETTINGS_HANDLER.get_project_settings_revision(project_name)
+
+
 def _get_project_settings(
     project_name, clear_metadata=True, exclude_locals=None
 ):
-    """Project settings with applied studio and project overrides."""
+    """Project settings with applied studio and project overrides.
+
+    Merged result is cached by project, revision of overrides and local
+    settings. Each call returns a new copy of the cached result.
+    """
     if not project_name:
         raise ValueError(
             "Must enter project name."
             " Call `get_default_project_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_project_settings(False)
-    project_overrides = get_project_settings_overrides(
-        project_name
-    )
+    # Apply local settings
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
 
-    result = apply_overrides(studio_overrides, project_overrides)
+    local_settings = None
+    local_settings_hash = None
+    if not exclude_locals:
+        local_settings = get_local_settings()
+        local_settings_hash = json.dumps(local_settings, sort_keys=True)
+
+    cache_key = (project_name, clear_metadata, exclude_locals)
+    revision = _get_project_settings_revision(project_name)
+    if revision is not None:
+        revision = (revision, local_settings_hash)
+        cached = _PROJECT_SETTINGS_CACHE.get(cache_key)
+        if cached is not None and cached[0] == revision:
+            return copy_settings_data(cached[1])
+
+    default_values = _get_default_settings_data()[PROJECT_SETTINGS_KEY]
+    studio_overrides = get_studio_project_settings_overrides()
+    project_overrides = get_project_settings_overrides(project_name)
+
+    # Merged values share not overridden values with defaults
+    result = default_values
+    for overrides in (studio_overrides, project_overrides):
+        if overrides:
+            result = _merge_overrides_shared(result, overrides)
+    result = copy_settings_data(result)
 
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
 
-    # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
     if not exclude_locals:
-        local_settings = get_local_settings()
         apply_local_settings_on_project_settings(
             result, local_settings, project_name
         )
 
-    return result
+    if revision is None:
+        return result
+
+    _PROJECT_SETTINGS_CACHE[cache_key] = (revision, result)
+    return copy_settings_data(result)
 
 
 def get_current_project_settings():
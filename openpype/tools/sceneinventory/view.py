@@ -1,6 +1,5 @@
 import collections
 import logging
-import itertools
 from functools import partial
 
 from qtpy import QtWidgets, QtCore
@@ -17,7 +16,7 @@ from openpype import style
 from openpype.pipeline import (
     legacy_io,
     HeroVersionType,
-    update_container,
+    update_containers,
     remove_container,
     discover_inventory_actions,
 )
@@ -839,19 +838,18 @@ class SceneInventoryView(QtWidgets.QTreeView):
                 "Number of items mismatches number of versions: "
                 "{} items - {} versions".format(len(items), len(version))
             )
-            versions = version
-        else:
-            # Repeat the same version infinitely
-            versions = itertools.repeat(version)
 
         # Trigger update to latest
         try:
-            for item, item_version in zip(items, versions):
-                try:
-                    update_container(item, item_version)
-                except AssertionError:
-                    self._show_version_error_dialog(item_version, [item])
-                    log.warning("Update failed", exc_info=True)
+            result = update_containers(items, version)
+            failed_by_version = collections.defaultdict(list)
+            for item, item_version, exc in result.failed:
+                log.warning("Update failed: {}".format(exc))
+                if isinstance(exc, AssertionError):
+                    failed_by_version[item_version].append(item)
+
+            for item_version, failed_items in failed_by_version.items():
+                self._show_version_error_dialog(item_version, failed_items)
         finally:
             # Always update the scene inventory view, even if errors occurred
             self.data_changed.emit()
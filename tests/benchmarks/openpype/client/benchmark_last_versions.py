@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Benchmark 'get_last_versions' on generated project.
+
+Generates temporary project collection with subsets having many versions
+and compares legacy aggregation (sort of all versions by name and group
+with '$last' followed by second query of version documents) with index
+backed lookup and with cached last versions.
+
+Project collection is created in project database of 'OPENPYPE_MONGO'
+and is dropped at the end.
+"""
+import sys
+import time
+import argparse
+
+from bson.objectid import ObjectId
+
+from openpype.client import get_versions
+from openpype.client.mongo import entities
+from openpype.client.mongo import get_project_connection
+
+
+def legacy_get_last_versions(project_name, subset_ids):
+    aggregation_pipeline = [
+        {"$match": {"type": "version", "parent": {"$in": subset_ids}}},
+        {"$sort": {"name": 1}},
+        {"$group": {"_id": "$parent", "_version_id": {"$last": "$_id"}}}
+    ]
+    conn = get_project_connection(project_name)
+    version_ids = [
+        doc["_version_id"]
+        for doc in conn.aggregate(aggregation_pipeline)
+    ]
+    return {
+        version_doc["parent"]: version_doc
+        for version_doc in get_versions(project_name, version_ids=version_ids)
+    }
+
+
+def uncached_get_last_versions(project_name, subset_ids):
+    entities.clear_last_versions_cache(project_name)
+    return entities.get_last_versions(project_name, subset_ids)
+
+
+def generate_project(project_name, subsets_count, versions_count):
+    conn = get_project_connection(project_name)
+    conn.drop()
+    subset_ids = []
+    for _ in range(subsets_count):
+        subset_id = ObjectId()
+        subset_ids.append(subset_id)
+        conn.insert_many([
+            {
+                "_id": ObjectId(),
+                "type": "version",
+                "parent": subset_id,
+                "name": version,
+                "schema": "openpype:version-3.0",
+                "data": {"comment": "", "families": ["render"]}
+            }
+            for version in range(1, versions_count + 1)
+        ])
+    return subset_ids
+
+
+def measure(label, func, project_name, subset_ids, count):
+    start = time.time()
+    for _ in range(count):
+        func(project_name, subset_ids)
+    elapsed = time.time() - start
+    print("{:<28} {:.3f}s ({:.2f} ms/call)".format(
+        label, elapsed, elapsed / count * 1000
+    ))
+
+
+def main(args):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--project-name", default="benchmark_last_versions")
+    parser.add_argument("--subsets", type=int, default=100)
+    parser.add_argument("--versions", type=int, default=500)
+    parser.add_argument("--queried-subsets", type=int, default=50)
+    parser.add_argument("--count", type=int, default=20)
+    parsed = parser.parse_args(args)
+
+    project_name = parsed.project_name
+    print("Generating {} subsets with {} versions".format(
+        parsed.subsets, parsed.versions
+    ))
+    subset_ids = generate_project(
+        project_name, parsed.subsets, parsed.versions
+    )
+    subset_ids = subset_ids[:parsed.queried_subsets]
+    try:
+        # Create index before measurement
+        uncached_get_last_versions(project_name, subset_ids)
+
+        print("Querying last versions of {} subsets {} times".format(
+            len(subset_ids), parsed.count
+        ))
+        measure(
+            "aggregation (legacy)", legacy_get_last_versions,
+            project_name, subset_ids, parsed.count
+        )
+        measure(
+            "index backed", uncached_get_last_versions,
+            project_name, subset_ids, parsed.count
+        )
+        measure(
+            "cached ids", entities.get_last_versions,
+            project_name, subset_ids, parsed.count
+        )
+    finally:
+        get_project_connection(project_name).drop()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
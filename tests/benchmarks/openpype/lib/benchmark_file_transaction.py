@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Benchmark publishing of synthetic image sequences with FileTransaction.
+
+Sequence of files is created in a temporary source folder and transferred
+to target folder (tmpfs '/dev/shm' if available) with different amount
+of workers.
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+import argparse
+
+from openpype.lib.file_transaction import FileTransaction
+
+
+def _get_target_root():
+    if os.path.isdir("/dev/shm"):
+        return "/dev/shm"
+    return None
+
+
+def create_sequence(root, frames, frame_size):
+    src_dir = os.path.join(root, "src")
+    os.makedirs(src_dir)
+    content = os.urandom(frame_size)
+    paths = []
+    for frame in range(1001, 1001 + frames):
+        path = os.path.join(src_dir, "render.{:04d}.exr".format(frame))
+        with open(path, "wb") as stream:
+            stream.write(content)
+        paths.append(path)
+    return paths
+
+
+def publish_sequence(sources, target_dir, max_workers, mode):
+    transaction = FileTransaction(max_workers=max_workers)
+    for src in sources:
+        transaction.add(
+            src, os.path.join(target_dir, os.path.basename(src)), mode
+        )
+
+    start = time.time()
+    transaction.process()
+    transaction.finalize()
+    return time.time() - start
+
+
+def main(args):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument(
+        "--frame-size", type=int, default=1024 * 1024,
+        help="Size of each frame in bytes"
+    )
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16]
+    )
+    parser.add_argument(
+        "--target", default=_get_target_root(),
+        help="Root where files are published (default tmpfs)"
+    )
+    parser.add_argument(
+        "--hardlink", action="store_true",
+        help="Use hardlinks instead of copies"
+    )
+    parsed = parser.parse_args(args)
+
+    mode = FileTransaction.MODE_COPY
+    if parsed.hardlink:
+        mode = FileTransaction.MODE_HARDLINK
+
+    src_root = tempfile.mkdtemp(prefix="op_bench_src_")
+    dst_root = tempfile.mkdtemp(prefix="op_bench_dst_", dir=parsed.target)
+    try:
+        sources = create_sequence(src_root, parsed.frames, parsed.frame_size)
+        print("Publishing {} frames of {} bytes to {}".format(
+            parsed.frames, parsed.frame_size, dst_root))
+        for max_workers in parsed.workers:
+            target_dir = os.path.join(dst_root, "v{:03d}".format(max_workers))
+            elapsed = publish_sequence(
+                sources, target_dir, max_workers, mode
+            )
+            print("workers: {:>3} | {:.3f}s".format(max_workers, elapsed))
+            shutil.rmtree(target_dir)
+    finally:
+        shutil.rmtree(src_root)
+        shutil.rmtree(dst_root)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Benchmark formatting of default anatomy 'publish' template.
+
+Compares formatting with recompiled template for each call (behavior
+before compiled templates cache), cached compiled templates, fast
+formatting of string only and formatting of whole frame range at once.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+from openpype.settings.lib import DEFAULTS_DIR
+from openpype.lib.path_templates import StringTemplate
+from openpype.pipeline.anatomy import AnatomyTemplates
+
+
+def get_publish_template():
+    filepath = os.path.join(DEFAULTS_DIR, "project_anatomy", "templates.json")
+    with open(filepath, "r") as stream:
+        templates = json.load(stream)
+    solved = AnatomyTemplates.solve_template_inner_links(templates)
+    return solved["publish"]["path"]
+
+
+def get_fill_data(frame):
+    return {
+        "root": {"work": "/mnt/projects"},
+        "project": {"name": "demo_project", "code": "demo"},
+        "hierarchy": "shots/sq01",
+        "asset": "sh010",
+        "family": "render",
+        "subset": "renderCompositingMain",
+        "version": 12,
+        "frame": frame,
+        "ext": "exr",
+    }
+
+
+def measure(label, func, template, count):
+    start = time.time()
+    for frame in range(count):
+        func(template, get_fill_data(frame))
+    elapsed = time.time() - start
+    print("{:<28} {:.3f}s ({:.2f} us/call)".format(
+        label, elapsed, elapsed / count * 1000000
+    ))
+
+
+def format_uncached(template, data):
+    StringTemplate.clear_cache()
+    return StringTemplate(template).format(data)
+
+
+def format_cached(template, data):
+    return StringTemplate(template).format(data)
+
+
+def format_string(template, data):
+    return StringTemplate(template).format_string(data)
+
+
+def main(args):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100000)
+    parsed = parser.parse_args(args)
+
+    template = get_publish_template()
+    print("Formatting \"{}\" {} times".format(template, parsed.count))
+    measure("compiled on each call", format_uncached, template, parsed.count)
+    measure("cached compiled template", format_cached, template, parsed.count)
+    measure("cached 'format_string'", format_string, template, parsed.count)
+
+    start = time.time()
+    StringTemplate(template).format_sequence(
+        get_fill_data(0), range(parsed.count)
+    )
+    elapsed = time.time() - start
+    print("{:<28} {:.3f}s ({:.2f} us/frame)".format(
+        "'format_sequence'", elapsed, elapsed / parsed.count * 1000000
+    ))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
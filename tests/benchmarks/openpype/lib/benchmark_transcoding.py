@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Benchmark conversion of image sequences for ffmpeg with different workers.
+
+Stub 'oiiotool' script, which sleeps for defined time and writes output
+file, is used by default so the benchmark doesn't depend on OpenImageIO
+build and measures only scheduling of conversions. Real oiiotool can be used
+with '--real', then synthetic EXRs must be passed with '--input-dir'.
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+import argparse
+
+from openpype.lib.transcoding import convert_input_paths_for_ffmpeg
+
+STUB_INFO = """<ImageSpec version="30">
+<x>0</x><y>0</y><z>0</z>
+<width>1920</width><height>1080</height><depth>1</depth>
+<nchannels>4</nchannels>
+<channelnames>
+<channelname>R</channelname><channelname>G</channelname>
+<channelname>B</channelname><channelname>A</channelname>
+</channelnames>
+<format>half</format>
+<attrib name="compression" type="string">dwaa</attrib>
+</ImageSpec>"""
+
+STUB_SCRIPT = """#!{python}
+import sys
+import time
+
+args = sys.argv[1:]
+if "--help" in args:
+    sys.exit(0)
+if "--info" in args:
+    print({info!r})
+    sys.exit(0)
+time.sleep({delay})
+with open(args[args.index("-o") + 1], "wb") as stream:
+    stream.write(b"exr")
+"""
+
+
+def create_stub_oiiotool(root, delay):
+    stub_dir = os.path.join(root, "bin")
+    os.makedirs(stub_dir)
+    path = os.path.join(stub_dir, "oiiotool")
+    with open(path, "w") as stream:
+        stream.write(STUB_SCRIPT.format(
+            python=sys.executable, info=STUB_INFO, delay=delay
+        ))
+    os.chmod(path, 0o755)
+    return stub_dir
+
+
+def create_sequence(root, frames):
+    src_dir = os.path.join(root, "src")
+    os.makedirs(src_dir)
+    paths = []
+    for frame in range(1001, 1001 + frames):
+        path = os.path.join(src_dir, "render.{:04d}.exr".format(frame))
+        with open(path, "wb") as stream:
+            stream.write(b"exr")
+        paths.append(path)
+    return paths
+
+
+def main(args):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument(
+        "--delay", type=float, default=0.05,
+        help="Time in seconds stub oiiotool spends on one frame"
+    )
+    parser.add_argument(
+        "--workers", type=int, nargs="+",
+        default=[1, 2, 4, 8, os.cpu_count() or 1]
+    )
+    parser.add_argument(
+        "--real", action="store_true",
+        help="Use configured oiiotool instead of stub"
+    )
+    parser.add_argument(
+        "--input-dir", help="Directory with EXR sequence for '--real'"
+    )
+    parsed = parser.parse_args(args)
+
+    root = tempfile.mkdtemp(prefix="op_bench_transcoding_")
+    try:
+        if parsed.real:
+            if not parsed.input_dir:
+                parser.error("'--input-dir' is required with '--real'")
+            input_paths = sorted(
+                os.path.join(parsed.input_dir, filename)
+                for filename in os.listdir(parsed.input_dir)
+                if filename.lower().endswith(".exr")
+            )
+        else:
+            os.environ["OPENPYPE_OIIO_PATHS"] = create_stub_oiiotool(
+                root, parsed.delay
+            )
+            input_paths = create_sequence(root, parsed.frames)
+
+        print("Converting {} frames".format(len(input_paths)))
+        for max_workers in sorted(set(parsed.workers)):
+            output_dir = os.path.join(root, "w{:03d}".format(max_workers))
+            os.makedirs(output_dir)
+            start = time.time()
+            convert_input_paths_for_ffmpeg(
+                input_paths, output_dir, max_workers=max_workers
+            )
+            elapsed = time.time() - start
+            print("workers: {:>3} | {:.3f}s".format(max_workers, elapsed))
+            shutil.rmtree(output_dir)
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Benchmark call cost of 'get_project_settings'.
+
+Compares merging of settings with deep copies of defaults and overrides
+on each call (behavior before cached merged project settings), merging
+with cache cleared before each call and cached merged settings.
+"""
+import sys
+import copy
+import time
+import argparse
+
+from openpype.settings import lib
+from openpype.settings.constants import PROJECT_SETTINGS_KEY
+
+
+def legacy_get_project_settings(project_name):
+    default_values = copy.deepcopy(
+        lib._get_default_settings_data()
+    )[PROJECT_SETTINGS_KEY]
+    studio_values = copy.deepcopy(lib.get_studio_project_settings_overrides())
+    studio_result = lib.merge_overrides(
+        copy.deepcopy(default_values), studio_values
+    )
+    project_values = copy.deepcopy(
+        lib.get_project_settings_overrides(project_name)
+    )
+    result = lib.merge_overrides(copy.deepcopy(studio_result), project_values)
+    lib.clear_metadata_from_settings(result)
+    lib.apply_local_settings_on_project_settings(
+        result, copy.deepcopy(lib.get_local_settings()), project_name
+    )
+    return result
+
+
+def uncached_get_project_settings(project_name):
+    lib.clear_project_settings_cache()
+    return lib.get_project_settings(project_name)
+
+
+def measure(label, func, project_name, count):
+    start = time.time()
+    for _ in range(count):
+        func(project_name)
+    elapsed = time.time() - start
+    print("{:<28} {:.3f}s ({:.2f} ms/call)".format(
+        label, elapsed, elapsed / count * 1000
+    ))
+
+
+def main(args):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("project_name")
+    parser.add_argument("--count", type=int, default=200)
+    parsed = parser.parse_args(args)
+
+    # Warm up handlers and defaults
+    lib.get_project_settings(parsed.project_name)
+
+    print("Calling 'get_project_settings' {} times".format(parsed.count))
+    measure(
+        "deep copies (legacy)", legacy_get_project_settings,
+        parsed.project_name, parsed.count
+    )
+    measure(
+        "merge on each call", uncached_get_project_settings,
+        parsed.project_name, parsed.count
+    )
+    measure(
+        "cached merged settings", lib.get_project_settings,
+        parsed.project_name, parsed.count
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
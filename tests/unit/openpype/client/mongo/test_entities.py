@@ -0,0 +1,106 @@
+"""Test last versions lookup of Mongo client entities.
+
+Uses 'mongomock' as local Mongo stand-in, test is skipped if not available.
+"""
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.client.mongo import entities
+
+mongomock = pytest.importorskip("mongomock")
+
+PROJECT_NAME = "test_project"
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    collection = mongomock.MongoClient().db[PROJECT_NAME]
+    monkeypatch.setattr(
+        entities,
+        "get_project_connection",
+        lambda project_name, database_name=None: collection
+    )
+    monkeypatch.setattr(entities, "_LAST_VERSIONS_INDEXED_PROJECTS", set())
+    entities.clear_last_versions_cache()
+    yield collection
+    entities.clear_last_versions_cache()
+
+
+def _create_versions(collection, subset_id, names, active=True):
+    docs = [
+        {
+            "_id": ObjectId(),
+            "type": "version",
+            "parent": subset_id,
+            "name": name,
+            "data": {"active": active, "comment": "v{}".format(name)}
+        }
+        for name in names
+    ]
+    collection.insert_many(docs)
+    return docs
+
+
+def test_get_last_versions(collection):
+    subset_a = ObjectId()
+    subset_b = ObjectId()
+    docs_a = _create_versions(collection, subset_a, [3, 1, 12, 2])
+    docs_b = _create_versions(collection, subset_b, [1])
+    _create_versions(collection, subset_b, [2], active=False)
+
+    result = entities.get_last_versions(
+        PROJECT_NAME, [str(subset_a), subset_b, ObjectId()]
+    )
+    assert set(result) == {subset_a, subset_b}
+    assert result[subset_a]["_id"] == docs_a[2]["_id"]
+    assert result[subset_a]["data"]["comment"] == "v12"
+    assert result[subset_b]["name"] == 2
+
+    result = entities.get_last_versions(
+        PROJECT_NAME, [subset_b], active=True, fields=["data.comment"]
+    )
+    assert result[subset_b]["_id"] == docs_b[0]["_id"]
+    assert result[subset_b]["data"] == {"comment": "v1"}
+
+    index_names = collection.index_information().keys()
+    assert entities.LAST_VERSIONS_INDEX_NAME in index_names
+
+
+def test_get_last_versions_cache(collection, monkeypatch):
+    subset_id = ObjectId()
+    _create_versions(collection, subset_id, [1, 2])
+
+    result = entities.get_last_versions(
+        PROJECT_NAME, [subset_id], fields=["_id"]
+    )
+    assert result[subset_id]["name"] == 2
+
+    # Cached ids are used without aggregation
+    new_doc, = _create_versions(collection, subset_id, [3])
+    monkeypatch.setattr(
+        collection,
+        "aggregate",
+        lambda *args, **kwargs: pytest.fail("Cache was not used")
+    )
+    result = entities.get_last_versions(
+        PROJECT_NAME, [subset_id], fields=["_id", "name"]
+    )
+    assert result[subset_id]["name"] == 2
+    monkeypatch.undo()
+
+    entities.clear_last_versions_cache(PROJECT_NAME)
+    monkeypatch.setattr(
+        entities,
+        "get_project_connection",
+        lambda project_name, database_name=None: collection
+    )
+    result = entities.get_last_versions(
+        PROJECT_NAME, [subset_id], fields=["_id"]
+    )
+    assert result[subset_id]["_id"] == new_doc["_id"]
+
+    # Expired cache is not used
+    collection.delete_one({"_id": new_doc["_id"]})
+    monkeypatch.setattr(entities, "LAST_VERSIONS_CACHE_TIMEOUT", -1)
+    result = entities.get_last_versions(PROJECT_NAME, [subset_id])
+    assert result[subset_id]["name"] == 2
@@ -0,0 +1,120 @@
+"""Test scoped entities cache of Mongo client.
+
+Uses 'mongomock' as local Mongo stand-in, test is skipped if not available.
+"""
+import threading
+
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.client.mongo import entities
+from openpype.client.mongo import entities_cache
+from openpype.client.mongo import operations
+
+mongomock = pytest.importorskip("mongomock")
+
+PROJECT_NAME = "test_project"
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    collection = mongomock.MongoClient().db[PROJECT_NAME]
+
+    def get_project_connection(project_name, database_name=None):
+        return collection
+
+    for module in (entities, entities_cache, operations):
+        monkeypatch.setattr(
+            module, "get_project_connection", get_project_connection
+        )
+    return collection
+
+
+def _create_docs(collection):
+    asset_doc = {
+        "_id": ObjectId(),
+        "type": "asset",
+        "name": "sh010",
+        "data": {"frameStart": 1001, "frameEnd": 1010}
+    }
+    version_docs = [
+        {"_id": ObjectId(), "type": "version", "name": idx, "data": {}}
+        for idx in range(5)
+    ]
+    collection.insert_many([asset_doc] + version_docs)
+    return asset_doc, version_docs
+
+
+def test_entities_cache_deduplicates_lookups(collection):
+    asset_doc, version_docs = _create_docs(collection)
+    asset_id = asset_doc["_id"]
+
+    with entities_cache.entities_cache() as cache:
+        doc = entities.get_asset_by_id(PROJECT_NAME, str(asset_id))
+        assert doc == asset_doc
+        doc["data"]["frameStart"] = 1
+        # Modification of returned document does not affect cache
+        assert entities.get_asset_by_id(
+            PROJECT_NAME, asset_id, fields=["data.frameEnd"]
+        ) == {"_id": asset_id, "data": {"frameEnd": 1010}}
+        assert entities.get_asset_by_name(
+            PROJECT_NAME, "sh010"
+        )["data"]["frameStart"] == 1001
+        entities.get_asset_by_name(PROJECT_NAME, "sh010")
+        # Asset is not a version
+        assert entities.get_version_by_id(PROJECT_NAME, asset_id) is None
+        assert entities.get_asset_by_name(PROJECT_NAME, "missing") is None
+        assert entities.get_asset_by_name(PROJECT_NAME, "missing") is None
+        assert cache.queries_count == 3
+
+    assert entities_cache.get_active_entities_cache() is None
+
+
+def test_entities_cache_prefetch(collection):
+    _, version_docs = _create_docs(collection)
+    version_ids = [doc["_id"] for doc in version_docs]
+
+    with entities_cache.entities_cache() as cache:
+        cache.prefetch(PROJECT_NAME, version_ids)
+        for version_id, version_doc in zip(version_ids, version_docs):
+            doc = entities.get_version_by_id(PROJECT_NAME, version_id)
+            assert doc == version_doc
+        assert cache.queries_count == 1
+
+        # Nested scope uses the same cache
+        with entities_cache.entities_cache() as nested_cache:
+            assert nested_cache is cache
+
+
+def test_entities_cache_cleared_on_commit(collection):
+    asset_doc, _ = _create_docs(collection)
+
+    with entities_cache.entities_cache():
+        doc = entities.get_asset_by_id(PROJECT_NAME, asset_doc["_id"])
+        assert doc["name"] == "sh010"
+
+        session = operations.MongoOperationsSession()
+        session.update_entity(
+            PROJECT_NAME, "asset", asset_doc["_id"], {"name": "sh020"}
+        )
+        session.commit()
+
+        doc = entities.get_asset_by_id(PROJECT_NAME, asset_doc["_id"])
+        assert doc["name"] == "sh020"
+
+
+def test_entities_cache_thread_local(collection):
+    asset_doc, _ = _create_docs(collection)
+    thread_caches = []
+
+    def lookup():
+        thread_caches.append(entities_cache.get_active_entities_cache())
+        entities.get_asset_by_id(PROJECT_NAME, asset_doc["_id"])
+
+    with entities_cache.entities_cache() as cache:
+        thread = threading.Thread(target=lookup)
+        thread.start()
+        thread.join()
+        # Scope is not active in other threads
+        assert thread_caches == [None]
+        assert cache.queries_count == 0
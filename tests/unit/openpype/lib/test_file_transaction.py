@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Test suite for file transaction."""
+import os
+
+import pytest
+
+from openpype.lib.file_transaction import FileTransaction
+
+
+def _create_sources(root, count):
+    src_dir = os.path.join(root, "src")
+    os.makedirs(src_dir)
+    paths = []
+    for idx in range(count):
+        path = os.path.join(src_dir, "file.{:04d}.exr".format(idx))
+        with open(path, "w") as stream:
+            stream.write(str(idx))
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_process_keeps_queue_order(tmpdir, max_workers):
+    sources = _create_sources(str(tmpdir), 20)
+    dst_dir = os.path.join(str(tmpdir), "dst", "v001")
+
+    transaction = FileTransaction(max_workers=max_workers, chunk_size=3)
+    expected = []
+    for src in sources:
+        dst = os.path.join(dst_dir, os.path.basename(src))
+        transaction.add(src, dst)
+        expected.append(os.path.normpath(dst))
+
+    transaction.process()
+
+    assert transaction.transferred == expected
+    for src, dst in zip(sources, expected):
+        with open(src) as src_stream, open(dst) as dst_stream:
+            assert src_stream.read() == dst_stream.read()
+
+
+def test_parallel_rollback_restores_backups(tmpdir):
+    sources = _create_sources(str(tmpdir), 10)
+    dst_dir = os.path.join(str(tmpdir), "dst")
+    os.makedirs(dst_dir)
+
+    transaction = FileTransaction(max_workers=4, chunk_size=4)
+    for src in sources:
+        dst = os.path.join(dst_dir, os.path.basename(src))
+        with open(dst, "w") as stream:
+            stream.write("original")
+        transaction.add(src, dst)
+
+    # Make one transfer fail
+    missing_src = sources[5]
+    os.remove(missing_src)
+
+    with pytest.raises(Exception):
+        transaction.process()
+
+    assert len(transaction.backups) == len(sources)
+    assert missing_src not in transaction.transferred
+
+    transaction.rollback()
+
+    for filename in os.listdir(dst_dir):
+        assert not filename.endswith(".bak")
+        with open(os.path.join(dst_dir, filename)) as stream:
+            assert stream.read() == "original"
@@ -0,0 +1,107 @@
+"""Test of queue based mongo log handler.
+
+Uses fake collection so no Mongo server is needed.
+"""
+import os
+import logging
+import threading
+
+from pymongo.errors import AutoReconnect
+
+from openpype.lib.log import MongoQueueHandler
+
+
+class FakeCollection:
+    def __init__(self):
+        self.available = True
+        self.batches = []
+        self.unblock = threading.Event()
+        self.unblock.set()
+
+    def insert_many(self, documents, ordered=True):
+        self.unblock.wait()
+        if not self.available:
+            raise AutoReconnect("Mongo is not reachable")
+        self.batches.append([doc["message"] for doc in documents])
+
+    @property
+    def messages(self):
+        return [message for batch in self.batches for message in batch]
+
+
+class DictFormatter(logging.Formatter):
+    def format(self, record):
+        return {"message": record.getMessage()}
+
+
+def _create_logger(handler):
+    handler.setFormatter(DictFormatter())
+    logger = logging.getLogger("test_mongo_queue_handler")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def test_records_written_in_batches(tmpdir):
+    collection = FakeCollection()
+    handler = MongoQueueHandler(
+        collection, batch_size=10, flush_interval=0.1, spill_dir=str(tmpdir)
+    )
+    logger = _create_logger(handler)
+    collection.unblock.clear()
+    for idx in range(25):
+        logger.debug("record %s", idx)
+    collection.unblock.set()
+    handler.close()
+
+    assert collection.messages == [
+        "record {}".format(idx) for idx in range(25)
+    ]
+    assert max(len(batch) for batch in collection.batches) == 10
+    assert len(collection.batches) < 25
+
+
+def test_full_queue_drops_records(tmpdir):
+    collection = FakeCollection()
+    collection.unblock.clear()
+    handler = MongoQueueHandler(
+        collection,
+        queue_size=5,
+        batch_size=1,
+        flush_interval=0.1,
+        spill_dir=str(tmpdir)
+    )
+    logger = _create_logger(handler)
+    for idx in range(20):
+        logger.info("record %s", idx)
+    assert handler.dropped_count > 0
+
+    collection.unblock.set()
+    handler.close()
+    assert len(collection.messages) + handler.dropped_count == 20
+
+
+def test_records_spilled_when_mongo_unreachable(tmpdir):
+    spill_dir = str(tmpdir)
+    collection = FakeCollection()
+    collection.available = False
+    handler = MongoQueueHandler(
+        collection,
+        flush_interval=0.1,
+        spill_dir=spill_dir,
+        retry_interval=0
+    )
+    logger = _create_logger(handler)
+    logger.info("spilled 1")
+    logger.info("spilled 2")
+    handler.flush()
+    assert collection.messages == []
+    assert len(os.listdir(spill_dir)) == 1
+
+    collection.available = True
+    logger.info("written")
+    handler.close()
+
+    assert sorted(collection.messages) == ["spilled 1", "spilled 2", "written"]
+    assert os.listdir(spill_dir) == []
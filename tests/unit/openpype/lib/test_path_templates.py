@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Test suite for path templates."""
+import pytest
+
+from openpype.lib import path_templates
+from openpype.lib.path_templates import (
+    StringTemplate,
+    TemplateUnsolved,
+)
+
+TEMPLATE = (
+    "{root[work]}/{project[name]}/{asset}/v{version:0>3}"
+    "/{asset}_v{version:0>3}<_{output}><.{frame:0>4}><_{udim}>.{ext}"
+)
+
+
+def _get_data():
+    return {
+        "root": {"work": "/mnt/work"},
+        "project": {"name": "demo"},
+        "asset": "sh010",
+        "version": 1,
+        "frame": 1001,
+        "ext": "exr",
+    }
+
+
+def test_compiled_parts_are_shared():
+    first = StringTemplate(TEMPLATE)
+    second = StringTemplate(TEMPLATE)
+    assert first._parts is second._parts
+
+
+def test_compiled_parts_cache_size(monkeypatch):
+    monkeypatch.setattr(path_templates, "TEMPLATE_CACHE_SIZE", 2)
+    StringTemplate.clear_cache()
+    for idx in range(5):
+        StringTemplate("{{asset}}_{}".format(idx))
+        assert len(path_templates._COMPILED_TEMPLATES) <= 2
+    StringTemplate.clear_cache()
+
+
+def test_format_string_matches_format():
+    template = StringTemplate(TEMPLATE)
+    data = _get_data()
+    expected = "/mnt/work/demo/sh010/v001/sh010_v001.1001.exr"
+    assert str(template.format(data)) == expected
+    assert template.format_string(data) == expected
+
+
+def test_format_string_unsolved():
+    template = StringTemplate(TEMPLATE)
+    data = _get_data()
+    data.pop("ext")
+    data["project"] = "demo"
+
+    result = template.format(data)
+    assert template.format_string(data, strict=False) == str(result)
+    with pytest.raises(TemplateUnsolved):
+        template.format_string(data)
+
+
+def test_format_string_nested_optional():
+    template = StringTemplate("{a}<_{b}<_{c}>>.ext")
+    assert template.format_string({"a": 1, "b": 2}) == "1_2.ext"
+    assert template.format_string({"a": 1, "b": 2, "c": 3}) == "1_2_3.ext"
+    assert template.format_string({"a": 1, "c": 3}) == "1.ext"
+
+
+def test_format_sequence_matches_format():
+    template = StringTemplate(TEMPLATE)
+    data = _get_data()
+    frames = list(range(998, 1010))
+
+    expected = []
+    for frame in frames:
+        data["frame"] = frame
+        expected.append(str(template.format_strict(data)))
+
+    assert template.format_sequence(data, frames) == expected
+
+
+def test_format_sequence_optional_key():
+    template = StringTemplate("{a}<_{b}_{frame:0>4}>.ext")
+    assert template.format_sequence({"a": 1}, [1, 2]) == ["1.ext", "1.ext"]
+    assert template.format_sequence({"a": 1, "b": 2}, [1, 2]) == [
+        "1_2_0001.ext", "1_2_0002.ext"
+    ]
+
+
+def test_format_sequence_unsolved():
+    template = StringTemplate(TEMPLATE)
+    data = _get_data()
+    data.pop("asset")
+    with pytest.raises(TemplateUnsolved):
+        template.format_sequence(data, [1001, 1002])
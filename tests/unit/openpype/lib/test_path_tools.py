@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Test suite for path tools."""
+import os
+
+import pytest
+
+from openpype.lib import (
+    duplicate_file,
+    get_files_stats,
+    source_hash,
+    source_hash_from_stat,
+)
+from openpype.lib import path_tools
+
+
+def _create_files(root, dirnames, count):
+    paths = []
+    for dirname in dirnames:
+        dirpath = os.path.join(root, dirname)
+        os.makedirs(dirpath)
+        for idx in range(count):
+            path = os.path.join(dirpath, "file.{:04d}.exr".format(idx))
+            with open(path, "w") as stream:
+                stream.write("x" * idx)
+            paths.append(path)
+    return paths
+
+
+def test_get_files_stats(tmpdir):
+    paths = _create_files(str(tmpdir), ["a", "b", "c"], 5)
+    # Unrelated file in directory
+    with open(os.path.join(str(tmpdir), "a", "other.txt"), "w"):
+        pass
+
+    stats_by_path = get_files_stats(paths, max_workers=2)
+
+    assert list(stats_by_path.keys()) == paths
+    for path in paths:
+        stat_result = stats_by_path[path]
+        assert stat_result.st_size == os.path.getsize(path)
+        assert (
+            source_hash_from_stat(path, stat_result) == source_hash(path)
+        )
+
+
+def test_get_files_stats_single_file(tmpdir):
+    paths = _create_files(str(tmpdir), ["a"], 2)[1:]
+    stats_by_path = get_files_stats(paths)
+    assert stats_by_path[paths[0]].st_size == 1
+
+
+def _failing_link(src_path, dst_path):
+    raise OSError("Not supported")
+
+
+def test_duplicate_file(tmpdir, monkeypatch):
+    src_path = str(tmpdir.join("file.1001.exr"))
+    with open(src_path, "w") as stream:
+        stream.write("exr")
+
+    dst_path = str(tmpdir.join("file.1002.exr"))
+    assert duplicate_file(src_path, dst_path) == "hardlink"
+    assert os.path.samefile(src_path, dst_path)
+
+    for name in ("create_hard_link", "create_reflink", "create_symlink"):
+        monkeypatch.setattr(path_tools, name, _failing_link)
+    dst_path = str(tmpdir.join("file.1003.exr"))
+    assert duplicate_file(src_path, dst_path) == "copy"
+    with open(dst_path, "r") as stream:
+        assert stream.read() == "exr"
+    assert not os.path.samefile(src_path, dst_path)
+
+
+def test_duplicate_file_existing_destination(tmpdir):
+    src_path = str(tmpdir.join("file.1001.exr"))
+    with open(src_path, "w") as stream:
+        stream.write("exr")
+
+    # Destination created by previous call is replaced
+    dst_path = str(tmpdir.join("file.1002.exr"))
+    duplicate_file(src_path, dst_path)
+    assert duplicate_file(src_path, dst_path) == "hardlink"
+    assert os.path.samefile(src_path, dst_path)
+
+    with pytest.raises(ValueError):
+        duplicate_file(src_path, src_path)
+    assert os.path.exists(src_path)
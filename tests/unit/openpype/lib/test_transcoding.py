@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""Test suite for transcoding functions."""
+import threading
+
+import pytest
+
+from openpype.lib import transcoding
+
+
+INPUT_INFO = {
+    "channelnames": ["R", "G", "B", "A"],
+    "subimages": 1,
+    "attribs": {
+        "compression": "dwaa",
+        "comment": "with \"quotes\"",
+        "owner": "artist",
+    },
+}
+
+
+@pytest.fixture
+def fake_oiio(monkeypatch):
+    calls = []
+    lock = threading.Lock()
+    monkeypatch.setattr(
+        transcoding, "get_oiio_info_for_input",
+        lambda *args, **kwargs: INPUT_INFO
+    )
+    monkeypatch.setattr(
+        transcoding, "get_oiio_tool_args",
+        lambda tool_name, *args: [tool_name] + list(args)
+    )
+
+    def run_subprocess(args, logger=None):
+        input_path = args[args.index("-i:ch=R,G,B,A") + 1]
+        if "fail" in input_path:
+            raise RuntimeError("Conversion failed")
+        with lock:
+            calls.append(args)
+        return ""
+
+    monkeypatch.setattr(transcoding, "run_subprocess", run_subprocess)
+    return calls
+
+
+def _input_paths(count, fail_index=None):
+    paths = []
+    for idx in range(count):
+        name = "fail" if idx == fail_index else "render"
+        paths.append("/src/{}.{:04d}.exr".format(name, idx))
+    return paths
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_convert_input_paths_for_ffmpeg(fake_oiio, max_workers):
+    input_paths = _input_paths(10)
+    progress = []
+    transcoding.convert_input_paths_for_ffmpeg(
+        input_paths,
+        "/dst",
+        max_workers=max_workers,
+        progress_callback=lambda done, total: progress.append((done, total))
+    )
+
+    assert len(fake_oiio) == len(input_paths)
+    assert progress == [(idx, 10) for idx in range(1, 11)]
+    output_paths = set()
+    for args in fake_oiio:
+        assert args[:4] == [
+            "oiiotool", "--nosoftwareattrib", "--compression", "none"
+        ]
+        assert args[args.index("--eraseattrib") + 1] == "comment"
+        assert args.count("--eraseattrib") == 1
+        output_paths.add(args[-1].replace("\\", "/"))
+    assert output_paths == {
+        path.replace("/src", "/dst") for path in input_paths
+    }
+
+
+def test_convert_input_paths_for_ffmpeg_stops_on_failure(fake_oiio):
+    input_paths = _input_paths(200, fail_index=0)
+    with pytest.raises(RuntimeError):
+        transcoding.convert_input_paths_for_ffmpeg(
+            input_paths, "/dst", max_workers=2
+        )
+
+    assert len(fake_oiio) < len(input_paths) - 1
+
+
+def test_get_conversion_workers_count(monkeypatch):
+    monkeypatch.delenv("OPENPYPE_CONVERSION_WORKERS", raising=False)
+    monkeypatch.setattr(transcoding.os, "cpu_count", lambda: 6)
+    assert transcoding.get_conversion_workers_count() == 6
+    assert transcoding.get_conversion_workers_count(3) == 3
+
+    monkeypatch.setenv("OPENPYPE_CONVERSION_WORKERS", "2")
+    assert transcoding.get_conversion_workers_count() == 2
+    assert transcoding.get_conversion_workers_count(5) == 5
+
+
+@pytest.fixture
+def fake_oiiotool(monkeypatch):
+    commands = []
+    lock = threading.Lock()
+    monkeypatch.setattr(
+        transcoding, "get_oiio_tool_args",
+        lambda tool_name, *args: [tool_name] + list(args)
+    )
+
+    def run_subprocess(args, logger=None):
+        with lock:
+            commands.append(args)
+        return ""
+
+    monkeypatch.setattr(transcoding, "run_subprocess", run_subprocess)
+    return commands
+
+
+def test_transcode_scheduler_reads_input_once(fake_oiiotool):
+    scheduler = transcoding.ColorspaceTranscodeScheduler(
+        max_workers=2, frames_per_process=10
+    )
+    for output_name, colorspace in (("a", "sRGB"), ("b", "ACEScg")):
+        scheduler.add(
+            "/src/render.1001-1020#.exr",
+            "/dst/{}/render.1001-1020#.png".format(output_name),
+            "/config.ocio",
+            "linear",
+            target_colorspace=colorspace,
+            input_args=["-i:ch=R,G,B"]
+        )
+    scheduler.process()
+
+    # Two chunks of frames, both outputs written from single read
+    assert len(fake_oiiotool) == 2
+    commands = sorted(fake_oiiotool, key=lambda args: args[2])
+    frame_ranges = ["1001-1010", "1011-1020"]
+    for args, frame_range in zip(commands, frame_ranges):
+        assert args[:6] == [
+            "oiiotool", "-i:ch=R,G,B",
+            "/src/render.{}#.exr".format(frame_range),
+            "--nosoftwareattrib", "--colorconfig", "/config.ocio"
+        ]
+        assert args.count("--dup") == 1
+        assert args.count("--pop") == 1
+        output_args = [
+            args[idx + 1] for idx, arg in enumerate(args) if arg == "-o"
+        ]
+        assert [path.replace("\\", "/") for path in output_args] == [
+            "/dst/a/render.{}#.png".format(frame_range),
+            "/dst/b/render.{}#.png".format(frame_range),
+        ]
+
+
+def test_transcode_scheduler_separates_additional_args(fake_oiiotool):
+    scheduler = transcoding.ColorspaceTranscodeScheduler(max_workers=1)
+    scheduler.add(
+        "/src/render.exr", "/dst/a.dpx", "/config.ocio", "linear",
+        target_colorspace="sRGB", additional_command_args=["-d", "uint10"]
+    )
+    scheduler.add(
+        "/src/render.exr", "/dst/b.png", "/config.ocio", "linear",
+        view="sRGB", display="ACES"
+    )
+    scheduler.process()
+
+    assert len(fake_oiiotool) == 2
+    dpx_args, png_args = fake_oiiotool
+    assert dpx_args[-7:-1] == [
+        "-d", "uint10", "--colorconvert", "linear", "sRGB", "-o"
+    ]
+    assert "--dup" not in png_args
+    assert png_args[-7:-1] == [
+        "--iscolorspace", "linear", "--ociodisplay", "ACES", "sRGB", "-o"
+    ]
+
+
+def test_transcode_scheduler_validates_outputs(fake_oiiotool):
+    scheduler = transcoding.ColorspaceTranscodeScheduler()
+    with pytest.raises(ValueError):
+        scheduler.add(
+            "/src/render.exr", "/dst/a.png", "/config.ocio", "linear"
+        )
+    with pytest.raises(ValueError):
+        scheduler.add(
+            "/src/render.1001-1010#.exr", "/dst/a.png", "/config.ocio",
+            "linear", target_colorspace="sRGB"
+        )
+
+
+OIIO_INFO_OUTPUT = """Reading render.exr
+<ImageSpec version="30">
+<width>1920</width>
+<height>1080</height>
+<nchannels>3</nchannels>
+<channelnames>
+<channelname>R</channelname>
+<channelname>G</channelname>
+<channelname>B</channelname>
+</channelnames>
+</ImageSpec>
+"""
+
+
+@pytest.fixture
+def probe_cache(monkeypatch):
+    cache = transcoding.ProbeCache()
+    monkeypatch.setattr(transcoding, "_probe_cache", cache)
+    return cache
+
+
+def test_probe_cache_key_changes_with_file(tmpdir, probe_cache):
+    path = str(tmpdir.join("render.exr"))
+    with open(path, "w") as stream:
+        stream.write("exr")
+
+    key = probe_cache.get_key("oiiotool", path, ("info", False))
+    probe_cache.set(key, "output")
+    assert probe_cache.get(key) == "output"
+    assert probe_cache.get_key("oiiotool", path, ("info", True)) != key
+
+    with open(path, "w") as stream:
+        stream.write("changed exr")
+    new_key = probe_cache.get_key("oiiotool", path, ("info", False))
+    assert new_key != key
+    assert probe_cache.get(new_key) is None
+    assert probe_cache.get_key("oiiotool", path + ".missing") is None
+
+
+def test_probe_cache_persistence(tmpdir):
+    path = str(tmpdir.join("render.exr"))
+    with open(path, "w") as stream:
+        stream.write("exr")
+    cache_dir = str(tmpdir.join("cache"))
+
+    cache = transcoding.ProbeCache(cache_dir=cache_dir)
+    key = cache.get_key("ffprobe", path)
+    cache.set(key, "{}")
+
+    other_cache = transcoding.ProbeCache(cache_dir=cache_dir)
+    assert other_cache.get(key) == "{}"
+    assert transcoding.ProbeCache().get(key) is None
+
+
+def test_probe_cache_max_items():
+    cache = transcoding.ProbeCache(max_items=2)
+    for idx in range(3):
+        cache.set(("tool", str(idx)), str(idx))
+    assert cache.get(("tool", "0")) is None
+    assert cache.get(("tool", "2")) == "2"
+
+
+def test_get_oiio_info_for_input_is_cached(tmpdir, monkeypatch, probe_cache):
+    path = str(tmpdir.join("render.exr"))
+    with open(path, "w") as stream:
+        stream.write("exr")
+
+    calls = []
+
+    def run_subprocess(args, logger=None):
+        calls.append(args)
+        return OIIO_INFO_OUTPUT
+
+    monkeypatch.setattr(
+        transcoding, "get_oiio_tool_args",
+        lambda tool_name, *args: [tool_name] + list(args)
+    )
+    monkeypatch.setattr(transcoding, "run_subprocess", run_subprocess)
+
+    first = transcoding.get_oiio_info_for_input(path)
+    first["width"] = 0
+    second = transcoding.get_oiio_info_for_input(path)
+    assert len(calls) == 1
+    assert second["width"] == 1920
+    assert second["channelnames"] == ["R", "G", "B"]
+
+    transcoding.get_oiio_info_for_input(path, subimages=True)
+    assert len(calls) == 2
@@ -0,0 +1,160 @@
+"""Test submission of jobs to local stub of Deadline Webservice."""
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from openpype.pipeline.publish import KnownPublishError
+from openpype.modules.deadline import abstract_submit_deadline
+
+
+class DeadlineStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        length = int(self.headers["Content-Length"])
+        payload = json.loads(self.rfile.read(length))
+        with server.lock:
+            server.requests.append(payload)
+            server.client_ports.add(self.client_address[1])
+            status = server.statuses.pop(0) if server.statuses else 200
+
+        if status is None:
+            # Connection is lost after request was received
+            self.close_connection = True
+            return
+
+        if status == 200:
+            body = json.dumps({"_id": payload["JobInfo"]["Name"]})
+        else:
+            body = "Error {}".format(status)
+        body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def deadline_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DeadlineStubHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.client_ports = set()
+    server.statuses = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class FakeInstance:
+    def __init__(self):
+        self.data = {}
+
+
+class StubSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline):
+    submit_retry_delay = 0
+
+    def get_job_info(self):
+        return None
+
+    def get_plugin_info(self):
+        return {}
+
+
+def _create_plugin(server):
+    plugin = StubSubmitDeadline()
+    plugin._instance = FakeInstance()
+    plugin._deadline_url = "http://127.0.0.1:{}".format(server.server_port)
+    return plugin
+
+
+def _payload(name):
+    return {"JobInfo": {"Name": name}, "PluginInfo": {}, "AuxFiles": []}
+
+
+def test_submit_payloads_concurrently(deadline_server):
+    plugin = _create_plugin(deadline_server)
+    plugin.submit_workers = 4
+    names = ["frame_{}".format(idx) for idx in range(40)]
+
+    job_ids = plugin.submit_payloads(_payload(name) for name in names)
+
+    assert job_ids == names
+    assert len(deadline_server.requests) == len(names)
+    assert plugin._instance.data["deadlineSubmissionJob"] == {
+        "_id": names[-1]
+    }
+    # Connections are kept alive and reused
+    assert len(deadline_server.client_ports) <= plugin.submit_workers
+
+
+def test_submit_retries(deadline_server):
+    plugin = _create_plugin(deadline_server)
+    deadline_server.statuses = [503, 502]
+
+    assert plugin.submit(_payload("job")) == "job"
+    assert len(deadline_server.requests) == 3
+
+    # Client errors are not retried
+    deadline_server.statuses = [400]
+    with pytest.raises(KnownPublishError):
+        plugin.submit(_payload("invalid"))
+    assert len(deadline_server.requests) == 4
+
+    # Retries are limited
+    plugin.submit_retries = 1
+    deadline_server.statuses = [503, 503, 503]
+    with pytest.raises(KnownPublishError):
+        plugin.submit(_payload("unavailable"))
+    assert len(deadline_server.requests) == 6
+
+
+def test_submit_not_retried_if_request_was_sent(deadline_server):
+    plugin = _create_plugin(deadline_server)
+
+    # Webservice could create the job after gateway timeout
+    deadline_server.statuses = [504]
+    with pytest.raises(KnownPublishError):
+        plugin.submit(_payload("timeout"))
+    assert len(deadline_server.requests) == 1
+
+    deadline_server.statuses = [None]
+    with pytest.raises(requests.exceptions.ConnectionError):
+        plugin.submit(_payload("lost"))
+    assert len(deadline_server.requests) == 2
+
+
+def test_submit_retries_refused_connection(monkeypatch):
+    posted_urls = []
+    requests_post = abstract_submit_deadline.requests_post
+
+    def counted_requests_post(url, *args, **kwargs):
+        posted_urls.append(url)
+        return requests_post(url, *args, **kwargs)
+
+    monkeypatch.setattr(
+        abstract_submit_deadline, "requests_post", counted_requests_post
+    )
+    # Port which is not listening
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    plugin = StubSubmitDeadline()
+    plugin._instance = FakeInstance()
+    plugin._deadline_url = "http://127.0.0.1:{}".format(port)
+    plugin.submit_retries = 2
+    with pytest.raises(requests.exceptions.ConnectionError):
+        plugin.submit(_payload("job"))
+    assert len(posted_urls) == 3
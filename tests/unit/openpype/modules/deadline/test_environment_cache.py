@@ -0,0 +1,107 @@
+"""Test cache of environments extracted for Deadline farm tasks."""
+import os
+import stat
+import json
+import platform
+
+import pytest
+
+from openpype.modules.deadline import environment_cache
+
+KEY_DATA = {
+    "project": "test_project",
+    "asset": "sh010",
+    "task": "lighting",
+    "app": "maya/2023",
+    "envgroup": "farm",
+    "job_id": "64f0c0ffee",
+    "executable": "/opt/openpype/openpype_console",
+}
+
+
+def test_environment_cache_store_and_load(tmpdir):
+    cache_dir = str(tmpdir)
+    assert environment_cache.load_cached_environment(
+        KEY_DATA, cache_dir, ttl=60
+    ) is None
+
+    path = environment_cache.store_environment(
+        KEY_DATA, {"AVALON_PROJECT": "test_project"}, cache_dir
+    )
+    assert os.listdir(cache_dir) == [os.path.basename(path)]
+    assert environment_cache.load_cached_environment(
+        KEY_DATA, cache_dir, ttl=60
+    ) == {"AVALON_PROJECT": "test_project"}
+
+    # Other job does not use environment of the job
+    other_key_data = dict(KEY_DATA, job_id="64f0decaf")
+    assert environment_cache.load_cached_environment(
+        other_key_data, cache_dir, ttl=60
+    ) is None
+
+    # Disabled cache
+    assert environment_cache.load_cached_environment(
+        KEY_DATA, cache_dir, ttl=0
+    ) is None
+
+
+def test_environment_cache_expiration(tmpdir, monkeypatch):
+    cache_dir = str(tmpdir)
+    monkeypatch.setenv(environment_cache.CACHE_DIR_ENV_KEY, cache_dir)
+    monkeypatch.setenv(environment_cache.CACHE_TTL_ENV_KEY, "60")
+
+    old_path = environment_cache.store_environment(KEY_DATA, {"A": "1"})
+    with open(old_path, "r") as stream:
+        entry = json.load(stream)
+    entry["created"] -= 120
+    with open(old_path, "w") as stream:
+        json.dump(entry, stream)
+
+    new_key_data = dict(KEY_DATA, job_id="64f0decaf")
+    environment_cache.store_environment(new_key_data, {"A": "2"})
+    tmpdir.join("invalid.json").write("{")
+
+    entries = environment_cache.get_cache_entries()
+    assert [entry["expired"] for entry in entries] == [True, False]
+
+    # Expired entry is removed when is read
+    assert environment_cache.load_cached_environment(KEY_DATA) is None
+    assert not os.path.exists(old_path)
+
+    assert environment_cache.clear_environment_cache(expired_only=True) == 0
+    assert environment_cache.load_cached_environment(
+        new_key_data
+    ) == {"A": "2"}
+    assert environment_cache.clear_environment_cache() == 1
+    assert environment_cache.get_cache_entries() == []
+
+
+@pytest.mark.skipif(
+    platform.system().lower() == "windows",
+    reason="Permissions are not applied on Windows"
+)
+def test_environment_cache_permissions(tmpdir, monkeypatch):
+    monkeypatch.delenv(environment_cache.CACHE_DIR_ENV_KEY, raising=False)
+    monkeypatch.setattr(
+        environment_cache.tempfile, "gettempdir", lambda: str(tmpdir)
+    )
+    # Default directory in temp is accessible only by owner
+    path = environment_cache.store_environment(
+        KEY_DATA, {"OPENPYPE_API_KEY": "secret"}
+    )
+    cache_dir = os.path.dirname(path)
+    assert cache_dir == environment_cache.get_environment_cache_dir()
+    assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    # Permissions of shared directory are not changed
+    shared_dir = os.path.join(str(tmpdir), "shared")
+    umask = os.umask(0o002)
+    try:
+        path = environment_cache.store_environment(
+            KEY_DATA, {"OPENPYPE_API_KEY": "secret"}, shared_dir
+        )
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(os.stat(shared_dir).st_mode) == 0o775
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o664
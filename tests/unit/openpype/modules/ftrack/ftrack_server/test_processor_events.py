@@ -0,0 +1,141 @@
+"""Test reading and acknowledging of events by ftrack event processor.
+
+Uses 'mongomock' as local Mongo stand-in with fake change stream, test is
+skipped if not available.
+"""
+import datetime
+import collections
+
+import pytest
+from bson.objectid import ObjectId
+from pymongo.errors import OperationFailure
+
+# Package of ftrack module requires 'ftrack_api'
+pytest.importorskip("ftrack_api")
+mongomock = pytest.importorskip("mongomock")
+
+from openpype.modules.ftrack.ftrack_server import processor_events  # noqa
+
+
+class FakeChangeStream:
+    def __init__(self, changes):
+        self._changes = changes
+        self.alive = True
+
+    def try_next(self):
+        if not self._changes:
+            return None
+        return self._changes.popleft()
+
+    def close(self):
+        self.alive = False
+
+
+class FakeEventsCollection:
+    """Mongomock collection with fake change stream of inserted events."""
+
+    def __init__(self, supported=True):
+        self.supported = supported
+        self.changes = collections.deque()
+        self.watch_count = 0
+        self.bulk_writes = []
+        self._collection = mongomock.MongoClient().db["ftrack_events"]
+
+    def __getattr__(self, attr_name):
+        return getattr(self._collection, attr_name)
+
+    def watch(self, pipeline, **kwargs):
+        if not self.supported:
+            raise OperationFailure("Change streams require replica set")
+        self.watch_count += 1
+        return FakeChangeStream(self.changes)
+
+    def bulk_write(self, requests, **kwargs):
+        self.bulk_writes.append(len(requests))
+        return self._collection.bulk_write(requests, **kwargs)
+
+    def store_event(self, stored=None, is_processed=False):
+        if stored is None:
+            stored = datetime.datetime.utcnow()
+        event_doc = {
+            "_id": ObjectId(),
+            "topic": "ftrack.update",
+            "pype_data": {"stored": stored, "is_processed": is_processed}
+        }
+        self._collection.insert_one(event_doc)
+        self.changes.append(
+            {"operationType": "insert", "fullDocument": event_doc}
+        )
+        return event_doc
+
+
+def _ids(event_docs):
+    return [event_doc["_id"] for event_doc in event_docs]
+
+
+def test_backlog_is_read_in_pages():
+    collection = FakeEventsCollection()
+    stored = datetime.datetime.utcnow()
+    # Events stored at the same time are paged by id
+    event_ids = [collection.store_event(stored)["_id"] for _ in range(5)]
+    reader = processor_events.UnprocessedEventsReader(
+        collection, page_size=2, wait_timeout=0
+    )
+
+    read_ids = []
+    for _ in range(3):
+        read_ids.extend(_ids(reader.read_events()))
+    assert read_ids == event_ids
+    assert collection.watch_count == 1
+
+    # Events from backlog are not returned again by change stream
+    assert reader.read_events() == []
+    new_event = collection.store_event()
+    assert _ids(reader.read_events()) == [new_event["_id"]]
+    assert reader.read_events() == []
+
+
+def test_polling_without_change_stream():
+    collection = FakeEventsCollection(supported=False)
+    first_event = collection.store_event()
+    reader = processor_events.UnprocessedEventsReader(
+        collection, page_size=10, wait_timeout=0
+    )
+    assert _ids(reader.read_events()) == [first_event["_id"]]
+    assert not reader.stream_supported
+    assert reader.read_events() == []
+
+    second_event = collection.store_event()
+    assert _ids(reader.read_events()) == [second_event["_id"]]
+
+
+def test_acknowledged_in_batches():
+    collection = FakeEventsCollection()
+    event_ids = [collection.store_event()["_id"] for _ in range(5)]
+    acknowledger = processor_events.EventAcknowledger(
+        collection, batch_size=2, flush_interval=60
+    )
+    for event_id in event_ids:
+        acknowledger.add(event_id)
+    assert acknowledger.pending_count == 1
+    assert acknowledger.flush() == 1
+    assert collection.bulk_writes == [2, 2, 1]
+
+    for event_doc in collection.find():
+        assert event_doc["pype_data"]["is_processed"]
+        assert "processed_at" in event_doc["pype_data"]
+
+
+def test_ttl_index_removes_legacy_processed_events():
+    collection = FakeEventsCollection()
+    old_date = datetime.datetime.utcnow() - datetime.timedelta(days=4)
+    collection.store_event(old_date, is_processed=True)
+    not_processed = collection.store_event(old_date)
+
+    processor_events.ensure_processed_events_ttl_index(collection)
+
+    assert _ids(collection.find()) == [not_processed["_id"]]
+    index_info = collection.index_information()
+    assert index_info[processor_events.TTL_INDEX_NAME][
+        "expireAfterSeconds"
+    ] == processor_events.PROCESSED_EVENTS_TTL
@@ -0,0 +1,266 @@
+"""Test incremental synchronization of ftrack entities to avalon.
+
+Uses 'mongomock' as local Mongo stand-in and fake ftrack session. Test is
+skipped if ftrack module can't be imported (requires 'ftrack_api' and
+loaded OpenPype modules).
+"""
+import logging
+import datetime
+
+import pytest
+from bson.objectid import ObjectId
+
+mongomock = pytest.importorskip("mongomock")
+avalon_sync = pytest.importorskip("openpype_modules.ftrack.lib.avalon_sync")
+storer_runs = pytest.importorskip("openpype_modules.ftrack.lib.storer_runs")
+
+PROJECT_NAME = "test_project"
+FT_PROJECT_ID = "ft_project"
+
+
+@pytest.fixture
+def database(monkeypatch):
+    database = mongomock.MongoClient().db
+    monkeypatch.setattr(
+        avalon_sync, "_get_events_collection",
+        lambda: database["ftrack_events"]
+    )
+    monkeypatch.setattr(
+        storer_runs, "get_storer_runs_collection",
+        lambda: database[storer_runs.STORER_RUNS_COLLECTION_NAME]
+    )
+    return database
+
+
+def _utc_ago(**kwargs):
+    return datetime.datetime.utcnow() - datetime.timedelta(**kwargs)
+
+
+def _store_event(database, entity_id, entity_type="task", project_id=None):
+    if project_id is None:
+        project_id = FT_PROJECT_ID
+    database["ftrack_events"].insert_one({
+        "topic": "ftrack.update",
+        "data": {"entities": [{
+            "entityId": entity_id,
+            "entityType": entity_type,
+            "parents": [
+                {"entityId": entity_id},
+                {"entityId": project_id},
+            ]
+        }]},
+        "pype_data": {"stored": _utc_ago(minutes=1), "is_processed": True}
+    })
+
+
+def test_get_changed_ftrack_ids(database):
+    since = _utc_ago(hours=1)
+    # Event stored before last synchronization keeps retention check happy
+    database["ftrack_events"].insert_one({
+        "topic": "ftrack.meta.connected",
+        "pype_data": {"stored": _utc_ago(hours=2), "is_processed": True}
+    })
+    _store_event(database, "shot_1")
+    _store_event(database, "shot_2")
+    _store_event(database, "version_1", entity_type="assetversion")
+    _store_event(database, "other_shot", project_id="other_project")
+
+    # Storer never ran
+    assert avalon_sync.get_changed_ftrack_ids(FT_PROJECT_ID, since) is None
+
+    storer_run = storer_runs.StorerRun(
+        database[storer_runs.STORER_RUNS_COLLECTION_NAME]
+    )
+    storer_run.start()
+    runs = database[storer_runs.STORER_RUNS_COLLECTION_NAME]
+    runs.update_many({}, {"$set": {"started": _utc_ago(hours=3)}})
+    assert avalon_sync.get_changed_ftrack_ids(FT_PROJECT_ID, since) == {
+        "shot_1", "shot_2"
+    }
+
+    # Storer was not running for a while after last synchronization
+    runs.update_many({}, {"$set": {"started": _utc_ago(minutes=30)}})
+    runs.insert_one({
+        "started": _utc_ago(hours=3),
+        "last_alive": _utc_ago(minutes=40),
+        "stopped": _utc_ago(minutes=40),
+    })
+    assert avalon_sync.get_changed_ftrack_ids(FT_PROJECT_ID, since) is None
+
+    # Storer is not running now
+    runs.delete_many({})
+    storer_run.start()
+    runs.update_many({}, {"$set": {"started": _utc_ago(hours=3)}})
+    storer_run.stop()
+    assert avalon_sync.get_changed_ftrack_ids(FT_PROJECT_ID, since) is None
+
+
+def test_get_changed_ftrack_ids_removed_events(database):
+    runs = database[storer_runs.STORER_RUNS_COLLECTION_NAME]
+    runs.insert_one({
+        "started": _utc_ago(days=10),
+        "last_alive": datetime.datetime.utcnow()
+    })
+    _store_event(database, "shot_1")
+    # Events since last synchronization were already removed
+    assert avalon_sync.get_changed_ftrack_ids(
+        FT_PROJECT_ID, _utc_ago(days=5)
+    ) is None
+
+
+class FakeQuery:
+    def __init__(self, result):
+        self._result = result
+
+    def one(self):
+        return self._result
+
+    def all(self):
+        return [self._result]
+
+
+class FakeEntity(dict):
+    def __init__(self, entity_type, *args, **kwargs):
+        super(FakeEntity, self).__init__(*args, **kwargs)
+        self.entity_type = entity_type
+
+
+class FakeSession:
+    server_url = "https://ftrack.example.com"
+    api_key = "key"
+    api_user = "user"
+
+    def __init__(self, *args, **kwargs):
+        self.queries = []
+
+    def query(self, query):
+        self.queries.append(query)
+        return FakeQuery(FakeEntity("Project", {
+            "id": FT_PROJECT_ID,
+            "name": "test",
+            "full_name": PROJECT_NAME,
+            "custom_attributes": {avalon_sync.CUST_ATTR_ID_KEY: ""},
+        }))
+
+    def close(self):
+        pass
+
+
+def _create_factory():
+    return avalon_sync.SyncEntitiesFactory(
+        logging.getLogger("test_avalon_sync"), FakeSession()
+    )
+
+
+def test_launch_setup_without_changes(monkeypatch):
+    stored_dates = []
+    monkeypatch.setattr(avalon_sync.ftrack_api, "Session", FakeSession)
+    monkeypatch.setattr(
+        avalon_sync, "get_last_sync_date", lambda name: _utc_ago(hours=1)
+    )
+    monkeypatch.setattr(
+        avalon_sync, "get_changed_ftrack_ids", lambda ft_id, since: set()
+    )
+    monkeypatch.setattr(
+        avalon_sync,
+        "set_last_sync_date",
+        lambda name, sync_date: stored_dates.append((name, sync_date))
+    )
+
+    factory = _create_factory()
+    result = factory.launch_setup(PROJECT_NAME, incremental=True)
+
+    assert result["success"] is True
+    # Only project was queried
+    assert len(factory.session.queries) == 1
+    assert stored_dates == [(PROJECT_NAME, factory.sync_started)]
+
+
+class FakeDbcon:
+    def __init__(self):
+        self.Session = {}
+
+    def install(self):
+        pass
+
+
+def _ftrack_entity_dict(name, parent_id, mongo_id, link_names):
+    return {
+        "name": name,
+        "parent_id": parent_id,
+        "children": [],
+        "entity": {"link": [{"name": item} for item in link_names]},
+        "avalon_attrs": {avalon_sync.CUST_ATTR_ID_KEY: mongo_id},
+    }
+
+
+def _asset_doc(name, ftrack_id, parent_doc=None):
+    parents = []
+    visual_parent = None
+    if parent_doc is not None:
+        parents = parent_doc["data"]["parents"] + [parent_doc["name"]]
+        visual_parent = parent_doc["_id"]
+    return {
+        "_id": ObjectId(),
+        "type": "asset",
+        "name": name,
+        "data": {
+            "ftrackId": ftrack_id,
+            "parents": parents,
+            "visualParent": visual_parent,
+        }
+    }
+
+
+@pytest.mark.parametrize("changed_ids,expected_deleted", [
+    # Removed shot is archived, entities out of changed hierarchy are not
+    ({"sh020"}, ["sh020"]),
+    # Whole project was synchronized
+    (None, ["sh010", "sq02", "sh030", "sh020"]),
+])
+def test_deleted_only_in_changed_hierarchy(
+    monkeypatch, changed_ids, expected_deleted
+):
+    project_doc = {"_id": ObjectId(), "type": "project", "name": PROJECT_NAME}
+    sq01 = _asset_doc("sq01", "ft_sq01")
+    sh010 = _asset_doc("sh010", "ft_sh010", sq01)
+    sh020 = _asset_doc("sh020", "ft_sh020", sq01)
+    sq02 = _asset_doc("sq02", "ft_sq02")
+    sh030 = _asset_doc("sh030", "ft_sh030", sq02)
+    asset_docs = [sq01, sh010, sh020, sq02, sh030]
+    monkeypatch.setattr(avalon_sync, "get_project", lambda name: project_doc)
+    monkeypatch.setattr(avalon_sync, "get_assets", lambda name: asset_docs)
+
+    factory = _create_factory()
+    factory.dbcon = FakeDbcon()
+    factory.ft_project_id = FT_PROJECT_ID
+    if changed_ids is not None:
+        changed_ids = {"ft_" + name for name in changed_ids}
+    factory.changed_ftrack_ids = changed_ids
+    for attr_name in (
+        "_avalon_ents_by_id",
+        "_avalon_ents_by_ftrack_id",
+        "_avalon_ents_by_name",
+        "_avalon_ents_by_parent_id",
+    ):
+        setattr(factory, attr_name, None)
+    factory._ent_paths_by_ftrack_id = {}
+
+    # Shot 'sh020' was removed, only its parent sequence was queried
+    project_dict = _ftrack_entity_dict(
+        PROJECT_NAME, None, str(project_doc["_id"]), [PROJECT_NAME]
+    )
+    project_dict["children"].append("ft_sq01")
+    factory.entities_dict = {
+        FT_PROJECT_ID: project_dict,
+        "ft_sq01": _ftrack_entity_dict(
+            "sq01", FT_PROJECT_ID, str(sq01["_id"]), [PROJECT_NAME, "sq01"]
+        ),
+    }
+
+    factory.prepare_avalon_entities(PROJECT_NAME)
+
+    docs_by_name = {doc["name"]: doc for doc in asset_docs}
+    assert sorted(factory.deleted_entities) == sorted(
+        str(docs_by_name[name]["_id"]) for name in expected_deleted
+    )
@@ -0,0 +1,105 @@
+"""Test file for incremental representation change tracking of Sync Server.
+
+Uses fake collection with change stream so no Mongo server is needed.
+"""
+import collections
+
+from pymongo.errors import OperationFailure
+
+from openpype.modules.sync_server.change_tracker import (
+    RepresentationChangeTracker
+)
+
+
+class FakeChangeStream:
+    def __init__(self, events):
+        self._events = events
+        self.alive = True
+        self.resume_token = None
+
+    def try_next(self):
+        if not self._events:
+            return None
+        event = self._events.popleft()
+        self.resume_token = {"_data": id(event)}
+        return event
+
+    def close(self):
+        self.alive = False
+
+
+class FakeCollection:
+    def __init__(self, supported=True):
+        self.supported = supported
+        self.events = collections.deque()
+        self.watch_count = 0
+
+    def watch(self, pipeline, **kwargs):
+        if not self.supported:
+            raise OperationFailure("Change streams require replica set")
+        self.watch_count += 1
+        return FakeChangeStream(self.events)
+
+    def add_update(self, doc_id, fields):
+        self.events.append({
+            "operationType": "update",
+            "documentKey": {"_id": doc_id},
+            "updateDescription": {
+                "updatedFields": {field: None for field in fields},
+                "removedFields": []
+            }
+        })
+
+    def add_insert(self, doc_id, doc_type):
+        self.events.append({
+            "operationType": "insert",
+            "documentKey": {"_id": doc_id},
+            "fullDocument": {"_id": doc_id, "type": doc_type}
+        })
+
+
+def test_first_loop_is_full_scan():
+    collection = FakeCollection()
+    tracker = RepresentationChangeTracker(collection)
+    assert tracker.get_changed_ids(("studio", "gdrive")) is None
+    assert collection.watch_count == 1
+
+
+def test_changed_and_pending_ids():
+    collection = FakeCollection()
+    tracker = RepresentationChangeTracker(collection)
+    scan_key = ("studio", "gdrive")
+    tracker.get_changed_ids(scan_key)
+    tracker.set_pending_ids(["pending"])
+
+    collection.add_update("synced", ["files.0.sites.1.created_dt"])
+    collection.add_update("renamed", ["name"])
+    collection.add_insert("new_repre", "representation")
+    collection.add_insert("new_version", "version")
+
+    changed_ids = tracker.get_changed_ids(scan_key)
+    assert changed_ids == {"synced", "new_repre", "pending"}
+
+    tracker.set_pending_ids([])
+    assert tracker.get_changed_ids(scan_key) == set()
+
+
+def test_full_scan_on_request_and_scan_key_change():
+    collection = FakeCollection()
+    tracker = RepresentationChangeTracker(collection)
+    tracker.get_changed_ids(("studio", "gdrive"))
+    assert tracker.get_changed_ids(("studio", "gdrive")) == set()
+
+    assert tracker.get_changed_ids(("local", "gdrive")) is None
+    assert tracker.get_changed_ids(("local", "gdrive")) == set()
+
+    tracker.request_full_scan()
+    assert tracker.get_changed_ids(("local", "gdrive")) is None
+
+
+def test_not_supported_always_full_scan():
+    collection = FakeCollection(supported=False)
+    tracker = RepresentationChangeTracker(collection)
+    assert tracker.get_changed_ids() is None
+    assert tracker.get_changed_ids() is None
+    assert not tracker.supported
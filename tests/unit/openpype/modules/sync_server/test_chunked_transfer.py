@@ -0,0 +1,131 @@
+"""Test file for chunked transfers of Sync Server providers."""
+import io
+import os
+import hashlib
+
+import pytest
+
+from openpype.modules.sync_server.providers.chunked_transfer import (
+    ChecksumMismatchError,
+    get_part_path,
+    get_resume_offset,
+    transfer_file,
+)
+from openpype.modules.sync_server.providers.local_drive import (
+    LocalDriveHandler,
+)
+
+CHUNK_SIZE = 1024
+DATA = os.urandom(CHUNK_SIZE * 5 + 100)
+CHECKSUM = "sha256:{}".format(hashlib.sha256(DATA).hexdigest())
+
+
+class FakeServer:
+    LOG_PROGRESS_SEC = 0
+
+    def __init__(self):
+        self.progress = []
+
+    def get_transfer_chunk_size(self, project_name):
+        return CHUNK_SIZE
+
+    def update_db(self, **kwargs):
+        self.progress.append(kwargs["progress"])
+
+
+class InterruptedStream(io.BytesIO):
+    """Source which fails after 'limit' bytes were read."""
+
+    def __init__(self, data, limit):
+        super(InterruptedStream, self).__init__(data)
+        self._limit = limit
+
+    def read(self, size=-1):
+        if self.tell() >= self._limit:
+            raise ConnectionResetError("Connection lost")
+        return super(InterruptedStream, self).read(size)
+
+
+def _transfer(part_path, open_source, expected_checksum=None):
+    part_size = 0
+    if os.path.exists(part_path):
+        part_size = os.path.getsize(part_path)
+    return transfer_file(
+        open_source,
+        lambda mode: open(part_path, mode),
+        lambda: open(part_path, "rb"),
+        len(DATA),
+        part_size,
+        CHUNK_SIZE,
+        expected_checksum
+    )
+
+
+def test_resume_offset():
+    assert get_resume_offset(0, 100, 10) == 0
+    assert get_resume_offset(35, 100, 10) == 30
+    assert get_resume_offset(100, 100, 10) == 100
+    # Part bigger than source is not valid
+    assert get_resume_offset(120, 100, 10) == 0
+
+
+def test_resume_after_interruption(tmp_path):
+    part_path = str(tmp_path / "file.part")
+    with pytest.raises(ConnectionResetError):
+        _transfer(
+            part_path, lambda: InterruptedStream(DATA, CHUNK_SIZE * 3)
+        )
+    assert os.path.getsize(part_path) == CHUNK_SIZE * 3
+
+    # Simulate partially written chunk
+    with open(part_path, "ab") as stream:
+        stream.write(b"garbage")
+
+    read_sizes = []
+
+    class CountingStream(io.BytesIO):
+        def read(self, size=-1):
+            data = super(CountingStream, self).read(size)
+            read_sizes.append(len(data))
+            return data
+
+    checksum = _transfer(part_path, lambda: CountingStream(DATA))
+    assert checksum == CHECKSUM
+    # Only remaining data were read from source
+    assert sum(read_sizes) == len(DATA) - CHUNK_SIZE * 3
+    with open(part_path, "rb") as stream:
+        assert stream.read() == DATA
+
+
+def test_checksum_mismatch(tmp_path):
+    part_path = str(tmp_path / "file.part")
+    with pytest.raises(ChecksumMismatchError):
+        _transfer(part_path, lambda: io.BytesIO(DATA), "sha256:invalid")
+
+    assert _transfer(
+        str(tmp_path / "other.part"), lambda: io.BytesIO(DATA), CHECKSUM
+    ) == CHECKSUM
+
+
+def test_local_drive_copy(tmp_path):
+    source_path = str(tmp_path / "source.bin")
+    target_path = str(tmp_path / "target" / "target.bin")
+    with open(source_path, "wb") as stream:
+        stream.write(DATA)
+    os.makedirs(os.path.dirname(target_path))
+    # Leftover of interrupted copy
+    with open(get_part_path(target_path), "wb") as stream:
+        stream.write(DATA[:CHUNK_SIZE * 2])
+
+    handler = LocalDriveHandler("project", "studio")
+    server = FakeServer()
+    file = {"_id": "file_id", "path": "{root[work]}/source.bin"}
+    handler.upload_file(source_path, target_path, server, "project",
+                        file, {"_id": "repre_id"}, "studio", overwrite=True)
+
+    assert file["checksum"] == CHECKSUM
+    assert not os.path.exists(get_part_path(target_path))
+    with open(target_path, "rb") as stream:
+        assert stream.read() == DATA
+    assert server.progress
+    assert all(0 < progress < 1 for progress in server.progress)
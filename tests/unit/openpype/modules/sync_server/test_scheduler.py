@@ -0,0 +1,233 @@
+"""Test file for transfer scheduling of Sync Server."""
+import os
+import asyncio
+import threading
+import functools
+
+import pytest
+
+from openpype.modules.sync_server.scheduler import (
+    TransferJob,
+    TransferScheduler,
+)
+
+
+class TransferRecorder:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.started = []
+        self.finished = []
+
+    def create_job(self, key, priority=50, delay=0.01, fail=False):
+        async def transfer():
+            self.started.append(key)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self.running -= 1
+            if fail:
+                raise ValueError("Transfer of {} failed".format(key))
+            return "id_{}".format(key)
+
+        return TransferJob(key, priority, transfer, size=1024)
+
+    def on_done(self, job, result, error):
+        self.finished.append((job.key, result, error))
+
+
+def _run(scheduler, jobs_by_site, concurrency):
+    async def run():
+        for site_name, jobs in jobs_by_site.items():
+            queue = scheduler.get_queue(site_name, concurrency)
+            for job in jobs:
+                queue.add(job)
+        await scheduler.wait_idle()
+
+    asyncio.run(run())
+
+
+def test_concurrency_is_bounded_per_site():
+    recorder = TransferRecorder()
+    scheduler = TransferScheduler(on_done=recorder.on_done)
+    _run(
+        scheduler,
+        {"studio": [recorder.create_job(idx) for idx in range(10)]},
+        concurrency=3
+    )
+    assert recorder.max_running == 3
+    assert len(recorder.finished) == 10
+    assert scheduler.pending_count == 0
+
+    queue = scheduler.get_queue("studio", 3)
+    assert queue.transferred_files == 10
+    assert queue.transferred_bytes == 10 * 1024
+    assert queue.bytes_per_second > 0
+
+
+def test_sites_do_not_block_each_other():
+    recorder = TransferRecorder()
+    scheduler = TransferScheduler(on_done=recorder.on_done)
+    _run(
+        scheduler,
+        {
+            "slow": [recorder.create_job("slow", delay=0.2)],
+            "fast": [
+                recorder.create_job("fast_{}".format(idx))
+                for idx in range(3)
+            ],
+        },
+        concurrency=1
+    )
+    finished_keys = [key for key, _, _ in recorder.finished]
+    assert finished_keys[-1] == "slow"
+
+
+def test_priority_order_and_duplicates():
+    recorder = TransferRecorder()
+    scheduler = TransferScheduler(on_done=recorder.on_done)
+
+    async def run():
+        queue = scheduler.get_queue("studio", 1)
+        assert queue.add(recorder.create_job("first"))
+        assert queue.add(recorder.create_job("low", priority=10))
+        assert queue.add(recorder.create_job("high", priority=100))
+        assert not queue.add(recorder.create_job("high"))
+        assert "low" in queue
+        assert scheduler.is_pending("high")
+        await scheduler.wait_idle()
+
+    asyncio.run(run())
+    assert recorder.started == ["first", "high", "low"]
+
+
+def test_errors_are_passed_to_callback():
+    recorder = TransferRecorder()
+    scheduler = TransferScheduler(on_done=recorder.on_done)
+    _run(
+        scheduler,
+        {"studio": [
+            recorder.create_job("ok"),
+            recorder.create_job("broken", fail=True),
+        ]},
+        concurrency=2
+    )
+    results = {
+        key: (result, error)
+        for key, result, error in recorder.finished
+    }
+    assert results["ok"] == ("id_ok", None)
+    assert results["broken"][0] is None
+    assert isinstance(results["broken"][1], ValueError)
+
+
+class FakeSyncServerModule:
+    LOG_PROGRESS_SEC = 5
+    DEFAULT_TRANSFER_CONCURRENCY = 4
+
+    def __init__(self, local_site):
+        self.lock = threading.Lock()
+        self.local_site = local_site
+        self.alternate_sites = []
+
+    def get_transfer_chunk_size(self, project_name):
+        return 1024
+
+    def get_active_site(self, project_name):
+        return self.local_site
+
+    def update_db(self, **kwargs):
+        pass
+
+    def handle_alternate_site(self, project_name, representation, site_name,
+                              file_id, synced_file_id):
+        self.alternate_sites.append((site_name, synced_file_id))
+
+
+def test_local_drive_transfers(tmp_path, monkeypatch):
+    sync_server = pytest.importorskip(
+        "openpype.modules.sync_server.sync_server"
+    )
+    from openpype.modules.sync_server.providers.local_drive import (
+        LocalDriveHandler,
+    )
+
+    roots = {
+        "studio": tmp_path / "studio",
+        "remote": tmp_path / "remote",
+    }
+    monkeypatch.setattr(
+        LocalDriveHandler,
+        "get_roots_config",
+        lambda self, anatomy=None: {"work": str(roots[self.site_name])}
+    )
+    module = FakeSyncServerModule("studio")
+    recorder = TransferRecorder()
+    scheduler = TransferScheduler(on_done=recorder.on_done)
+
+    file_docs = []
+    for idx in range(5):
+        path = roots["studio"] / "shots" / "sh010_v{:03}.exr".format(idx)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(os.urandom(3000 + idx))
+        file_docs.append({
+            "_id": idx,
+            "path": "{root[work]}/shots/" + path.name,
+            "size": path.stat().st_size
+        })
+
+    async def run():
+        queue = scheduler.get_queue("remote", 2)
+        for file_doc in file_docs:
+            queue.add(TransferJob(
+                file_doc["_id"],
+                50,
+                functools.partial(
+                    sync_server.upload,
+                    module,
+                    "test_project",
+                    file_doc,
+                    {"_id": "repre_id"},
+                    "local_drive",
+                    "remote",
+                ),
+                size=file_doc["size"]
+            ))
+        await scheduler.wait_idle()
+
+    asyncio.run(run())
+
+    assert sorted(recorder.finished) == [
+        (idx, "sh010_v{:03}.exr".format(idx), None) for idx in range(5)
+    ]
+    for path in (roots["studio"] / "shots").iterdir():
+        remote_path = roots["remote"] / "shots" / path.name
+        assert remote_path.read_bytes() == path.read_bytes()
+    assert all(file_doc.get("checksum") for file_doc in file_docs)
+    assert scheduler.get_queue("remote", 2).transferred_bytes == sum(
+        file_doc["size"] for file_doc in file_docs
+    )
+
+
+def test_executor_follows_transfer_concurrency():
+    sync_server = pytest.importorskip(
+        "openpype.modules.sync_server.sync_server"
+    )
+    thread = sync_server.SyncServerThread(FakeSyncServerModule("studio"))
+    thread.loop = asyncio.new_event_loop()
+    try:
+        thread.scheduler.get_queue("studio", 8)
+        thread.scheduler.get_queue("remote", 6)
+        thread._update_executor_workers()
+        extra_workers = thread.EXTRA_EXECUTOR_WORKERS
+        assert thread.executor._max_workers == 14 + extra_workers
+
+        thread.scheduler.get_queue("studio", 1)
+        thread.scheduler.get_queue("remote", 1)
+        thread._update_executor_workers()
+        assert thread.executor._max_workers == 4 + extra_workers
+    finally:
+        thread.executor.shutdown(wait=True)
+        thread.loop.close()
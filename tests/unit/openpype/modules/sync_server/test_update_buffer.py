@@ -0,0 +1,86 @@
+"""Test file for buffered sync state updates of Sync Server."""
+import time
+
+from openpype.modules.sync_server.update_buffer import SyncStateUpdateBuffer
+
+
+class FakeCollection:
+    def __init__(self):
+        self.bulk_writes = []
+
+    def bulk_write(self, operations):
+        self.bulk_writes.append(list(operations))
+
+
+def _create_buffer(flush_interval=60):
+    collections = {}
+
+    def get_collection(project_name):
+        return collections.setdefault(project_name, FakeCollection())
+
+    buffer = SyncStateUpdateBuffer(get_collection, flush_interval)
+    return buffer, collections
+
+
+def test_single_bulk_write_per_project():
+    buffer, collections = _create_buffer()
+    for idx in range(100):
+        buffer.add_state("project_a", ("repre", idx, "gdrive"), idx)
+    buffer.add_state("project_b", ("repre", 0, "gdrive"), "b")
+
+    assert buffer.flush() == 101
+    assert len(collections["project_a"].bulk_writes) == 1
+    assert len(collections["project_a"].bulk_writes[0]) == 100
+    assert collections["project_b"].bulk_writes == [["b"]]
+
+    # Nothing to write
+    assert buffer.flush() == 0
+
+
+def test_progress_coalesced():
+    buffer, collections = _create_buffer()
+    key = ("repre", "file", "gdrive")
+    buffer.add_progress("project", key, "progress 0.1")
+    buffer.add_progress("project", key, "progress 0.5")
+    buffer.add_progress("project", ("repre", "other", "gdrive"), "other")
+
+    buffer.flush("project")
+    assert collections["project"].bulk_writes == [
+        ["progress 0.5", "other"]
+    ]
+
+
+def test_state_replaces_progress():
+    buffer, collections = _create_buffer()
+    key = ("repre", "file", "gdrive")
+    buffer.add_progress("project", key, "progress")
+    buffer.add_state("project", key, "success")
+    # Late progress after final state is ignored
+    buffer.add_progress("project", key, "late progress")
+
+    buffer.flush()
+    assert collections["project"].bulk_writes == [["success"]]
+
+
+def test_time_based_progress_flush():
+    buffer, collections = _create_buffer(flush_interval=0.01)
+    buffer.add_state("project", ("repre", "done", "gdrive"), "success")
+    time.sleep(0.02)
+    buffer.add_progress("project", ("repre", "file", "gdrive"), "progress")
+
+    # Only progress is flushed by time
+    assert collections["project"].bulk_writes == [["progress"]]
+    buffer.flush()
+    assert collections["project"].bulk_writes[-1] == ["success"]
+
+
+def test_flush_if_due():
+    buffer, collections = _create_buffer(flush_interval=0.01)
+    buffer.add_state("project", ("repre", "done", "gdrive"), "success")
+    buffer.flush()
+    buffer.add_state("project", ("repre", "next", "gdrive"), "next")
+    assert buffer.flush_if_due() == 0
+
+    time.sleep(0.02)
+    assert buffer.flush_if_due() == 1
+    assert collections["project"].bulk_writes[-1] == ["next"]
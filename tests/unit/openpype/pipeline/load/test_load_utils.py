@@ -0,0 +1,231 @@
+"""Test batched update of containers."""
+import collections
+
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.client.mongo import entities
+from openpype.client.mongo import entities_cache
+from openpype.pipeline.load import utils
+
+
+class FakeLoader:
+    updated = []
+
+    def update(self, container, representation):
+        self.updated.append((container["objectName"], representation["_id"]))
+        return representation["_id"]
+
+
+def _prepare_database(tmpdir, count):
+    subset_ids = [ObjectId() for _ in range(count)]
+    versions = []
+    representations = []
+    for subset_id in subset_ids:
+        for version_name in (1, 2):
+            version_id = ObjectId()
+            versions.append({
+                "_id": version_id,
+                "type": "version",
+                "parent": subset_id,
+                "name": version_name,
+            })
+            path = tmpdir.join("{}_v{}.abc".format(subset_id, version_name))
+            path.write("")
+            representations.append({
+                "_id": ObjectId(),
+                "type": "representation",
+                "parent": version_id,
+                "name": "abc",
+                "data": {"template": "{path}"},
+                "context": {"path": str(path)},
+            })
+    return versions, representations
+
+
+def _patch_queries(monkeypatch, versions, representations):
+    calls = collections.Counter()
+
+    def get_representations(
+        project_name,
+        representation_ids=None,
+        names_by_version_ids=None,
+        fields=None
+    ):
+        calls["get_representations"] += 1
+        output = []
+        for repre_doc in representations:
+            if (
+                representation_ids is not None
+                and str(repre_doc["_id"]) not in representation_ids
+            ):
+                continue
+            if (
+                names_by_version_ids is not None
+                and repre_doc["name"] not in names_by_version_ids.get(
+                    repre_doc["parent"], [])
+            ):
+                continue
+            output.append(repre_doc)
+        return output
+
+    def get_versions(
+        project_name,
+        version_ids=None,
+        subset_ids=None,
+        versions=None,
+        hero=False,
+        fields=None
+    ):
+        calls["get_versions"] += 1
+        return [
+            version_doc
+            for version_doc in versions_docs
+            if (version_ids is None or version_doc["_id"] in version_ids)
+            and (subset_ids is None or version_doc["parent"] in subset_ids)
+            and (versions is None or version_doc["name"] in versions)
+        ]
+
+    def get_last_versions(project_name, subset_ids, fields=None):
+        calls["get_last_versions"] += 1
+        output = {}
+        for version_doc in versions_docs:
+            subset_id = version_doc["parent"]
+            if subset_id not in subset_ids:
+                continue
+            last_doc = output.get(subset_id)
+            if last_doc is None or last_doc["name"] < version_doc["name"]:
+                output[subset_id] = version_doc
+        return output
+
+    versions_docs = versions
+    monkeypatch.setattr(utils, "get_representations", get_representations)
+    monkeypatch.setattr(utils, "get_versions", get_versions)
+    monkeypatch.setattr(utils, "get_last_versions", get_last_versions)
+    monkeypatch.setattr(
+        utils,
+        "_get_containers_loaders",
+        lambda containers: {"FakeLoader": FakeLoader}
+    )
+    monkeypatch.setattr(
+        "openpype.pipeline.registered_root", lambda: "", raising=False
+    )
+    return calls
+
+
+def test_update_containers_batched_queries(tmpdir, monkeypatch):
+    count = 20
+    versions, representations = _prepare_database(tmpdir, count)
+    calls = _patch_queries(monkeypatch, versions, representations)
+    FakeLoader.updated = []
+
+    # Containers use first version of each subset
+    containers = [
+        {
+            "objectName": "container_{}".format(idx),
+            "representation": str(repre_doc["_id"]),
+            "loader": "FakeLoader",
+        }
+        for idx, repre_doc in enumerate(representations[::2])
+    ]
+    containers.append({
+        "objectName": "missing",
+        "representation": str(ObjectId()),
+        "loader": "FakeLoader",
+    })
+
+    result = utils.update_containers(
+        containers, version=-1, project_name="test_project"
+    )
+
+    assert len(result.updated) == count
+    assert [item[0]["objectName"] for item in result.failed] == ["missing"]
+    # Representations of last versions were used
+    assert {repre_id for _, repre_id in FakeLoader.updated} == {
+        repre_doc["_id"] for repre_doc in representations[1::2]
+    }
+    # Number of queries does not depend on number of containers
+    assert calls == {
+        "get_representations": 2,
+        "get_versions": 1,
+        "get_last_versions": 1,
+    }
+
+
+def test_update_containers_missing_path(tmpdir, monkeypatch):
+    versions, representations = _prepare_database(tmpdir, 1)
+    _patch_queries(monkeypatch, versions, representations)
+    FakeLoader.updated = []
+    repre_doc = representations[1]
+    tmpdir.join(
+        "{}_v2.abc".format(versions[1]["parent"])
+    ).remove()
+
+    container = {
+        "objectName": "container",
+        "representation": str(representations[0]["_id"]),
+        "loader": "FakeLoader",
+    }
+    result = utils.update_containers(
+        [container], version=[2], project_name="test_project"
+    )
+
+    assert not result.updated
+    assert not FakeLoader.updated
+    (failed_container, version, exc), = result.failed
+    assert failed_container is container
+    assert version == 2
+    assert isinstance(exc, AssertionError)
+    assert repre_doc["context"]["path"] in str(exc)
+
+
+def test_update_containers_prefetch_parents(tmpdir, monkeypatch):
+    mongomock = pytest.importorskip("mongomock")
+    count = 5
+    versions, representations = _prepare_database(tmpdir, count)
+    _patch_queries(monkeypatch, versions, representations)
+    subset_docs = [
+        {"_id": subset_id, "type": "subset", "name": "model"}
+        for subset_id in {version_doc["parent"] for version_doc in versions}
+    ]
+    collection = mongomock.MongoClient().db["test_project"]
+    collection.insert_many(versions + representations + subset_docs)
+    for module in (entities, entities_cache):
+        monkeypatch.setattr(
+            module,
+            "get_project_connection",
+            lambda project_name, database_name=None: collection
+        )
+
+    queries_counts = []
+
+    class ParentsLoader:
+        def update(self, container, representation):
+            version_doc = entities.get_version_by_id(
+                "test_project", representation["parent"]
+            )
+            entities.get_subset_by_id("test_project", version_doc["parent"])
+            cache = entities_cache.get_active_entities_cache()
+            queries_counts.append(cache.queries_count)
+
+    monkeypatch.setattr(
+        utils,
+        "_get_containers_loaders",
+        lambda containers: {"ParentsLoader": ParentsLoader}
+    )
+    containers = [
+        {
+            "objectName": "container_{}".format(idx),
+            "representation": str(repre_doc["_id"]),
+            "loader": "ParentsLoader",
+        }
+        for idx, repre_doc in enumerate(representations[::2])
+    ]
+
+    result = utils.update_containers(
+        containers, version=-1, project_name="test_project"
+    )
+
+    assert len(result.updated) == count
+    # Parents of all containers were queried at once
+    assert queries_counts == [1] * count
@@ -0,0 +1,78 @@
+"""Test publish plugins discovery."""
+import os
+
+from openpype.pipeline.publish import lib
+
+PLUGIN_CONTENT = """import pyblish.api
+
+
+class {name}(pyblish.api.ContextPlugin):
+    order = pyblish.api.CollectorOrder
+    value = {value}
+    items = [{{"name": "default"}}]
+
+    def process(self, context):
+        pass
+"""
+
+
+def _write_plugin(dirpath, filename, name, value=1):
+    path = os.path.join(dirpath, filename)
+    with open(path, "w") as stream:
+        stream.write(PLUGIN_CONTENT.format(name=name, value=value))
+    return path
+
+
+def _discover(paths):
+    result = lib.publish_plugins_discover(paths)
+    return {plugin.__name__: plugin for plugin in result.plugins}, result
+
+
+def test_publish_plugins_discover_cache(tmpdir):
+    lib.clear_publish_plugins_discover_cache()
+    plugins_dir = str(tmpdir.mkdir("plugins"))
+    _write_plugin(plugins_dir, "collect_a.py", "CollectCacheA")
+    path_b = _write_plugin(plugins_dir, "collect_b.py", "CollectCacheB")
+
+    plugins, result = _discover([plugins_dir])
+    assert set(plugins) == {"CollectCacheA", "CollectCacheB"}
+    assert len(result.import_times) == 2
+
+    # Settings may change class attributes
+    plugins["CollectCacheA"].value = 10
+    plugins["CollectCacheA"].optional = True
+    plugins["CollectCacheA"].items.append({"name": "settings"})
+    plugins["CollectCacheA"].items[0]["name"] = "changed"
+
+    # Change size of file so it's detected as changed
+    _write_plugin(plugins_dir, "collect_b.py", "CollectCacheB", 22)
+    new_plugins, result = _discover([plugins_dir])
+    assert list(result.import_times) == [path_b]
+    assert new_plugins["CollectCacheA"] is plugins["CollectCacheA"]
+    assert new_plugins["CollectCacheA"].value == 1
+    assert "optional" not in vars(new_plugins["CollectCacheA"])
+    assert new_plugins["CollectCacheA"].items == [{"name": "default"}]
+    assert new_plugins["CollectCacheB"] is not plugins["CollectCacheB"]
+    assert new_plugins["CollectCacheB"].value == 22
+
+    # Attributes are restored on each discovery
+    new_plugins["CollectCacheA"].items.extend([{"name": "settings"}] * 2)
+    new_plugins, _ = _discover([plugins_dir])
+    assert new_plugins["CollectCacheA"].items == [{"name": "default"}]
+
+    result = lib.publish_plugins_discover([plugins_dir], use_cache=False)
+    assert len(result.import_times) == 2
+
+
+def test_publish_plugins_discover_duplicates(tmpdir):
+    lib.clear_publish_plugins_discover_cache()
+    first_dir = str(tmpdir.mkdir("first"))
+    second_dir = str(tmpdir.mkdir("second"))
+    _write_plugin(first_dir, "collect.py", "CollectDuplicated")
+    _write_plugin(second_dir, "collect.py", "CollectDuplicated", 2)
+
+    plugins, result = _discover([first_dir, second_dir])
+    assert plugins["CollectDuplicated"].value == 1
+    assert [
+        plugin.value for plugin in result.duplicated_plugins
+    ] == [2]
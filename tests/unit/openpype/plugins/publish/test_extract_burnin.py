@@ -0,0 +1,51 @@
+import sys
+import types
+
+import openpype.scripts
+from openpype.plugins.publish.extract_burnin import ExtractBurnin
+
+
+def _fake_burnin_module(monkeypatch):
+    module = types.ModuleType("otio_burnin")
+    module.rendered = []
+    module.burnins_from_script_data = module.rendered.append
+    monkeypatch.setattr(openpype.scripts, "otio_burnin", module, raising=False)
+    monkeypatch.setitem(sys.modules, "openpype.scripts.otio_burnin", module)
+    return module
+
+
+def test_in_process_burnin_module(monkeypatch):
+    module = _fake_burnin_module(monkeypatch)
+    monkeypatch.setattr(
+        "openpype.plugins.publish.extract_burnin.get_openpype_execute_args",
+        lambda: [sys.executable]
+    )
+    plugin = ExtractBurnin()
+    assert plugin._get_in_process_burnin_module() is module
+
+    plugin.burnin_in_process = False
+    assert plugin._get_in_process_burnin_module() is None
+
+
+def test_in_process_burnin_module_other_executable(monkeypatch):
+    _fake_burnin_module(monkeypatch)
+    monkeypatch.setattr(
+        "openpype.plugins.publish.extract_burnin.get_openpype_execute_args",
+        lambda: ["/path/to/openpype_console"]
+    )
+    assert ExtractBurnin()._get_in_process_burnin_module() is None
+
+
+def test_render_burnin_in_process(monkeypatch):
+    module = _fake_burnin_module(monkeypatch)
+    script_data = {
+        "input": "input.mp4",
+        "output": "output.mp4",
+        "burnin_data": {"frame_start": 1001},
+    }
+    ExtractBurnin()._render_burnin(script_data, module)
+
+    assert module.rendered == [script_data]
+    # Script modifies data so copy must be passed
+    assert module.rendered[0] is not script_data
+    assert module.rendered[0]["burnin_data"] is not script_data["burnin_data"]
@@ -1,3 +1,6 @@
+import os
+
+from openpype.plugins.publish import extract_review
 from openpype.plugins.publish.extract_review import ExtractReview
 
 
@@ -27,3 +30,197 @@ def test_fix_ffmpeg_full_args_filters():
     assert ret[-1] == output_arg
     assert ret[-2] == '"adeclick,adeclick"'  # TODO fix this duplication
     assert ret[-3] == "-filter:a"
+
+
+def _output_item(input_args, video_filters, audio_filters, output_path):
+    return {
+        "ffmpeg_parts": (
+            list(input_args),
+            list(video_filters),
+            list(audio_filters),
+            ["-y", output_path]
+        ),
+        "temp_data": {"output_ext_is_image": output_path.endswith(".png")},
+    }
+
+
+def test_group_output_items():
+    plugin = ExtractReview()
+    input_args = ["-start_number", "1001", "-i", "render.%04d.exr"]
+    items = [
+        _output_item(input_args, ["scale=1920:1080"], [], "h264.mp4"),
+        _output_item(input_args, [], ["adeclick"], "audio.mp4"),
+        _output_item(input_args, ["scale=960:540"], [], "prores.mov"),
+        _output_item(["-i", "other.exr"], [], [], "other.mp4"),
+        _output_item(
+            input_args, ["split=2[bg][fg]", "[bg][fg]overlay"], [], "bg.mp4"
+        ),
+    ]
+    # Outputs with audio input are not grouped, audio would not be mapped
+    audio_input_args = input_args + ["-to 2.0", "-vn", "-i \"audio.wav\""]
+    items.extend(
+        _output_item(audio_input_args, [], [], "audio_{}.mp4".format(idx))
+        for idx in range(2)
+    )
+
+    groups = plugin._group_output_items(items)
+    assert [len(group) for group in groups] == [1] * len(items)
+
+    plugin.single_pass_outputs = True
+    groups = plugin._group_output_items(items)
+    assert groups == [
+        [items[0], items[2]],
+        [items[1]],
+        [items[3]],
+        [items[4]],
+        [items[5]],
+        [items[6]],
+    ]
+
+
+def test_ffmpeg_multi_output_args(monkeypatch):
+    monkeypatch.setattr(
+        extract_review, "get_ffmpeg_tool_args", lambda tool: [tool]
+    )
+    plugin = ExtractReview()
+    input_args = ["-i", "input.mov"]
+    items = [
+        _output_item(input_args, ["scale=1920:1080"], [], "h264.mp4"),
+        _output_item(input_args, [], [], "thumb.png"),
+    ]
+    args = plugin.ffmpeg_multi_output_args(
+        [item["ffmpeg_parts"] for item in items], [True, False]
+    )
+    assert args == [
+        "ffmpeg", "-i", "input.mov",
+        "-filter_complex",
+        "\"[0:v]split=2[s0][s1];[s0]scale=1920:1080[v0];[s1]null[v1]\"",
+        "-map", "\"[v0]\"", "-map", "0:a?", "-y", "h264.mp4",
+        "-map", "\"[v1]\"", "-y", "thumb.png",
+    ]
+
+
+def test_fill_sequence_gaps(tmpdir):
+    staging_dir = str(tmpdir)
+    files = []
+    for frame in (1001, 1004):
+        filename = "render.{}.exr".format(frame)
+        with open(os.path.join(staging_dir, filename), "w") as stream:
+            stream.write(str(frame))
+        files.append(filename)
+
+    added_files = ExtractReview().fill_sequence_gaps(
+        files, staging_dir, 1001, 1005
+    )
+
+    expected = {
+        1002: 1001,
+        1003: 1001,
+        1005: 1004,
+    }
+    assert sorted(added_files) == [
+        os.path.join(staging_dir, "render.{}.exr".format(frame))
+        for frame in sorted(expected)
+    ]
+    for frame, src_frame in expected.items():
+        path = os.path.join(staging_dir, "render.{}.exr".format(frame))
+        with open(path, "r") as stream:
+            assert stream.read() == str(src_frame)
+
+
+def test_fill_sequence_gaps_repeated(tmpdir):
+    """Gaps are filled again for next output definition."""
+    staging_dir = str(tmpdir)
+    files = []
+    for frame in (1001, 1003):
+        filename = "render.{}.exr".format(frame)
+        with open(os.path.join(staging_dir, filename), "w") as stream:
+            stream.write(str(frame))
+        files.append(filename)
+
+    plugin = ExtractReview()
+    for _ in range(2):
+        added_files = plugin.fill_sequence_gaps(
+            files, staging_dir, 1001, 1003
+        )
+        assert added_files == [os.path.join(staging_dir, "render.1002.exr")]
+        with open(added_files[0], "r") as stream:
+            assert stream.read() == "1001"
+
+
+class FakeInstance:
+    def __init__(self):
+        self.data = {"anatomyData": {}, "representations": []}
+
+
+def test_render_output_definitions_gapped_sequence(tmpdir, monkeypatch):
+    staging_dir = str(tmpdir)
+    files = []
+    for frame in (1001, 1004):
+        filename = "render.{}.exr".format(frame)
+        with open(os.path.join(staging_dir, filename), "w") as stream:
+            stream.write(str(frame))
+        files.append(filename)
+    repre = {
+        "name": "exr",
+        "ext": "exr",
+        "files": files,
+        "stagingDir": staging_dir,
+        "tags": [],
+    }
+
+    commands = []
+
+    def run_subprocess(cmd, **kwargs):
+        # All frames are available while outputs are rendered
+        commands.append(sorted(os.listdir(staging_dir)))
+
+    def prepare_temp_data(instance, repre, output_def):
+        return {
+            "input_is_sequence": True,
+            "origin_repre": repre,
+            "frame_start": 1001,
+            "frame_end": 1005,
+            "without_handles": False,
+            "output_ext_is_image": False,
+        }
+
+    def ffmpeg_argument_parts(output_def, *args):
+        output_path = output_def["filename_suffix"] + ".mp4"
+        return ["-i", "render.%04d.exr"], [], [], ["-y", output_path]
+
+    added_outputs = []
+    plugin = ExtractReview()
+    monkeypatch.setattr(extract_review, "run_subprocess", run_subprocess)
+    monkeypatch.setattr(
+        extract_review, "get_ffmpeg_tool_args", lambda tool: [tool]
+    )
+    monkeypatch.setattr(plugin, "prepare_temp_data", prepare_temp_data)
+    monkeypatch.setattr(
+        plugin, "_ffmpeg_argument_parts", ffmpeg_argument_parts
+    )
+    monkeypatch.setattr(
+        plugin,
+        "_add_output_representation",
+        lambda instance, item, cmd: added_outputs.append(item["output_name"])
+    )
+
+    output_defs = [
+        {"filename_suffix": "h264"},
+        {"filename_suffix": "prores"},
+    ]
+    for single_pass_outputs in (False, True):
+        commands[:] = []
+        added_outputs[:] = []
+        plugin.single_pass_outputs = single_pass_outputs
+        plugin._render_output_definitions(
+            FakeInstance(), repre, staging_dir, output_defs, None
+        )
+
+        assert added_outputs == ["h264", "prores"]
+        expected_files = [
+            "render.{}.exr".format(frame) for frame in range(1001, 1006)
+        ]
+        assert all(listed == expected_files for listed in commands)
+        # Filled files are removed
+        assert sorted(os.listdir(staging_dir)) == sorted(files)
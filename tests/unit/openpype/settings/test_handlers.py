@@ -0,0 +1,163 @@
+"""Test file for caching of settings in Mongo settings handler.
+
+Uses 'mongomock' as local Mongo stand-in, test is skipped if not available.
+"""
+import copy
+import datetime
+
+import pytest
+
+from openpype.settings import lib
+from openpype.settings import handlers
+from openpype.settings.constants import PROJECT_SETTINGS_KEY
+
+mongomock = pytest.importorskip("mongomock")
+
+DEFAULTS = {
+    PROJECT_SETTINGS_KEY: {
+        "maya": {"publish": {"enabled": True, "families": ["model"]}},
+    }
+}
+
+
+class QueryCountingCollection:
+    """Counts queries of wrapped collection."""
+
+    def __init__(self, collection):
+        self._collection = collection
+        self.queries = []
+
+    def find_one(self, *args, **kwargs):
+        self.queries.append(("find_one", args, kwargs))
+        return self._collection.find_one(*args, **kwargs)
+
+    def find(self, *args, **kwargs):
+        self.queries.append(("find", args, kwargs))
+        return self._collection.find(*args, **kwargs)
+
+    def __getattr__(self, attr_name):
+        return getattr(self._collection, attr_name)
+
+
+class LocalSettingsHandler:
+    def get_local_settings(self):
+        return {}
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    client = mongomock.MongoClient()
+    monkeypatch.setenv("OPENPYPE_DATABASE_NAME", "openpype_tests")
+    monkeypatch.setattr(
+        handlers.OpenPypeMongoConnection,
+        "get_mongo_client",
+        classmethod(lambda cls: client)
+    )
+    settings_handler = handlers.MongoSettingsHandler(cache_lifetime=60)
+    settings_handler.collection = QueryCountingCollection(
+        settings_handler.collection
+    )
+    # Skip lookup of closest versions
+    monkeypatch.setattr(
+        settings_handler, "_find_closest_settings", lambda *args: None
+    )
+
+    monkeypatch.setattr(lib, "_DEFAULT_SETTINGS", copy.deepcopy(DEFAULTS))
+    monkeypatch.setattr(lib, "_SETTINGS_HANDLER", settings_handler)
+    monkeypatch.setattr(
+        lib, "_LOCAL_SETTINGS_HANDLER", LocalSettingsHandler()
+    )
+    monkeypatch.setattr(lib, "AYON_SERVER_ENABLED", False)
+    lib.clear_project_settings_cache()
+    yield settings_handler
+    lib.clear_project_settings_cache()
+
+
+def _insert_project_overrides(settings_handler, enabled):
+    collection = settings_handler.collection
+    collection.delete_many({"project_name": "project"})
+    collection.insert_one({
+        "type": settings_handler._project_settings_key,
+        "version": settings_handler._current_version,
+        "project_name": "project",
+        "is_default": False,
+        "data": {"maya": {"publish": {"enabled": enabled}}},
+        "last_saved_info": handlers.SettingsStateInfo(
+            settings_handler._current_version,
+            PROJECT_SETTINGS_KEY,
+            "project",
+            datetime.datetime.now().strftime(
+                handlers.SettingsStateInfo.timestamp_format
+            ),
+            "hostname",
+            "127.0.0.1",
+            "user",
+            "Linux",
+            "local_id"
+        ).to_document_data()
+    })
+
+
+def _expire_caches(settings_handler):
+    for cache in settings_handler.project_settings_cache.values():
+        cache.set_outdated()
+
+
+def test_cache_values_outdated():
+    cache = handlers.CacheValues(lifetime=60)
+    assert cache.is_outdated
+    cache.update_data({"key": "value"}, None)
+    assert not cache.is_outdated
+
+    cache.set_outdated()
+    assert cache.is_outdated
+
+    # Age in days is not ignored
+    cache.creation_time = (
+        datetime.datetime.now() - datetime.timedelta(days=1, seconds=1)
+    )
+    assert cache.is_outdated
+
+
+def test_document_fingerprint():
+    assert handlers.get_document_fingerprint(None) == (None, None)
+    assert handlers.get_document_fingerprint({"_id": 1}) is None
+    assert handlers.get_document_fingerprint({
+        "_id": 1, "last_saved_info": {"timestamp": "2023-01-01"}
+    }) == (1, "2023-01-01")
+
+
+def test_queries_per_call(handler):
+    _insert_project_overrides(handler, False)
+
+    settings = lib.get_project_settings("project")
+    assert settings["maya"]["publish"]["enabled"] is False
+    assert handler.collection.queries
+
+    # Cached values are used within lifetime
+    handler.collection.queries = []
+    for _ in range(5):
+        lib.get_project_settings("project")
+    assert handler.collection.queries == []
+
+
+def test_revalidation_probe(handler):
+    _insert_project_overrides(handler, False)
+    lib.get_project_settings("project")
+
+    # Outdated cache is validated with one probe query per document
+    _expire_caches(handler)
+    handler.collection.queries = []
+    lib.get_project_settings("project")
+    queries = handler.collection.queries
+    assert len(queries) == 2
+    for _, args, _ in queries:
+        assert "data" not in args[1]
+
+    # Changed document is queried again
+    _insert_project_overrides(handler, True)
+    _expire_caches(handler)
+    handler.collection.queries = []
+    settings = lib.get_project_settings("project")
+    assert settings["maya"]["publish"]["enabled"] is True
+    assert len(handler.collection.queries) == 3
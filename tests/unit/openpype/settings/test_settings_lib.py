@@ -0,0 +1,123 @@
+"""Test file for merging and caching of project settings."""
+import copy
+
+import pytest
+
+from openpype.settings import lib
+from openpype.settings.constants import (
+    M_OVERRIDDEN_KEY,
+    PROJECT_SETTINGS_KEY,
+    PROJECTS_SETTINGS_KEY,
+)
+
+DEFAULTS = {
+    PROJECT_SETTINGS_KEY: {
+        "global": {
+            "sync_server": {
+                "config": {"active_site": "studio", "remote_site": "studio"}
+            },
+            "publish": {"ExtractReview": {"enabled": True, "outputs": {}}},
+        },
+        "maya": {"publish": {"enabled": True, "families": ["model"]}},
+    }
+}
+
+
+class FakeSettingsHandler:
+    def __init__(self):
+        self.studio_overrides = {}
+        self.project_overrides = {}
+        self.revision = 0
+        self.overrides_queries = 0
+
+    def get_project_settings_revision(self, project_name):
+        return self.revision
+
+    def get_studio_project_settings_overrides(self, return_version):
+        self.overrides_queries += 1
+        return copy.deepcopy(self.studio_overrides)
+
+    def get_project_settings_overrides(self, project_name, return_version):
+        self.overrides_queries += 1
+        return copy.deepcopy(self.project_overrides)
+
+
+class FakeLocalSettingsHandler:
+    def __init__(self):
+        self.local_settings = {}
+
+    def get_local_settings(self):
+        return copy.deepcopy(self.local_settings)
+
+
+@pytest.fixture
+def handlers(monkeypatch):
+    handler = FakeSettingsHandler()
+    local_handler = FakeLocalSettingsHandler()
+    monkeypatch.setattr(lib, "_DEFAULT_SETTINGS", copy.deepcopy(DEFAULTS))
+    monkeypatch.setattr(lib, "_SETTINGS_HANDLER", handler)
+    monkeypatch.setattr(lib, "_LOCAL_SETTINGS_HANDLER", local_handler)
+    monkeypatch.setattr(lib, "AYON_SERVER_ENABLED", False)
+    lib.clear_project_settings_cache()
+    yield handler, local_handler
+    lib.clear_project_settings_cache()
+
+
+def test_copy_settings_data():
+    data = {"a": [1, {"b": "c"}], "d": None, "e": 1.5}
+    output = lib.copy_settings_data(data)
+    assert output == data
+    assert output["a"] is not data["a"]
+    assert output["a"][1] is not data["a"][1]
+
+
+def test_project_settings_merge(handlers):
+    handler, _ = handlers
+    handler.studio_overrides = {
+        "maya": {
+            M_OVERRIDDEN_KEY: ["publish"],
+            "publish": {"families": ["rig"]},
+        }
+    }
+    handler.project_overrides = {
+        "global": {"publish": {"ExtractReview": {"enabled": False}}}
+    }
+    settings = lib.get_project_settings("project")
+
+    assert settings["maya"]["publish"] == {"families": ["rig"]}
+    assert settings["global"]["publish"]["ExtractReview"] == {
+        "enabled": False, "outputs": {}
+    }
+    # Defaults are not modified
+    assert lib._DEFAULT_SETTINGS == DEFAULTS
+
+
+def test_project_settings_cached_by_revision(handlers):
+    handler, local_handler = handlers
+    handler.project_overrides = {"maya": {"publish": {"enabled": False}}}
+
+    settings = lib.get_project_settings("project")
+    queries = handler.overrides_queries
+    # Modification of returned value does not affect cache
+    settings["maya"]["publish"]["families"].append("look")
+
+    settings = lib.get_project_settings("project")
+    assert handler.overrides_queries == queries
+    assert settings["maya"]["publish"] == {
+        "enabled": False, "families": ["model"]
+    }
+
+    # Change of overrides revision
+    handler.project_overrides = {"maya": {"publish": {"enabled": True}}}
+    handler.revision += 1
+    settings = lib.get_project_settings("project")
+    assert handler.overrides_queries > queries
+    assert settings["maya"]["publish"]["enabled"] is True
+
+    # Change of local settings
+    local_handler.local_settings = {
+        PROJECTS_SETTINGS_KEY: {"project": {"active_site": "local"}}
+    }
+    settings = lib.get_project_settings("project")
+    config = settings["global"]["sync_server"]["config"]
+    assert config["active_site"] == "local"